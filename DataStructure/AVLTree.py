@@ -1,4 +1,5 @@
 from DataStructure.BinarySearchTree import BinarySearchTree
+from DataStructure.Node.Node import Node
 from DataStructure.Node.AVLNode import AVLNode
 
 class AVLTree(BinarySearchTree):
@@ -7,14 +8,58 @@ class AVLTree(BinarySearchTree):
 
         It maintains the AVL property: for every node, the difference in height
         between its left and right subtrees is at most 1.
+        Duplicates are ignored, unless the tree is a multiset: then each node keeps the count of its
+        value and sizes are weighted by count. With a key function, a duplicate key keeps the payload
+        of its first item.
 
         Attributes:
             __root (AVLNode): The root of the AVL tree.
+            __node_class (type): The AVLNode variant instantiated, with a count and / or payload slot only when the mode needs it.
     """
 
-    def __init__(self, value: int | None = None):
-        super().__init__(value)
-        self.__root = AVLNode(value) if value is not None else None
+    def __init__(self, value = None, multiset: bool = False, key = None):
+        self.__node_class = AVLNode.variant(counted=multiset, keyed=key is not None)
+        super().__init__(value, size_cache=False, multiset=multiset, key=key)
+        self.__root = self._new_node(self._key_of(value), value) if value is not None else None
+
+    @classmethod
+    def from_sorted(cls, values, **kwargs) -> "AVLTree":
+        """
+            Build a perfectly balanced AVL tree from values already in ascending order in O(n).
+
+            Heights, sizes and parent links are set while building, so OSSelect and OSRank work
+            immediately. Duplicates are dropped, as `insert` does, or counted in multiset mode.
+
+            Parameters:
+                values (Iterable): The values (or items, with a key function) to store, in ascending key order.
+                kwargs: Extra constructor arguments (e.g. multiset, key).
+
+            Returns:
+                AVLTree: The new tree.
+        """
+        tree = cls(**kwargs)
+        key = tree.getKey()
+        items = list(values)
+        keys, counts = cls._collapse(items if key is None else [key(item) for item in items])
+        if key is not None:
+            items = cls._first_of_runs(items, counts)
+
+        def build(lo: int, hi: int) -> AVLNode | None:
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            node = tree.__node_class(keys[mid])
+            if key is not None:
+                node.setPayload(items[mid])
+            if tree.isMultiset():
+                node.setCount(counts[mid])
+            node.setLeft(build(lo, mid - 1))
+            node.setRight(build(mid + 1, hi))
+            tree._update(node)
+            return node
+
+        tree.__root = build(0, len(keys) - 1)
+        return tree
 
     def getRoot(self) -> AVLNode:
         return self.__root
@@ -41,7 +86,14 @@ class AVLTree(BinarySearchTree):
 
 
 
-    def insert(self, key: int, node: AVLNode | None = None) -> AVLNode:
+    def _new_node(self, key, item) -> AVLNode:
+        node = self.__node_class(key)
+        if self.getKey() is not None:
+            node.setPayload(item)
+        return node
+
+
+    def insert(self, key, node: AVLNode | None = None) -> AVLNode:
         """
             Insert a key into the AVL tree.
 
@@ -49,7 +101,7 @@ class AVLTree(BinarySearchTree):
             Updates the root reference if necessary.
 
             Parameters:
-                key (int): The value to insert into the tree.
+                key: The value to insert into the tree (an item, when the tree has a key function).
                 node (AVLNode, optional): The starting node for insertion. Defaults to None.
 
             Returns:
@@ -62,50 +114,191 @@ class AVLTree(BinarySearchTree):
         return node
 
 
-    def _insert(self, node: AVLNode | None, key: int) -> AVLNode:
+    def _insert(self, node: AVLNode | None, item) -> AVLNode:
         """
-            Recursively insert a key into the AVL tree and rebalance the tree if needed.
+            Insert a key into the AVL tree and rebalance the tree if needed.
 
-            This method updates the height and size of nodes and performs the necessary
-            rotations to maintain AVL balance.
+            The insertion point is found iteratively; heights and sizes are then fixed by
+            retracing the parent pointers back up to `node`, rotating where needed.
 
             Parameters:
                 node (AVLNode | None): The root of the current subtree.
-                key (int): The value to insert.
+                item: The value to insert.
 
             Returns:
                 AVLNode: The updated node after insertion and rebalancing.
         """
+        key = self._key_of(item)
+        if node is None:
+            return self._new_node(key, item)
+
+        current = node
+        while True:
+            if key < current.getValue():
+                if current.getLeft() is None:
+                    current.setLeft(self._new_node(key, item))
+                    break
+                current = current.getLeft()
+            elif key > current.getValue():
+                if current.getRight() is None:
+                    current.setRight(self._new_node(key, item))
+                    break
+                current = current.getRight()
+            elif self.isMultiset():
+                current.setCount(current.getCount() + 1)
+                break
+            else:
+                return node
+
+        return self._retrace(current, node.getParent())
+
+
+    def _retrace(self, node: AVLNode, stop: AVLNode | None) -> AVLNode:
+        """
+            Walk up from `node` through parent pointers, updating and rebalancing every ancestor.
+
+            Parameters:
+                node (AVLNode): The lowest node whose children changed.
+                stop (AVLNode | None): The parent of the subtree being retraced (None for the whole tree).
+
+            Returns:
+                AVLNode: The new root of the retraced subtree.
+        """
+        while True:
+            parent = node.getParent()
+            is_left = parent is not None and parent.getLeft() is node
+            node = self._rebalance(node)
+
+            if parent is stop:
+                return node
+
+            if is_left:
+                parent.setLeft(node)
+            else:
+                parent.setRight(node)
+            node = parent
+
+
+    def delete(self, key: int, node: AVLNode | None = None) -> bool:
+        """
+            Delete a key from the AVL tree.
+
+            If no node is provided, deletion begins at the tree's root.
+            Updates the root reference if necessary. Deleting a missing key leaves the tree unchanged.
+
+            Parameters:
+                key (int): The value to remove from the tree.
+                node (AVLNode, optional): The starting node for deletion. Defaults to None.
+
+            Returns:
+                bool: True if an occurrence of the key was removed, False if it was not stored.
+        """
+        if node is None:
+            node = self.__root
+        size = self.size(node)
+        node = self._delete(node, key)
+        if node is not None:
+            node.setParent(None)
+        self.__root = node
+        return self.size(node) < size
+
+
+    def _delete(self, node: AVLNode | None, key: int) -> AVLNode | None:
+        """
+            Recursively delete a key from the AVL tree and rebalance the tree if needed.
+
+            A node with two children is replaced by its in-order successor node (not by a copy of its value),
+            so node references held by callers stay valid for the keys that remain in the tree.
+            In multiset mode a node with a count above one only loses one occurrence.
+
+            Parameters:
+                node (AVLNode | None): The root of the current subtree.
+                key (int): The value to delete.
+
+            Returns:
+                AVLNode | None: The updated node after deletion and rebalancing.
+        """
         if node is None:
-            return AVLNode(key)
+            return None
 
         if key < node.getValue():
-            node.setLeft(self._insert(node.getLeft(), key))
-            node.getLeft().setParent(node)
+            node.setLeft(self._delete(node.getLeft(), key))
         elif key > node.getValue():
-            node.setRight(self._insert(node.getRight(), key))
-            node.getRight().setParent(node)
+            node.setRight(self._delete(node.getRight(), key))
+        elif node.getCount() > 1:
+            node.setCount(node.getCount() - 1)
         else:
-            return node
+            left, right = node.getLeft(), node.getRight()
+            node.setLeft(None)
+            node.setRight(None)
+            node.setParent(None)
+
+            if left is None or right is None:
+                return left if left is not None else right
+
+            right, successor = self._delete_min(right)
+            successor.setLeft(left)
+            successor.setRight(right)
+            node = successor
+
+        return self._rebalance(node)
 
+
+    def _delete_min(self, node: AVLNode) -> tuple[AVLNode | None, AVLNode]:
+        """
+            Detach the node with the minimum key from the given subtree, rebalancing on the way back up.
+
+            Parameters:
+                node (AVLNode): The root of the subtree.
+
+            Returns:
+                tuple[AVLNode | None, AVLNode]: The new root of the subtree and the detached minimum node.
+        """
+        if node.getLeft() is None:
+            right = node.getRight()
+            node.setRight(None)
+            return right, node
+
+        left, minimum = self._delete_min(node.getLeft())
+        node.setLeft(left)
+        return self._rebalance(node), minimum
+
+
+    def _update(self, node: AVLNode) -> None:
+        """
+            Recompute height and size of a node from its children.
+
+            Parameters:
+                node (AVLNode): The node to update.
+        """
         node.setHeight(1 + max(self.height(node.getLeft()), self.height(node.getRight())))
-        node.setSize(1 + self.size(node.getLeft()) + self.size(node.getRight()))
+        node.setSize(node.getCount() + self.size(node.getLeft()) + self.size(node.getRight()))
+
+
+    def _rebalance(self, node: AVLNode) -> AVLNode:
+        """
+            Update a node and restore the AVL property using the balance factors of its children.
+
+            Works after any structural change (insertion or deletion).
 
+            Parameters:
+                node (AVLNode): The root of the subtree to rebalance.
+
+            Returns:
+                AVLNode: The new root of the subtree.
+        """
+        self._update(node)
         balance = self.balance(node)
 
         if balance > 1:
-            if key < node.getLeft().getValue():
-                return self._right_rotate(node)
-            else:
+            if self.balance(node.getLeft()) < 0:
                 node.setLeft(self._left_rotate(node.getLeft()))
-                return self._right_rotate(node)
+            return self._right_rotate(node)
 
         if balance < -1:
-            if key > node.getRight().getValue():
-                return self._left_rotate(node)
-            else:
+            if self.balance(node.getRight()) > 0:
                 node.setRight(self._right_rotate(node.getRight()))
-                return self._left_rotate(node)
+            return self._left_rotate(node)
 
         return node
 
@@ -121,12 +314,13 @@ class AVLTree(BinarySearchTree):
         """
         y = x.getRight()
         T2 = y.getLeft()
+        parent = x.getParent()
 
         # Perform rotation
         y.setLeft(x)
         x.setRight(T2)
 
-        y.setParent(x.getParent())
+        y.setParent(parent)
         x.setParent(y)
         if T2:
             T2.setParent(x)
@@ -136,8 +330,8 @@ class AVLTree(BinarySearchTree):
         y.setHeight( 1 + max(self.height(y.getLeft()), self.height(y.getRight())) )
 
         # Update Sizes
-        x.setSize( 1 + self.size(x.getLeft()) + self.size(x.getRight()) )
-        y.setSize( 1 + self.size(y.getLeft()) + self.size(y.getRight()) )
+        x.setSize( x.getCount() + self.size(x.getLeft()) + self.size(x.getRight()) )
+        y.setSize( y.getCount() + self.size(y.getLeft()) + self.size(y.getRight()) )
 
         # Return new root
         return y
@@ -155,12 +349,13 @@ class AVLTree(BinarySearchTree):
         """
         x = y.getLeft()
         T2 = x.getRight()
+        parent = y.getParent()
 
         # Perform rotation
         x.setRight(y)
         y.setLeft(T2)
 
-        x.setParent(y.getParent())
+        x.setParent(parent)
         y.setParent(x)
         if T2:
             T2.setParent(y)
@@ -170,8 +365,8 @@ class AVLTree(BinarySearchTree):
         x.setHeight( 1 + max(self.height(x.getLeft()), self.height(x.getRight())) )
 
         # Update sizes
-        y.setSize( 1 + self.size(y.getLeft()) + self.size(y.getRight()) )
-        x.setSize( 1 + self.size(x.getLeft()) + self.size(x.getRight()) )
+        y.setSize( y.getCount() + self.size(y.getLeft()) + self.size(y.getRight()) )
+        x.setSize( x.getCount() + self.size(x.getLeft()) + self.size(x.getRight()) )
 
         return x
 
@@ -212,18 +407,27 @@ class AVLTree(BinarySearchTree):
             Returns:
                 TreeNode | None: The corresponding node or None if out of bounds.
         """
-        if node is None:
-            return None
+        while node is not None:
+            left_size = self.size(node.getLeft())
 
-        left_size = self.size(node.getLeft())
-        rank = left_size + 1
+            if left_size < i <= left_size + node.getCount():
+                return node
+            elif i <= left_size:
+                node = node.getLeft()
+            else:
+                i -= left_size + node.getCount()
+                node = node.getRight()
+        return None
 
-        if i == rank:
-            return node
-        elif i < rank:
-            return self.OSSelect(node.getLeft(), i)
-        else:
-            return self.OSSelect(node.getRight(), i - rank)
+
+    def _subtree_size(self, node: AVLNode | None) -> int:
+        """
+            Return the size of the subtree rooted at `node` from the size attribute, in O(1).
+
+            Overrides the counting version of BinarySearchTree, so inherited algorithms
+            (e.g. OSSelect_many) use the augmented sizes.
+        """
+        return self.size(node)
 
 
     def OSRank(self, x: AVLNode) -> int:
@@ -234,22 +438,69 @@ class AVLTree(BinarySearchTree):
                 x (AVLNode): The node whose rank we want to find.
 
             Returns:
-                int: The rank of the node.
+                int: The rank of the node (of its first occurrence in multiset mode).
         """
         rank = self.size(x.getLeft()) + 1
         node = x
 
-        while node != self.__root:
+        while node is not self.__root:
             parent = node.getParent()
-            if node == parent.getRight():
-                rank += self.size(parent.getLeft()) + 1
+            if node is parent.getRight():
+                rank += self.size(parent.getLeft()) + parent.getCount()
             node = parent
 
         return rank
 
+
+    def OSRank_many(self, items: list) -> list[int | None]:
+        """
+            Return the ranks of many nodes or keys, sharing the work on common ancestors.
+
+            The rank of x is `offset(x) + size(x.left) + 1`, where offset(x) counts the nodes preceding
+            the subtree of x. Offsets are memoized per node for the whole batch, so every ancestor is
+            resolved once and ranking all nodes costs O(n) in total.
+
+            Parameters:
+                items (list[AVLNode | int]): Nodes of this tree and/or keys, in any order.
+
+            Returns:
+                list[int | None]: The ranks in the order of `items` (None for keys not in the tree).
+        """
+        offsets = {}
+        results = []
+
+        for item in items:
+            node = item if isinstance(item, Node) else self.find(item)
+            if node is None:
+                results.append(None)
+                continue
+
+            # Climb until an ancestor with a known offset (or the root), then resolve downwards
+            path = []
+            current = node
+            while id(current) not in offsets:
+                parent = current.getParent()
+                if parent is None:
+                    offsets[id(current)] = 0
+                    break
+                path.append(current)
+                current = parent
+
+            for child in reversed(path):
+                parent = child.getParent()
+                offset = offsets[id(parent)]
+                if child is parent.getRight():
+                    offset += self.size(parent.getLeft()) + parent.getCount()
+                offsets[id(child)] = offset
+
+            results.append(offsets[id(node)] + self.size(node.getLeft()) + 1)
+
+        return results
+
     def tree_to_list_inorder(self, node: AVLNode | None, nodes: list[AVLNode] = None) -> list[AVLNode]:
         """
         Helper method to traverse the AVL tree and collect nodes in in-order.
+        Prefer iterating the tree (or `iter_from`) to stream the nodes without building a list.
 
         Parameters:
             node (AVLNode | None): The current node in the traversal.
@@ -260,8 +511,5 @@ class AVLTree(BinarySearchTree):
         """
         if nodes is None:
             nodes = []
-        if node is not None:
-            self.tree_to_list_inorder(node.getLeft(), nodes)
-            nodes.append(node)
-            self.tree_to_list_inorder(node.getRight(), nodes)
+        nodes.extend(self._iter_subtree(node))
         return nodes
\ No newline at end of file
@@ -0,0 +1,515 @@
+from array import array
+from typing import TYPE_CHECKING
+
+from DataStructure.OrderStatisticsStructure import OrderStatisticStructure
+
+if TYPE_CHECKING:
+    from DataStructure.FrozenSnapshot import FrozenSnapshot
+
+
+class ArrayAVLTree(OrderStatisticStructure):
+    """
+        ArrayAVLTree implements the same size-augmented AVL tree as AVLTree, but without node objects.
+
+        Every node is an integer handle: its key, children, parent, height and size live in parallel
+        array('q') buffers at that index. Handle 0 is the nil sentinel (height 0, size 0), so no
+        None checks are needed when reading children. Handles of deleted nodes are kept in a free
+        list and reused by the following inserts.
+        Keys live in an array('q') buffer, so unlike the node-based structures this one only
+        stores 64-bit integer keys and has no key function or payload.
+
+        Attributes:
+            __key (array): Key of each node.
+            __left (array): Handle of the left child of each node.
+            __right (array): Handle of the right child of each node.
+            __parent (array): Handle of the parent of each node.
+            __height (array): Height of the subtree rooted in each node.
+            __size (array): Number of nodes of the subtree rooted in each node.
+            __free (array): Handles released by delete, reused by insert.
+            __root (int): Handle of the root (NIL when the tree is empty).
+    """
+
+    NIL = 0
+
+    def __init__(self):
+        self.__key = array('q', [0])
+        self.__left = array('q', [0])
+        self.__right = array('q', [0])
+        self.__parent = array('q', [0])
+        self.__height = array('q', [0])
+        self.__size = array('q', [0])
+        self.__free = array('q')
+        self.__root = self.NIL
+
+    def getRoot(self) -> int:
+        return self.__root
+
+    def getValue(self, handle: int) -> int:
+        return self.__key[handle]
+
+    def getLeft(self, handle: int) -> int:
+        return self.__left[handle]
+
+    def getRight(self, handle: int) -> int:
+        return self.__right[handle]
+
+    def getParent(self, handle: int) -> int:
+        return self.__parent[handle]
+
+    def getHeight(self, handle: int) -> int:
+        return self.__height[handle]
+
+    def getSize(self, handle: int) -> int:
+        return self.__size[handle]
+
+    def __len__(self) -> int:
+        return self.__size[self.__root]
+
+
+    def _allocate(self, key: int, parent: int) -> int:
+        """
+            Create a leaf node, reusing a freed handle when available.
+
+            Parameters:
+                key (int): The key of the new node.
+                parent (int): The handle of its parent.
+
+            Returns:
+                int: The handle of the new node.
+        """
+        if self.__free:
+            handle = self.__free.pop()
+            self.__key[handle] = key
+            self.__left[handle] = self.NIL
+            self.__right[handle] = self.NIL
+            self.__parent[handle] = parent
+            self.__height[handle] = 1
+            self.__size[handle] = 1
+            return handle
+
+        self.__key.append(key)
+        self.__left.append(self.NIL)
+        self.__right.append(self.NIL)
+        self.__parent.append(parent)
+        self.__height.append(1)
+        self.__size.append(1)
+        return len(self.__key) - 1
+
+
+    def insert(self, key: int) -> int:
+        """
+            Insert a key into the tree, rebalancing on the way back to the root.
+
+            Parameters:
+                key (int): The value to insert.
+
+            Returns:
+                int: The handle of the node holding the key (the existing one for duplicates).
+        """
+        keys, left, right = self.__key, self.__left, self.__right
+
+        if self.__root == self.NIL:
+            self.__root = self._allocate(key, self.NIL)
+            return self.__root
+
+        current = self.__root
+        while True:
+            value = keys[current]
+            if key < value:
+                if left[current] == self.NIL:
+                    handle = self._allocate(key, current)
+                    left[current] = handle
+                    break
+                current = left[current]
+            elif key > value:
+                if right[current] == self.NIL:
+                    handle = self._allocate(key, current)
+                    right[current] = handle
+                    break
+                current = right[current]
+            else:
+                return current
+
+        self._retrace(current)
+        return handle
+
+
+    def delete(self, key: int) -> bool:
+        """
+            Delete a key from the tree and release its handle.
+
+            A node with two children is replaced by its in-order successor node, so the handles of
+            the remaining keys stay valid.
+
+            Parameters:
+                key (int): The value to remove.
+
+            Returns:
+                bool: True if the key was found and removed.
+        """
+        keys, left, right, parent = self.__key, self.__left, self.__right, self.__parent
+
+        z = self.__root
+        while z != self.NIL and keys[z] != key:
+            z = left[z] if key < keys[z] else right[z]
+        if z == self.NIL:
+            return False
+
+        if left[z] == self.NIL or right[z] == self.NIL:
+            start = parent[z]
+            self._transplant(z, left[z] if left[z] != self.NIL else right[z])
+        else:
+            successor = right[z]
+            while left[successor] != self.NIL:
+                successor = left[successor]
+
+            if parent[successor] != z:
+                start = parent[successor]
+                self._transplant(successor, right[successor])
+                right[successor] = right[z]
+                parent[right[successor]] = successor
+            else:
+                start = successor
+
+            self._transplant(z, successor)
+            left[successor] = left[z]
+            parent[left[successor]] = successor
+
+        self.__free.append(z)
+        self._retrace(start)
+        return True
+
+
+    def find(self, key: int) -> int | None:
+        """
+            Return the handle of the node holding `key`, or None if the key is not stored.
+        """
+        keys, left, right = self.__key, self.__left, self.__right
+        node = self.__root
+        while node != self.NIL:
+            value = keys[node]
+            if key == value:
+                return node
+            node = left[node] if key < value else right[node]
+        return None
+
+
+    def __contains__(self, key: int) -> bool:
+        return self.find(key) is not None
+
+
+    def rank_of(self, key: int) -> int | None:
+        """
+            Return the rank (1-based) of `key`, accumulated during the descent from the root.
+
+            Parameters:
+                key (int): The value whose rank we want to find.
+
+            Returns:
+                int | None: The rank of the key, or None if the key is not stored.
+        """
+        keys, left, right, size = self.__key, self.__left, self.__right, self.__size
+        rank = 0
+        node = self.__root
+        while node != self.NIL:
+            value = keys[node]
+            if key == value:
+                return rank + size[left[node]] + 1
+            if key < value:
+                node = left[node]
+            else:
+                rank += size[left[node]] + 1
+                node = right[node]
+        return None
+
+
+    def _transplant(self, u: int, v: int) -> None:
+        """
+            Replace the subtree rooted at u with the subtree rooted at v in u's parent.
+
+            Parameters:
+                u (int): The handle being replaced.
+                v (int): The replacing handle (may be NIL).
+        """
+        p = self.__parent[u]
+        if p == self.NIL:
+            self.__root = v
+        elif self.__left[p] == u:
+            self.__left[p] = v
+        else:
+            self.__right[p] = v
+        if v != self.NIL:
+            self.__parent[v] = p
+
+
+    def _update(self, x: int) -> None:
+        """
+            Recompute height and size of a handle from its children.
+
+            The NIL slot holds height 0 and size 0, so missing children need no test.
+
+            Parameters:
+                x (int): The handle to update.
+        """
+        l, r = self.__left[x], self.__right[x]
+        height = self.__height
+        height[x] = 1 + (height[l] if height[l] > height[r] else height[r])
+        self.__size[x] = 1 + self.__size[l] + self.__size[r]
+
+
+    def _retrace(self, x: int) -> None:
+        """
+            Walk up from x to the root updating heights and sizes and rotating unbalanced nodes.
+
+            Parameters:
+                x (int): The lowest handle whose children changed (may be NIL).
+        """
+        left, right, height = self.__left, self.__right, self.__height
+
+        while x != self.NIL:
+            self._update(x)
+            balance = height[left[x]] - height[right[x]]
+
+            if balance > 1:
+                if height[left[left[x]]] < height[right[left[x]]]:
+                    self._left_rotate(left[x])
+                x = self._right_rotate(x)
+            elif balance < -1:
+                if height[right[right[x]]] < height[left[right[x]]]:
+                    self._right_rotate(right[x])
+                x = self._left_rotate(x)
+
+            x = self.__parent[x]
+
+
+    def _left_rotate(self, x: int) -> int:
+        """
+            Perform a left rotation around x, relinking its parent.
+
+            Parameters:
+                x (int): The root of the subtree to rotate.
+
+            Returns:
+                int: The new root of the rotated subtree.
+        """
+        left, right, parent = self.__left, self.__right, self.__parent
+        y = right[x]
+        T2 = left[y]
+        p = parent[x]
+
+        right[x] = T2
+        if T2 != self.NIL:
+            parent[T2] = x
+        left[y] = x
+        parent[x] = y
+        parent[y] = p
+
+        if p == self.NIL:
+            self.__root = y
+        elif left[p] == x:
+            left[p] = y
+        else:
+            right[p] = y
+
+        self._update(x)
+        self._update(y)
+        return y
+
+
+    def _right_rotate(self, y: int) -> int:
+        """
+            Perform a right rotation around y, relinking its parent.
+
+            Parameters:
+                y (int): The root of the subtree to rotate.
+
+            Returns:
+                int: The new root of the rotated subtree.
+        """
+        left, right, parent = self.__left, self.__right, self.__parent
+        x = left[y]
+        T2 = right[x]
+        p = parent[y]
+
+        left[y] = T2
+        if T2 != self.NIL:
+            parent[T2] = y
+        right[x] = y
+        parent[y] = x
+        parent[x] = p
+
+        if p == self.NIL:
+            self.__root = x
+        elif left[p] == y:
+            left[p] = x
+        else:
+            right[p] = x
+
+        self._update(y)
+        self._update(x)
+        return x
+
+
+    def __str__(self) -> str:
+        keys = []
+        stack = []
+        node = self.__root
+        while stack or node != self.NIL:
+            while node != self.NIL:
+                stack.append(node)
+                node = self.__left[node]
+            node = stack.pop()
+            keys.append(str(self.__key[node]))
+            node = self.__right[node]
+        return " -> ".join(keys)
+
+
+    # Order Statistics Algorithm
+    def OSSelect(self, node: int, i: int) -> int | None:
+        """
+            Return the handle of the i-th smallest key in the subtree rooted at `node`, using size
+
+            Parameters:
+                node (int): The handle of the subtree root.
+                i (int): Index
+
+            Returns:
+                int | None: The corresponding handle or None if out of bounds.
+        """
+        left, right, size = self.__left, self.__right, self.__size
+
+        while node != self.NIL:
+            rank = size[left[node]] + 1
+            if i == rank:
+                return node
+            elif i < rank:
+                node = left[node]
+            else:
+                i -= rank
+                node = right[node]
+        return None
+
+
+    def select( self, i: int ) -> int:
+        """
+            Return the key of rank i (the value of the OSSelect handle).
+
+            Raises:
+                IndexError: If i is out of bounds.
+        """
+        handle = self.OSSelect(self.__root, i)
+        if handle is None:
+            raise IndexError("Index out of range")
+        return self.__key[handle]
+
+    def OSRank(self, x: int) -> int:
+        """
+            Return the rank (1-based index in inorder traversal) of the node with handle x, using size
+
+            Parameters:
+                x (int): The handle whose rank we want to find.
+
+            Returns:
+                int: The rank of the node.
+        """
+        left, right, parent, size = self.__left, self.__right, self.__parent, self.__size
+
+        rank = size[left[x]] + 1
+        while parent[x] != self.NIL:
+            p = parent[x]
+            if right[p] == x:
+                rank += size[left[p]] + 1
+            x = p
+        return rank
+
+
+    # In-order generators
+    def _successor(self, x: int) -> int:
+        """
+            Return the handle following x in order (NIL after the last one), using parent links.
+        """
+        left, right, parent = self.__left, self.__right, self.__parent
+        if right[x] != self.NIL:
+            x = right[x]
+            while left[x] != self.NIL:
+                x = left[x]
+            return x
+        p = parent[x]
+        while p != self.NIL and right[p] == x:
+            x, p = p, parent[p]
+        return p
+
+
+    def _walk(self, handle: int):
+        while handle != self.NIL:
+            yield handle
+            handle = self._successor(handle)
+
+
+    def __iter__(self):
+        """
+            Lazily yield the handles in key order.
+
+            Parent links replace the traversal stack, so memory is O(1) and each step O(1) amortized.
+        """
+        handle = self.__root
+        while handle != self.NIL and self.__left[handle] != self.NIL:
+            handle = self.__left[handle]
+        return self._walk(handle)
+
+
+    def freeze(self) -> "FrozenSnapshot":
+        """
+            Return an immutable NumPy snapshot of the keys, in order, for vectorized select / rank.
+
+            Iteration yields handles, not keys: the keys are gathered from the key buffer into an
+            array('q') instead, which NumPy reads as int64 without boxing.
+
+            Returns:
+                FrozenSnapshot: The snapshot of the current keys.
+        """
+        from DataStructure.FrozenSnapshot import FrozenSnapshot
+
+        keys = self.__key
+        return FrozenSnapshot(array('q', (keys[handle] for handle in self)))
+
+
+    def iter_from(self, key: int):
+        """
+            Lazily yield the handles whose key is not less than `key`, in order.
+
+            Parameters:
+                key (int): The lower bound (inclusive).
+
+            Yields:
+                int: The handles from the first key >= key to the end.
+        """
+        keys, left, right = self.__key, self.__left, self.__right
+        first = self.NIL
+        node = self.__root
+        while node != self.NIL:
+            if keys[node] < key:
+                node = right[node]
+            else:
+                first = node
+                node = left[node]
+        return self._walk(first)
+
+
+    def iter_from_rank(self, k: int):
+        """
+            Lazily yield the handles from rank k (1-based) to the end, in order.
+
+            Parameters:
+                k (int): The first rank.
+
+            Yields:
+                int: The handle holding each rank.
+
+            Raises:
+                IndexError: If k is lower than 1.
+        """
+        if k < 1:
+            raise IndexError("Index must be >= 1")
+        handle = self.OSSelect(self.__root, k)
+        return self._walk(handle if handle is not None else self.NIL)
@@ -0,0 +1,484 @@
+from bisect import bisect_left, bisect_right, insort_right
+from itertools import accumulate, islice
+
+from DataStructure.Node.BPlusNode import BPlusNode
+from DataStructure.OrderStatisticsStructure import OrderStatisticStructure
+
+
+class BPlusTree(OrderStatisticStructure):
+    """
+        BPlusTree implements a counted B+-tree: every internal node stores, next to its separator keys,
+        the number of keys in the subtrees of its children, as cumulative counts.
+
+        With a fanout of tens or hundreds of keys per node the tree is only a few levels deep, and each
+        level is resolved by one bisect over a key list or over the cumulative counts, which runs in C
+        instead of one Python method call per binary node. Updates pay for it by shifting the counts
+        after the descended child, O(fanout) per level, about the cost of the list insert itself. Keys are kept in the leaves,
+        in order, and the leaves are linked for iteration. Duplicates are stored as separate keys.
+
+        OSSelect returns keys (there are no per-key node objects) and OSRank takes a key.
+
+        Attributes:
+            __fanout (int): Maximum number of keys of a leaf and of children of an internal node.
+            __min_fill (int): Minimum number of keys / children of a non-root node after a delete.
+            __root (BPlusNode): The root node (an empty leaf when the tree is empty).
+            __length (int): Number of stored keys.
+    """
+
+    def __init__( self, fanout: int = 64 ):
+        if fanout < 4:
+            raise ValueError("Fanout must be at least 4")
+        self.__fanout = fanout
+        self.__min_fill = fanout // 2
+        self.__root = BPlusNode()
+        self.__length = 0
+
+    @classmethod
+    def from_sorted( cls, values, fanout: int = 64 ) -> "BPlusTree":
+        """
+            Build a tree from keys already in ascending order in O(n), filling the leaves completely.
+
+            Parameters:
+                values (Iterable): The keys to store, in ascending order.
+                fanout (int): Maximum number of keys / children per node.
+
+            Returns:
+                BPlusTree: The new tree.
+        """
+        tree = cls(fanout)
+        keys = list(values)
+        if not keys:
+            return tree
+
+        level = [BPlusNode(keys[i:i + fanout]) for i in range(0, len(keys), fanout)]
+        for left, right in zip(level, level[1:]):
+            left.setNext(right)
+        tree._rebalance_tail(level)
+
+        while len(level) > 1:
+            parents = []
+            for i in range(0, len(level), fanout):
+                children = level[i:i + fanout]
+                separators = [tree._first_key(child) for child in children[1:]]
+                parents.append(BPlusNode(separators, children, list(accumulate(child.size() for child in children))))
+            tree._rebalance_tail(parents)
+            level = parents
+
+        tree.__root = level[0]
+        tree.__length = len(keys)
+        return tree
+
+    def _rebalance_tail( self, level: list[BPlusNode] ) -> None:
+        """
+            Even out the last two nodes of a bulk-loaded level, so the last one is not underfull.
+        """
+        if len(level) < 2:
+            return
+        left, right = level[-2], level[-1]
+        if right.isLeaf():
+            keys = left.getKeys() + right.getKeys()
+            half = len(keys) // 2
+            left.getKeys()[:] = keys[:half]
+            right.getKeys()[:] = keys[half:]
+            return
+
+        keys = left.getKeys() + [self._first_key(right)] + right.getKeys()
+        children = left.getChildren() + right.getChildren()
+        half = len(children) // 2
+        left.getKeys()[:], right.getKeys()[:] = keys[:half - 1], keys[half:]
+        left.getChildren()[:], right.getChildren()[:] = children[:half], children[half:]
+        left.getCounts()[:] = accumulate(child.size() for child in children[:half])
+        right.getCounts()[:] = accumulate(child.size() for child in children[half:])
+
+    @staticmethod
+    def _first_key( node: BPlusNode ):
+        while not node.isLeaf():
+            node = node.getChildren()[0]
+        return node.getKeys()[0]
+
+
+    def getRoot(self) -> BPlusNode:
+        return self.__root
+
+    def getFanout(self) -> int:
+        return self.__fanout
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def height(self) -> int:
+        """
+            Return the number of levels of the tree (1 for a single leaf).
+        """
+        levels = 1
+        node = self.__root
+        while not node.isLeaf():
+            node = node.getChildren()[0]
+            levels += 1
+        return levels
+
+
+    def insert( self, key ) -> None:
+        """
+            Insert a key, after any equal keys already stored.
+
+            The counts along the descent are incremented on the way down; a node that overflows
+            is split in two and the split goes up the recorded path.
+
+            Parameters:
+                key: The value to insert.
+        """
+        path = []
+        node = self.__root
+        while not node.isLeaf():
+            j = bisect_right(node.getKeys(), key)
+            counts = node.getCounts()
+            counts[j:] = [count + 1 for count in counts[j:]]
+            path.append((node, j))
+            node = node.getChildren()[j]
+
+        insort_right(node.getKeys(), key)
+        self.__length += 1
+
+        while self._overflows(node):
+            right, separator = self._split(node)
+            if not path:
+                self.__root = BPlusNode([separator], [node, right], [node.size(), node.size() + right.size()])
+                return
+            parent, j = path.pop()
+            parent.getKeys().insert(j, separator)
+            parent.getChildren().insert(j + 1, right)
+            counts = parent.getCounts()
+            counts.insert(j + 1, counts[j])
+            counts[j] -= right.size()
+            node = parent
+
+    def _overflows( self, node: BPlusNode ) -> bool:
+        return len(node.getKeys() if node.isLeaf() else node.getChildren()) > self.__fanout
+
+    def _split( self, node: BPlusNode ) -> tuple[BPlusNode, object]:
+        """
+            Move the upper half of an overflowing node to a new right sibling.
+
+            Returns:
+                tuple[BPlusNode, object]: The new node and the separator key to insert in the parent.
+        """
+        keys = node.getKeys()
+        if node.isLeaf():
+            mid = len(keys) // 2
+            right = BPlusNode(keys[mid:])
+            del keys[mid:]
+            right.setNext(node.getNext())
+            node.setNext(right)
+            return right, right.getKeys()[0]
+
+        children, counts = node.getChildren(), node.getCounts()
+        mid = len(children) // 2
+        separator = keys[mid - 1]
+        offset = counts[mid - 1]
+        right = BPlusNode(keys[mid:], children[mid:], [count - offset for count in counts[mid:]])
+        del keys[mid - 1:], children[mid:], counts[mid:]
+        return right, separator
+
+
+    def delete( self, key ) -> bool:
+        """
+            Delete one occurrence of a key.
+
+            The key is located by rank, so the descent only follows the child counts; underfull nodes
+            then borrow from a sibling or are merged with it on the way back up.
+
+            Parameters:
+                key: The value to remove.
+
+            Returns:
+                bool: True if the key was found and removed.
+        """
+        rank = self.rank_of(key)
+        if rank is None:
+            return False
+
+        path = []
+        node = self.__root
+        i = rank
+        while not node.isLeaf():
+            counts = node.getCounts()
+            j = bisect_left(counts, i)
+            if j:
+                i -= counts[j - 1]
+            counts[j:] = [count - 1 for count in counts[j:]]
+            path.append((node, j))
+            node = node.getChildren()[j]
+
+        del node.getKeys()[i - 1]
+        self.__length -= 1
+
+        while path and self._underflows(node):
+            parent, j = path.pop()
+            self._fix_underflow(parent, j)
+            node = parent
+
+        root = self.__root
+        if not root.isLeaf() and len(root.getChildren()) == 1:
+            self.__root = root.getChildren()[0]
+        return True
+
+    def _underflows( self, node: BPlusNode ) -> bool:
+        return len(node.getKeys() if node.isLeaf() else node.getChildren()) < self.__min_fill
+
+    def _fix_underflow( self, parent: BPlusNode, j: int ) -> None:
+        """
+            Refill child j of parent, borrowing from a sibling that can spare an entry or merging with it.
+        """
+        children = parent.getChildren()
+        if j > 0 and not self._at_min(children[j - 1]):
+            self._borrow_from_left(parent, j)
+        elif j + 1 < len(children) and not self._at_min(children[j + 1]):
+            self._borrow_from_right(parent, j)
+        elif j > 0:
+            self._merge(parent, j - 1)
+        else:
+            self._merge(parent, j)
+
+    def _at_min( self, node: BPlusNode ) -> bool:
+        return len(node.getKeys() if node.isLeaf() else node.getChildren()) <= self.__min_fill
+
+    def _borrow_from_left( self, parent: BPlusNode, j: int ) -> None:
+        left, node = parent.getChildren()[j - 1], parent.getChildren()[j]
+        separators, counts = parent.getKeys(), parent.getCounts()
+        if node.isLeaf():
+            node.getKeys().insert(0, left.getKeys().pop())
+            separators[j - 1] = node.getKeys()[0]
+            moved = 1
+        else:
+            node.getKeys().insert(0, separators[j - 1])
+            separators[j - 1] = left.getKeys().pop()
+            node.getChildren().insert(0, left.getChildren().pop())
+            left_counts = left.getCounts()
+            moved = left_counts.pop() - left_counts[-1]
+            node.getCounts()[:] = [moved] + [count + moved for count in node.getCounts()]
+        counts[j - 1] -= moved
+
+    def _borrow_from_right( self, parent: BPlusNode, j: int ) -> None:
+        node, right = parent.getChildren()[j], parent.getChildren()[j + 1]
+        separators, counts = parent.getKeys(), parent.getCounts()
+        if node.isLeaf():
+            node.getKeys().append(right.getKeys().pop(0))
+            separators[j] = right.getKeys()[0]
+            moved = 1
+        else:
+            node.getKeys().append(separators[j])
+            separators[j] = right.getKeys().pop(0)
+            node.getChildren().append(right.getChildren().pop(0))
+            right_counts = right.getCounts()
+            moved = right_counts.pop(0)
+            right_counts[:] = [count - moved for count in right_counts]
+            node.getCounts().append(node.getCounts()[-1] + moved)
+        counts[j] += moved
+
+    def _merge( self, parent: BPlusNode, j: int ) -> None:
+        """
+            Merge child j + 1 of parent into child j.
+        """
+        separators, children, counts = parent.getKeys(), parent.getChildren(), parent.getCounts()
+        left, right = children[j], children[j + 1]
+        if left.isLeaf():
+            left.getKeys().extend(right.getKeys())
+            left.setNext(right.getNext())
+        else:
+            left.getKeys().append(separators[j])
+            left.getKeys().extend(right.getKeys())
+            left.getChildren().extend(right.getChildren())
+            offset = left.getCounts()[-1]
+            left.getCounts().extend(count + offset for count in right.getCounts())
+        # The cumulative count of child j + 1 now covers the merged child
+        del separators[j], children[j + 1], counts[j]
+
+
+    def __str__(self) -> str:
+        return " -> ".join(str(key) for key in self)
+
+
+    def _count_below( self, key, inclusive: bool = False ) -> int:
+        """
+            Return the number of keys less than `key` (or not greater, when inclusive), by descent.
+        """
+        search = bisect_right if inclusive else bisect_left
+        count = 0
+        node = self.__root
+        while not node.isLeaf():
+            j = search(node.getKeys(), key)
+            if j:
+                count += node.getCounts()[j - 1]
+            node = node.getChildren()[j]
+        return count + search(node.getKeys(), key)
+
+    def _seek( self, key ) -> tuple[int, BPlusNode | None, int]:
+        """
+            Locate the first key not less than `key`.
+
+            Returns:
+                tuple[int, BPlusNode | None, int]: Its rank, its leaf (None past the end) and its index in the leaf.
+        """
+        rank = 1
+        node = self.__root
+        while not node.isLeaf():
+            j = bisect_left(node.getKeys(), key)
+            if j:
+                rank += node.getCounts()[j - 1]
+            node = node.getChildren()[j]
+        index = bisect_left(node.getKeys(), key)
+        rank += index
+        if index == len(node.getKeys()):
+            node, index = node.getNext(), 0
+        return rank, node, index
+
+    def find( self, key ):
+        """
+            Return the stored key equal to `key`, or None if the key is not stored.
+        """
+        _, leaf, index = self._seek(key)
+        if leaf is None or leaf.getKeys()[index] != key:
+            return None
+        return leaf.getKeys()[index]
+
+    def __contains__( self, key ) -> bool:
+        return self.find(key) is not None
+
+    def rank_of( self, key ) -> int | None:
+        """
+            Return the rank (1-based) of the first copy of `key`, accumulated during the descent.
+
+            Parameters:
+                key: The value whose rank we want to find.
+
+            Returns:
+                int | None: The rank of the key, or None if the key is not stored.
+        """
+        rank, leaf, index = self._seek(key)
+        if leaf is None or leaf.getKeys()[index] != key:
+            return None
+        return rank
+
+    def count_range( self, lo, hi ) -> int:
+        """
+            Return how many keys fall in [lo, hi], with two O(log n) descents.
+        """
+        if hi < lo:
+            return 0
+        return self._count_below(hi, inclusive=True) - self._count_below(lo)
+
+
+    # In-order generators
+    def _leaf_at( self, i: int ) -> tuple[BPlusNode, int]:
+        """
+            Return the leaf holding rank i (1-based, valid) and the index of the key in it.
+        """
+        node = self.__root
+        while not node.isLeaf():
+            counts = node.getCounts()
+            j = bisect_left(counts, i)
+            if j:
+                i -= counts[j - 1]
+            node = node.getChildren()[j]
+        return node, i - 1
+
+    def _walk( self, leaf: BPlusNode | None, index: int ):
+        while leaf is not None:
+            keys = leaf.getKeys()
+            for j in range(index, len(keys)):
+                yield keys[j]
+            leaf, index = leaf.getNext(), 0
+
+    def __iter__(self):
+        """
+            Lazily yield the keys in order, following the leaf links.
+        """
+        node = self.__root
+        while not node.isLeaf():
+            node = node.getChildren()[0]
+        return self._walk(node, 0)
+
+    def iter_from( self, key ):
+        """
+            Lazily yield the keys not less than `key`, in order.
+        """
+        _, leaf, index = self._seek(key)
+        return self._walk(leaf, index)
+
+    def iter_from_rank( self, k: int ):
+        """
+            Lazily yield the keys from rank k (1-based) to the end, in order.
+
+            Raises:
+                IndexError: If k is lower than 1.
+        """
+        if k < 1:
+            raise IndexError("Index must be >= 1")
+        if k > self.__length:
+            return iter(())
+        return self._walk(*self._leaf_at(k))
+
+    def iter_range( self, lo, hi ):
+        """
+            Lazily yield the keys in [lo, hi], in order.
+        """
+        for key in self.iter_from(lo):
+            if hi < key:
+                return
+            yield key
+
+    def iter_ranks( self, k1: int, k2: int ):
+        """
+            Lazily yield the keys ranked k1..k2 (1-based, inclusive), in order.
+        """
+        return islice(self.iter_from_rank(k1), max(0, k2 - k1 + 1))
+
+
+    # Order Statistics Algorithm
+    def OSSelect( self, node: BPlusNode, i: int ):
+        """
+            Return the i-th smallest key in the subtree rooted at `node`.
+
+            Each internal level bisects the cumulative child counts, each leaf indexes its key list.
+
+            Parameters:
+                node (BPlusNode): The root of the subtree.
+                i (int): Index
+
+            Returns:
+                The corresponding key or None if out of bounds.
+        """
+        if i < 1 or i > node.size():
+            return None
+        while not node.isLeaf():
+            counts = node.getCounts()
+            j = bisect_left(counts, i)
+            if j:
+                i -= counts[j - 1]
+            node = node.getChildren()[j]
+        return node.getKeys()[i - 1]
+
+    def select( self, i: int ):
+        """
+            Return the key of rank i (OSSelect from the root).
+
+            Raises:
+                IndexError: If i is out of bounds.
+        """
+        key = self.OSSelect(self.__root, i)
+        if key is None:
+            raise IndexError("Index out of range")
+        return key
+
+    def OSRank( self, x ) -> int | None:
+        """
+            Return the rank (1-based) of the key x (of its first copy with duplicates).
+
+            Parameters:
+                x: The key whose rank we want to find.
+
+            Returns:
+                int | None: The rank of the key, or None if it is not stored.
+        """
+        return self.rank_of(x)
@@ -1,3 +1,6 @@
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
 from DataStructure.Node.Node import Node
 from DataStructure.Node.TreeNode import TreeNode
 from DataStructure.OrderStatisticsStructure import OrderStatisticStructure
@@ -11,41 +14,214 @@ class BinarySearchTree(OrderStatisticStructure):
 
         Attributes:
             __root (TreeNode): The root node of the binary search tree.
+            __size_memo (dict[int, int] | None): Cached subtree sizes keyed by node id (size_cache=True),
+                or None by default: the plain "BST without size attribute" behaviour.
+            __cache_hits (int): Number of subtree sizes served from the cache.
+            __cache_misses (int): Number of subtree sizes that had to be counted.
+            __multiset (bool): Whether equal values share one node with a count (sizes are weighted
+                by count) instead of being inserted as separate nodes in the right subtree.
+            __key (Callable | None): Function extracting the key of an inserted item, which is then kept
+                as the node payload. None stores the inserted values themselves as keys.
+            __node_class (type): The TreeNode variant instantiated, with a count and / or payload slot only when the mode needs it.
     """
 
-    def __init__( self, value: int|None = None ):
-        if value is None:
-            self.__root = None
-        else:
-            if not isinstance(value, int):
-                raise TypeError("Value must be integer")
-            self.__root = TreeNode(value)
+    def __init__( self, value = None, size_cache: bool = False, multiset: bool = False, key = None ):
+        self.__multiset = multiset
+        self.__key = key
+        self.__node_class = TreeNode.variant(counted=multiset, keyed=key is not None)
+        self.__size_memo = {} if size_cache else None
+        self.__cache_hits = 0
+        self.__cache_misses = 0
+        self.__root = self._new_node(self._key_of(value), value) if value is not None else None
 
 
     def getRoot(self) -> TreeNode:
         return self.__root
 
+    def isMultiset(self) -> bool:
+        return self.__multiset
+
+    def getKey(self):
+        return self.__key
+
+    def getCacheHits(self) -> int:
+        return self.__cache_hits
+
+    def getCacheMisses(self) -> int:
+        return self.__cache_misses
+
+    def resetCacheStats(self) -> None:
+        self.__cache_hits = 0
+        self.__cache_misses = 0
+
+
+    @classmethod
+    def from_iterable( cls, values, **kwargs ) -> "BinarySearchTree":
+        """
+            Build a height-balanced tree from unsorted values, sorting them once.
+
+            Parameters:
+                values (Iterable): The values (or items, with a key function) to store.
+                kwargs: Extra constructor arguments (e.g. size_cache, key).
+
+            Returns:
+                BinarySearchTree: The new tree.
+        """
+        return cls.from_sorted(sorted(values, key=kwargs.get("key")), **kwargs)
+
+    @classmethod
+    def from_sorted( cls, values, **kwargs ) -> "BinarySearchTree":
+        """
+            Build a height-balanced tree from values already in ascending order in O(n).
+
+            Duplicates are kept, and the middle element of each range is its root, so runs of equal keys
+            are balanced too (copies may end up on both sides of an equal node; lookups descend to the
+            first copy). The ranges are expanded from an explicit stack, without recursion.
+            In multiset mode equal values are collapsed into one node with their count.
+
+            Parameters:
+                values (Sequence): The values (or items, with a key function) to store, in ascending key order.
+                kwargs: Extra constructor arguments (e.g. size_cache, multiset, key).
+
+            Returns:
+                BinarySearchTree: The new tree.
+        """
+        tree = cls(**kwargs)
+        items = list(values)
+        values = items if tree.__key is None else [tree.__key(item) for item in items]
+        counts = None
+        if tree.__multiset:
+            values, counts = BinarySearchTree._collapse(values)
+            items = BinarySearchTree._first_of_runs(items, counts)
+
+        # Ranges still to build: (lo, hi, parent, attach as left child)
+        stack = [(0, len(values) - 1, None, False)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            if lo > hi:
+                continue
+            mid = (lo + hi) // 2
+            node = tree.__node_class(values[mid])
+            if tree.__key is not None:
+                node.setPayload(items[mid])
+            if counts is not None:
+                node.setCount(counts[mid])
+
+            if parent is None:
+                tree.__root = node
+            elif is_left:
+                parent.setLeft(node)
+            else:
+                parent.setRight(node)
+            stack.append((mid + 1, hi, node, False))
+            stack.append((lo, mid - 1, node, True))
+
+        return tree
+
+    @staticmethod
+    def _collapse( values: list ) -> tuple[list, list[int]]:
+        """
+            Collapse runs of equal values of a sorted sequence.
+
+            Parameters:
+                values (list): The values, in ascending order.
+
+            Returns:
+                tuple[list, list[int]]: The distinct values and the multiplicity of each.
+        """
+        keys, counts = [], []
+        for value in values:
+            if keys and keys[-1] == value:
+                counts[-1] += 1
+            else:
+                keys.append(value)
+                counts.append(1)
+        return keys, counts
+
+    @staticmethod
+    def _first_of_runs( items: list, counts: list[int] ) -> list:
+        """
+            Return the first item of each run of equal keys, given the run lengths from `_collapse`.
+        """
+        firsts, start = [], 0
+        for count in counts:
+            firsts.append(items[start])
+            start += count
+        return firsts
+
+    def _key_of( self, item ):
+        """
+            Return the key of an inserted item: the item itself, unless the tree has a key function.
+        """
+        return item if self.__key is None else self.__key(item)
+
+    def _new_node( self, key, item ) -> TreeNode:
+        """
+            Create the node of an inserted item, keeping the item as payload when the tree has a key function.
+        """
+        node = self.__node_class(key)
+        if self.__key is not None:
+            node.setPayload(item)
+        return node
+
 
-    def insert( self, root: TreeNode | None, value: int ) -> TreeNode:
+    def insert( self, value, root: TreeNode | None = None ) -> TreeNode:
         """
-            Insert a new root into the binary search tree.
+            Insert a new value into the binary search tree.
+
+            The insertion point is found iteratively, so degenerate (e.g. sorted) input does not hit
+            the recursion limit. In multiset mode an equal value increments the count of its node.
 
             Parameters:
-                root (TreeNode): The root of tree.
-                value (Int): The value that a node could have
+                value: The value that a node could have (an item whose key is `key(value)` with a key function)
+                root (TreeNode, optional): The root of the subtree to insert into. Defaults to the tree's root.
+
+            Returns:
+                TreeNode: The root of the subtree (the new node when the tree was empty).
         """
+        item = value
+        if self.__key is not None:
+            value = self.__key(item)
+
+        if root is None:
+            root = self.__root
         if root is None:
-            newerNode = TreeNode( value )
-            if self.__root is None:
-                self.__root = newerNode
-            return newerNode
-
-        if value < root.getValue():
-            root.setLeft(self.insert(root.getLeft(), value))
-        else:
-            root.setRight(self.insert(root.getRight(), value))
+            self.__root = self._new_node( value, item )
+            return self.__root
+
+        current = root
+        while True:
+            if self.__multiset and value == current.getValue():
+                current.setCount(current.getCount() + 1)
+                break
+            if value < current.getValue():
+                if current.getLeft() is None:
+                    current.setLeft(self._new_node(value, item))
+                    break
+                current = current.getLeft()
+            else:
+                if current.getRight() is None:
+                    current.setRight(self._new_node(value, item))
+                    break
+                current = current.getRight()
+
+        self._invalidate_path(current)
         return root
 
+    def _invalidate_path( self, node: TreeNode | None ) -> None:
+        """
+            Drop the cached sizes of `node` and all of its ancestors, i.e. the only subtrees
+            whose size changes when a leaf is attached under `node` (or its count changes).
+
+            Parameters:
+                node (TreeNode | None): The parent of the newly attached leaf, or the node whose count changed.
+        """
+        if self.__size_memo is None:
+            return
+        while node is not None:
+            self.__size_memo.pop(id(node), None)
+            node = node.getParent()
+
     def inorder( self, root: TreeNode ):
         """
             Perform an inorder traversal of the tree.
@@ -54,11 +230,12 @@ class BinarySearchTree(OrderStatisticStructure):
                 root (TreeNode): The root node to start the traversal from.
 
             Returns:
-                list[str]: A list of node values (as strings) in ascending order.
+                list[str]: A list of node values (as strings) in ascending order, each repeated by its count.
         """
-        if root is None:
-            return []
-        return self.inorder(root.getLeft()) + [str(root.getValue())] + self.inorder(root.getRight())
+        values = []
+        for node in self._iter_subtree(root):
+            values.extend([str(node.getValue())] * node.getCount())
+        return values
 
 
 
@@ -84,19 +261,124 @@ class BinarySearchTree(OrderStatisticStructure):
         result += self._tree_to_string(node.getLeft(), level + 1)
         return result
 
+    def find( self, key ) -> TreeNode | None:
+        """
+            Return the node holding `key`, descending from the root.
+
+            With duplicates, this is the first copy in order: `insert` puts equal keys in the right
+            subtree, but `from_sorted` may put them on both sides, so the descent goes on to the left
+            of every equal node and keeps the last one met.
+
+            Parameters:
+                key: The value to look for.
+
+            Returns:
+                TreeNode | None: The node found, or None if the key is not stored.
+        """
+        found = None
+        current = self.getRoot()
+        while current is not None:
+            value = current.getValue()
+            if key == value:
+                found = current
+                current = current.getLeft()
+            else:
+                current = current.getLeft() if key < value else current.getRight()
+        return found
+
+    def __contains__( self, key ) -> bool:
+        return self.find(key) is not None
+
+    def rank_of( self, key ) -> int | None:
+        """
+            Return the rank (1-based) of `key` without a node reference.
+
+            The rank is accumulated during the descent from the root, adding the left subtree size and
+            the count of every node the search passes on the right; no parent pointer is followed.
+            With duplicates, the rank is the one of the first copy, as for `find`.
+
+            Parameters:
+                key: The value whose rank we want to find.
+
+            Returns:
+                int | None: The rank of the key, or None if the key is not stored.
+        """
+        found = None
+        rank = 0
+        current = self.getRoot()
+        while current is not None:
+            value = current.getValue()
+            if key == value:
+                found = rank + self._subtree_size(current.getLeft()) + 1
+                current = current.getLeft()
+            elif key < value:
+                current = current.getLeft()
+            else:
+                rank += self._subtree_size(current.getLeft()) + current.getCount()
+                current = current.getRight()
+        return found
+
     def _subtree_size(self, node: TreeNode) -> int:
         """
             Return the size of the subtree rooted at `node`.
 
+            When the size cache is enabled, sizes are memoized per node and `insert` only invalidates
+            the entries along its insertion path, so repeated queries cost close to O(height).
+
             Parameters:
                 node (TreeNode): The root of the subtree.
 
             Returns:
-                int: Number of nodes in the subtree.
+                int: Number of values in the subtree (the sum of the node counts).
         """
         if node is None:
             return 0
-        return 1 + self._subtree_size(node.getLeft()) + self._subtree_size(node.getRight())
+
+        memo = self.__size_memo
+        if memo is None:
+            size = 0
+            stack = [node]
+            while stack:
+                current = stack.pop()
+                size += current.getCount()
+                if current.getLeft() is not None:
+                    stack.append(current.getLeft())
+                if current.getRight() is not None:
+                    stack.append(current.getRight())
+            return size
+
+        size = memo.get(id(node))
+        if size is not None:
+            self.__cache_hits += 1
+            return size
+
+        # Post-order over the uncached part of the subtree, caching every size it computes
+        stack = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            left, right = current.getLeft(), current.getRight()
+            if expanded:
+                memo[id(current)] = (current.getCount() + (memo[id(left)] if left is not None else 0)
+                                     + (memo[id(right)] if right is not None else 0))
+                continue
+
+            self.__cache_misses += 1
+            stack.append((current, True))
+            for child in (left, right):
+                if child is None:
+                    continue
+                if id(child) in memo:
+                    self.__cache_hits += 1
+                else:
+                    stack.append((child, False))
+        return memo[id(node)]
+
+    def refresh(self) -> None:
+        """
+            Fill the size cache of the whole tree (size_cache=True), so the queries that follow only read it.
+        """
+        if self.__size_memo is not None:
+            self._subtree_size(self.getRoot())
 
     # Order Statistics Algorithm
     def OSSelect( self, node: TreeNode, i: int ) -> TreeNode | None:
@@ -110,37 +392,301 @@ class BinarySearchTree(OrderStatisticStructure):
             Returns:
                 TreeNode | None: The corresponding node or None if out of bounds.
         """
-        if not node:
-            return None
-        left = node.getLeft()
-        left_size = self._subtree_size(left)
+        while node is not None:
+            left = node.getLeft()
+            left_size = self._subtree_size(left)
+
+            if left_size < i <= left_size + node.getCount():
+                return node
+            elif i <= left_size:
+                node = left
+            else:
+                i -= left_size + node.getCount()
+                node = node.getRight()
+        return None
+
+    def OSSelect_many( self, ks: list[int], node: TreeNode | None = None ) -> list[TreeNode | None]:
+        """
+            Return the nodes with ranks `ks` in one coordinated descent.
+
+            The ranks are sorted once; every visited node splits the pending ranks (by bisection)
+            between its left subtree, itself and its right subtree, so shared path prefixes are
+            walked only once instead of once per query.
+
+            Parameters:
+                ks (list[int]): The requested ranks, in any order.
+                node (TreeNode, optional): The root of the subtree. Defaults to the tree's root.
+
+            Returns:
+                list[TreeNode | None]: The selected nodes in the order of `ks` (None if out of bounds).
+        """
+        if node is None:
+            node = self.getRoot()
+
+        order = sorted(range(len(ks)), key=ks.__getitem__)
+        sorted_ks = [ks[j] for j in order]
+        results = [None] * len(ks)
 
-        if i == left_size + 1:
-            return node
-        elif i <= left_size:
-            return self.OSSelect(left, i)
-        else:
-            return self.OSSelect(node.getRight(), i - left_size - 1)
+        # (subtree root, pending query range [lo, hi), number of nodes preceding the subtree)
+        stack = [(node, 0, len(order), 0)]
+        while stack:
+            current, lo, hi, offset = stack.pop()
+            if current is None or lo >= hi:
+                continue
+
+            # The node holds ranks first..last (a single rank unless it is a multiset node)
+            first = offset + self._subtree_size(current.getLeft()) + 1
+            last = first + current.getCount() - 1
+            mid_lo = bisect_left(sorted_ks, first, lo, hi)
+            mid_hi = bisect_right(sorted_ks, last, mid_lo, hi)
+            for j in range(mid_lo, mid_hi):
+                results[order[j]] = current
+
+            stack.append((current.getLeft(), lo, mid_lo, offset))
+            stack.append((current.getRight(), mid_hi, hi, last))
+
+        return results
+
+    def select( self, i: int ):
+        """
+            Return the key of rank i (the value of the OSSelect node).
+
+            Raises:
+                IndexError: If i is out of bounds.
+        """
+        node = self.OSSelect(self.getRoot(), i)
+        if node is None:
+            raise IndexError("Index out of range")
+        return node.getValue()
 
     def OSRank( self, node: TreeNode ) -> int:
         """
-        Return the rank (0-based index in inorder traversal) of a given value in the BST.
+            Return the rank (1-based index in inorder traversal) of a given node in the BST.
+
+            The rank is accumulated while descending a single root-to-node path: every time the
+            search moves right, the current node and its left subtree precede the target.
+
+            Parameters:
+                node (TreeNode): The node to find the rank of.
+
+            Returns:
+                int: The rank (number of nodes with value < input value, plus one).
+        """
+        x = node.getValue()
+        current = self.getRoot()
+        rank = 1
+
+        while current is not None:
+            if current.getValue() < x:
+                rank += current.getCount() + self._subtree_size(current.getLeft())
+                current = current.getRight()
+            else:
+                current = current.getLeft()
+
+        return rank
+
+    def OSRank_many( self, items: list ) -> list[int | None]:
+        """
+            Return the ranks of many nodes or keys with a single inorder sweep.
+
+            As in OSRank, the rank of a value is the number of smaller values plus one. The sweep
+            stops as soon as every requested value has been seen, so ranking the whole tree costs
+            O(n) instead of one descent per item.
+
+            Parameters:
+                items (list[TreeNode | int]): Nodes of this tree and/or keys, in any order.
+
+            Returns:
+                list[int | None]: The ranks in the order of `items` (None for keys not in the tree).
+        """
+        wanted = {}
+        for j, item in enumerate(items):
+            key = item.getValue() if isinstance(item, Node) else item
+            wanted.setdefault(key, []).append(j)
+
+        results = [None] * len(items)
+        stack = []
+        current = self.getRoot()
+        position = 0
+
+        while wanted and (stack or current is not None):
+            while current is not None:
+                stack.append(current)
+                current = current.getLeft()
+            current = stack.pop()
+
+            # Equal values are contiguous in inorder: the first copy takes the requests
+            for j in wanted.pop(current.getValue(), ()):
+                results[j] = position + 1
+            position += current.getCount()
+            current = current.getRight()
+
+        return results
+
+
+    # Range queries
+    def _count_below( self, key, inclusive: bool = False ) -> int:
+        """
+            Return the number of values less than `key` (or not greater, when inclusive), by descent.
+        """
+        count = 0
+        current = self.getRoot()
+        while current is not None:
+            value = current.getValue()
+            if value < key or (inclusive and value == key):
+                count += self._subtree_size(current.getLeft()) + current.getCount()
+                current = current.getRight()
+            else:
+                current = current.getLeft()
+        return count
+
+    def count_range( self, lo, hi ) -> int:
+        """
+            Return how many values fall in [lo, hi].
 
-        Parameters:
-            node (TreeNode): The node to find the rank of.
+            Two descents count the values below each bound, so the AVLTree (whose subtree sizes
+            are augmented) answers in O(log n); the plain BST pays its subtree size lookups.
 
-        Returns:
-            int: The rank (number of nodes with value < input value).
-            :param node:
+            Parameters:
+                lo: The lower bound (inclusive).
+                hi: The upper bound (inclusive).
+
+            Returns:
+                int: The number of values (counts included) between the bounds.
+        """
+        if hi < lo:
+            return 0
+        return self._count_below(hi, inclusive=True) - self._count_below(lo)
+
+    def iter_range( self, lo, hi ):
         """
+            Lazily yield the nodes whose value falls in [lo, hi], in order.
 
-        def _os_rank( node: TreeNode, x: int ) -> int:
-            if node is None:
-                return 0
+            A multiset node is yielded once, its count tells how many values it holds.
 
-            if node.getValue() < x:
-                return 1 + _os_rank(node.getLeft(), x) + _os_rank(node.getRight(), x)
+            Parameters:
+                lo: The lower bound (inclusive).
+                hi: The upper bound (inclusive).
+
+            Yields:
+                TreeNode: The nodes in the range.
+        """
+        for node in self.iter_from(lo):
+            if hi < node.getValue():
+                return
+            yield node
+
+    def iter_ranks( self, k1: int, k2: int ):
+        """
+            Lazily yield the nodes ranked k1..k2 (1-based, inclusive), in order.
+
+            As with OSSelect, a multiset node is yielded once per rank it covers.
+
+            Parameters:
+                k1 (int): The first rank.
+                k2 (int): The last rank (ranks past the end are ignored).
+
+            Yields:
+                TreeNode: The node holding each rank.
+
+            Raises:
+                IndexError: If k1 is lower than 1.
+        """
+        return islice(self.iter_from_rank(k1), max(0, k2 - k1 + 1))
+
+
+    # In-order generators
+    @staticmethod
+    def _push_left( stack: list, node: TreeNode | None ) -> None:
+        while node is not None:
+            stack.append(node)
+            node = node.getLeft()
+
+    def _iter_subtree( self, node: TreeNode | None ):
+        """
+            Lazily yield the nodes of the subtree rooted at `node` in order.
+
+            The pending ancestors are kept on an explicit stack: memory is O(height) and each step
+            costs O(1) amortized, so no list of the whole tree is ever built.
+        """
+        stack = []
+        self._push_left(stack, node)
+        while stack:
+            node = stack.pop()
+            yield node
+            self._push_left(stack, node.getRight())
+
+    def __iter__(self):
+        """
+            Lazily yield the nodes of the tree in order (a multiset node once, with its count).
+        """
+        return self._iter_subtree(self.getRoot())
+
+    def iter_from( self, key ):
+        """
+            Lazily yield the nodes whose value is not less than `key`, in order.
+
+            The descent to the first such node keeps on the stack only the ancestors still to be
+            visited, then the walk goes on as `__iter__`.
+
+            Parameters:
+                key: The lower bound (inclusive).
+
+            Yields:
+                TreeNode: The nodes from the first value >= key to the end.
+        """
+        stack = []
+        current = self.getRoot()
+        while current is not None:
+            if current.getValue() < key:
+                current = current.getRight()
             else:
-                return _os_rank(node.getLeft(), x)
+                stack.append(current)
+                current = current.getLeft()
+
+        while stack:
+            node = stack.pop()
+            yield node
+            self._push_left(stack, node.getRight())
+
+    def iter_from_rank( self, k: int ):
+        """
+            Lazily yield the nodes from rank k (1-based) to the end, in order.
+
+            As with OSSelect, a multiset node is yielded once per rank it covers.
 
-        return _os_rank(self.__root, node.getValue())
\ No newline at end of file
+            Parameters:
+                k (int): The first rank.
+
+            Yields:
+                TreeNode: The node holding each rank.
+
+            Raises:
+                IndexError: If k is lower than 1.
+        """
+        if k < 1:
+            raise IndexError("Index must be >= 1")
+
+        stack = []
+        current = self.getRoot()
+        skip = 0
+        while current is not None:
+            left_size = self._subtree_size(current.getLeft())
+            if k <= left_size:
+                stack.append(current)
+                current = current.getLeft()
+            elif k <= left_size + current.getCount():
+                # Ranks of this node before k are not yielded
+                stack.append(current)
+                skip = k - left_size - 1
+                break
+            else:
+                k -= left_size + current.getCount()
+                current = current.getRight()
+
+        while stack:
+            node = stack.pop()
+            for _ in range(node.getCount() - skip):
+                yield node
+            skip = 0
+            self._push_left(stack, node.getRight())
@@ -0,0 +1,249 @@
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from DataStructure.OrderStatisticsStructure import OrderStatisticStructure
+from DataStructure.ReadWriteLock import ReadWriteLock
+
+if TYPE_CHECKING:
+    from DataStructure.FrozenSnapshot import FrozenSnapshot
+
+
+class ConcurrentStructure(OrderStatisticStructure):
+    """
+        ConcurrentStructure makes any order statistic structure safe for many reader threads and
+        writer threads, with one of two strategies:
+
+        - "lock": every query holds a ReadWriteLock as a reader, every update as the writer, so
+          queries run together but never while a rotation or a split rewrites the structure.
+          Queries must not write, so the writer fills the caches a query would fill lazily (the
+          prefix index of SortedBlockList, the size cache of BinarySearchTree) with refresh()
+          before releasing the lock.
+        - "snapshot": queries never lock. They read the last published FrozenSnapshot (see freeze),
+          which is immutable. Updates are queued and applied to the structure in batches of
+          `batch_size`, each batch then publishing a new snapshot with one reference swap.
+          Queries see the updates of committed batches only; commit() publishes the queue at once.
+
+        The facade speaks keys: OSSelect(None, i) returns the i-th key and OSRank takes a key,
+        whatever the wrapped structure returns (nodes, handles or keys). It only goes through the
+        key-level API of OrderStatisticStructure (insert, delete, select, rank_of, refresh), so any
+        backend works as is. The wrapped structure must only be used through the facade afterwards.
+
+        Attributes:
+            __structure (OrderStatisticStructure): The wrapped structure.
+            __mode (str): "lock" or "snapshot".
+            __lock (ReadWriteLock | None): The lock of the "lock" mode.
+            __write_lock (Lock | None): Serializes the writers of the "snapshot" mode.
+            __pending (list[tuple[str, Any]]): Queued updates ("insert" or "delete", key) of the "snapshot" mode.
+            __batch_size (int): Number of queued updates that triggers a commit.
+            __snapshot (FrozenSnapshot | None): The published snapshot of the "snapshot" mode.
+    """
+
+    MODES = ("lock", "snapshot")
+
+    def __init__( self, structure: OrderStatisticStructure, mode: str = "lock", batch_size: int = 1024 ):
+        if mode not in self.MODES:
+            raise ValueError(f"Mode must be one of {self.MODES}")
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        self.__structure = structure
+        self.__mode = mode
+        self.__batch_size = batch_size
+        self.__lock = ReadWriteLock() if mode == "lock" else None
+        self.__write_lock = Lock() if mode == "snapshot" else None
+        self.__pending = []
+        self.__snapshot = structure.freeze() if mode == "snapshot" else None
+        if mode == "lock":
+            structure.refresh()
+
+
+    def getStructure(self) -> OrderStatisticStructure:
+        return self.__structure
+
+    def getMode(self) -> str:
+        return self.__mode
+
+    def getBatchSize(self) -> int:
+        return self.__batch_size
+
+    def getSnapshot(self) -> "FrozenSnapshot | None":
+        return self.__snapshot
+
+    def getPendingCount(self) -> int:
+        return len(self.__pending)
+
+
+    def _apply( self, operation: str, key ) -> bool:
+        """
+            Apply one update to the wrapped structure.
+
+            Returns:
+                bool: False for the delete of a missing key, True otherwise.
+        """
+        if operation == "delete":
+            return self.__structure.delete(key)
+        self.__structure.insert(key)
+        return True
+
+    def _apply_all( self, operations: list[tuple[str, object]] ) -> list[bool | None]:
+        """
+            Apply updates in order; an update the structure rejects does not stop the others.
+
+            Returns:
+                list[bool | None]: The result of each update (see _apply), None when it was rejected.
+        """
+        results = []
+        for operation, key in operations:
+            try:
+                results.append(self._apply(operation, key))
+            except (NotImplementedError, ValueError):
+                results.append(None)
+        return results
+
+
+    # Updates
+    def insert( self, key ) -> None:
+        """
+            Insert a key (queued until the next commit in "snapshot" mode).
+        """
+        self._update("insert", key)
+
+    def delete( self, key ) -> bool | None:
+        """
+            Delete one occurrence of a key (queued until the next commit in "snapshot" mode).
+
+            Returns:
+                bool | None: Whether the key was found and removed, None when the delete was queued.
+
+            Raises:
+                NotImplementedError: If the wrapped structure has no delete ("lock" mode; a queued delete
+                    is rejected when its batch is committed, as in update_many).
+        """
+        return self._update("delete", key)
+
+    def _update( self, operation: str, key ) -> bool | None:
+        if self.__mode == "lock":
+            with self.__lock.writing():
+                try:
+                    return self._apply(operation, key)
+                finally:
+                    self.__structure.refresh()
+
+        with self.__write_lock:
+            self.__pending.append((operation, key))
+            if len(self.__pending) >= self.__batch_size:
+                self._commit()
+        return None
+
+    def update_many( self, operations: list[tuple[str, object]] ) -> list[bool | None]:
+        """
+            Apply many ("insert" | "delete", key) updates in order, as one batch.
+
+            In "lock" mode the writer lock is taken once for the whole batch; an update the structure
+            rejects (ValueError, NotImplementedError) does not stop the others. In "snapshot" mode the
+            updates are queued and committed together, so their results are not known yet.
+
+            Returns:
+                list[bool | None]: For each update, False for the delete of a missing key, True when it
+                    was applied, None when it was rejected or queued.
+        """
+        if self.__mode == "lock":
+            with self.__lock.writing():
+                results = self._apply_all(operations)
+                self.__structure.refresh()
+            return results
+
+        with self.__write_lock:
+            self.__pending.extend(operations)
+            if len(self.__pending) >= self.__batch_size:
+                self._commit()
+        return [None] * len(operations)
+
+    def commit(self) -> None:
+        """
+            Apply the queued updates and publish a new snapshot ("snapshot" mode; no-op in "lock" mode).
+        """
+        if self.__mode == "snapshot":
+            with self.__write_lock:
+                self._commit()
+
+    def _commit(self) -> None:
+        """
+            Apply the queued updates to the structure and publish its new snapshot; the write lock is held.
+        """
+        if not self.__pending:
+            return
+        self._apply_all(self.__pending)
+        self.__pending = []
+        self.__snapshot = self.__structure.freeze()
+
+
+    # Queries
+    def select( self, i: int ):
+        """
+            Return the i-th smallest key.
+
+            Raises:
+                IndexError: If i is out of range.
+        """
+        if self.__mode == "snapshot":
+            return self.__snapshot.select(i)
+
+        with self.__lock.reading():
+            return self.__structure.select(i)
+
+    def rank_of( self, key ) -> int | None:
+        return self.OSRank(key)
+
+    def select_many( self, ks: list[int] ) -> list:
+        """
+            Return the keys with ranks `ks` (1-based), all read from the same state of the structure.
+
+            Raises:
+                IndexError: If a rank is out of range.
+        """
+        if self.__mode == "snapshot":
+            return self.__snapshot.select_many(ks).tolist()
+
+        with self.__lock.reading():
+            return [self.__structure.select(k) for k in ks]
+
+    def rank_many( self, keys: list ) -> list[int | None]:
+        """
+            Return the ranks of `keys` (None for missing keys), all read from the same state of the structure.
+        """
+        if self.__mode == "snapshot":
+            return [rank or None for rank in self.__snapshot.rank_many(keys).tolist()]
+
+        with self.__lock.reading():
+            return [self.__structure.rank_of(key) for key in keys]
+
+
+    # Order Statistics Algorithm
+    def OSSelect( self, node, i: int ):
+        """
+            Return the i-th smallest key.
+
+            Parameters:
+                node (None): Unused, the facade speaks keys; kept for the common signature.
+                i (int): Index
+
+            Returns:
+                The corresponding key or None if out of bounds.
+        """
+        if self.__mode == "snapshot":
+            return self.__snapshot.OSSelect(None, i)
+
+        try:
+            return self.select(i)
+        except IndexError:
+            return None
+
+    def OSRank( self, x ) -> int | None:
+        """
+            Return the rank (1-based) of the key x, or None if it is not stored.
+        """
+        if self.__mode == "snapshot":
+            return self.__snapshot.OSRank(x)
+
+        with self.__lock.reading():
+            return self.__structure.rank_of(x)
@@ -0,0 +1,392 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice, repeat
+from math import ceil, floor
+from numbers import Integral
+from typing import TYPE_CHECKING
+
+from DataStructure.OrderStatisticsStructure import OrderStatisticStructure
+
+if TYPE_CHECKING:
+    from DataStructure.FrozenSnapshot import FrozenSnapshot
+
+
+class FenwickTree(OrderStatisticStructure):
+    """
+        FenwickTree (binary indexed tree) implements an order statistic structure for integer keys
+        from a known bounded universe.
+
+        Instead of one object per key it keeps a count per possible key in flat array('q') buffers:
+        the multiplicity of each key and the Fenwick partial sums over those counts. Insert, delete
+        and rank walk O(log U) partial sums, select descends them by binary lifting in O(log U),
+        where U is the size of the universe. Duplicates are counted.
+
+        The universe is either the integer range [low, high], or, for sparse keys, an explicit
+        sorted list of coordinates (coordinate compression): a key is then mapped to its index
+        in the list by bisect.
+
+        OSSelect returns keys (there are no nodes) and OSRank takes a key.
+
+        Attributes:
+            __low (int): Smallest key of an integer range universe.
+            __coordinates (list[int] | None): Sorted distinct keys of a compressed universe, None for a range.
+            __size (int): Number of keys in the universe.
+            __tree (array): Fenwick partial sums, 1-based (slot 0 is unused).
+            __counts (array): Multiplicity of each key, 1-based.
+            __step (int): Largest power of two not greater than the universe size, for binary lifting.
+            __length (int): Number of stored keys (duplicates included).
+    """
+
+    def __init__( self, low: int = 0, high: int | None = None, coordinates = None ):
+        if coordinates is not None:
+            self.__coordinates = sorted(set(coordinates))
+            self.__low = 0
+            size = len(self.__coordinates)
+        else:
+            if high is None or high < low:
+                raise ValueError("The universe needs bounds low <= high, or coordinates")
+            self.__coordinates = None
+            self.__low = low
+            size = high - low + 1
+
+        self.__size = size
+        self.__tree = array('q', bytes(8 * (size + 1)))
+        self.__counts = array('q', bytes(8 * (size + 1)))
+        self.__step = 1 << (size.bit_length() - 1) if size else 0
+        self.__length = 0
+
+    @classmethod
+    def from_numpy( cls, keys, low: int | None = None, high: int | None = None, compress: bool = False ) -> "FenwickTree":
+        """
+            Build the tree from a NumPy array of integer keys in O(n + U) vectorized operations.
+
+            The counts come from np.bincount and the partial sums from a cumulative sum:
+            tree[i] = prefix[i] - prefix[i - lowbit(i)] for every slot at once.
+
+            Parameters:
+                keys (numpy.ndarray): The integer keys to store.
+                low (int, optional): Smallest key of the universe. Defaults to the smallest key.
+                high (int, optional): Largest key of the universe. Defaults to the largest key.
+                compress (bool): Use the distinct keys as a compressed universe instead of [low, high].
+
+            Returns:
+                FenwickTree: The new tree (empty for empty keys, on [low, high] when both are given).
+
+            Raises:
+                ValueError: If the keys are not integers, are outside of [low, high], or if low / high
+                    are given with compress (the compressed universe is the distinct keys).
+        """
+        import numpy as np
+
+        if compress and (low is not None or high is not None):
+            raise ValueError("low and high bound a range universe, they cannot be used with compress")
+        keys = np.asarray(keys)
+        if not keys.size:
+            return cls(low, high) if low is not None and high is not None else cls(coordinates=[])
+        if not np.issubdtype(keys.dtype, np.integer):
+            raise ValueError(f"Keys must be integers, not {keys.dtype}")
+
+        keys = keys.astype(np.int64, copy=False)
+        if compress:
+            coordinates = np.unique(keys)
+            tree = cls(coordinates=coordinates.tolist())
+            indexes = np.searchsorted(coordinates, keys) + 1
+        else:
+            low = int(keys.min()) if low is None else low
+            high = int(keys.max()) if high is None else high
+            if (keys.min() < low or keys.max() > high):
+                raise ValueError("Keys outside of the universe")
+            tree = cls(low, high)
+            indexes = keys - low + 1
+
+        size = tree.__size
+        counts = np.bincount(indexes, minlength=size + 1).astype(np.int64)
+        prefix = np.cumsum(counts)
+        slots = np.arange(1, size + 1)
+        partial = np.zeros(size + 1, dtype=np.int64)
+        partial[1:] = prefix[slots] - prefix[slots - (slots & -slots)]
+
+        tree.__counts = array('q', counts.tobytes())
+        tree.__tree = array('q', partial.tobytes())
+        tree.__length = int(keys.size)
+        return tree
+
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def getUniverseSize(self) -> int:
+        return self.__size
+
+    def isCompressed(self) -> bool:
+        return self.__coordinates is not None
+
+    def __str__(self) -> str:
+        return " -> ".join(str(key) for key in self)
+
+
+    def _index( self, key: int ) -> int | None:
+        """
+            Return the 1-based slot of a key, or None if the key is outside the universe.
+
+            Raises:
+                ValueError: If the key is not an integer.
+        """
+        if not isinstance(key, Integral):
+            raise ValueError(f"Keys must be integers, not {type(key).__name__}")
+        if self.__coordinates is None:
+            index = key - self.__low + 1
+            return index if 1 <= index <= self.__size else None
+        index = bisect_left(self.__coordinates, key)
+        if index < self.__size and self.__coordinates[index] == key:
+            return index + 1
+        return None
+
+    def _key( self, index: int ) -> int:
+        if self.__coordinates is None:
+            return index + self.__low - 1
+        return self.__coordinates[index - 1]
+
+    def _add( self, index: int, delta: int ) -> None:
+        tree, size = self.__tree, self.__size
+        while index <= size:
+            tree[index] += delta
+            index += index & -index
+
+    def _prefix( self, index: int ) -> int:
+        """
+            Return the number of stored keys in slots 1..index.
+        """
+        tree = self.__tree
+        total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+
+    def insert( self, key: int ) -> None:
+        """
+            Count one more occurrence of a key.
+
+            Parameters:
+                key (int): The value to insert.
+
+            Raises:
+                ValueError: If the key is not an integer or is outside the universe.
+        """
+        index = self._index(key)
+        if index is None:
+            raise ValueError(f"Key {key} is outside the universe")
+        self.__counts[index] += 1
+        self._add(index, 1)
+        self.__length += 1
+
+    def delete( self, key: int ) -> bool:
+        """
+            Remove one occurrence of a key.
+
+            Parameters:
+                key (int): The value to remove.
+
+            Returns:
+                bool: True if the key was found and removed.
+
+            Raises:
+                ValueError: If the key is not an integer.
+        """
+        index = self._index(key)
+        if index is None or self.__counts[index] == 0:
+            return False
+        self.__counts[index] -= 1
+        self._add(index, -1)
+        self.__length -= 1
+        return True
+
+
+    def find( self, key: int ) -> int | None:
+        """
+            Return the key if it is stored, or None.
+        """
+        return key if key in self else None
+
+    def __contains__( self, key: int ) -> bool:
+        index = self._index(key)
+        return index is not None and self.__counts[index] > 0
+
+    def getCount( self, key: int ) -> int:
+        """
+            Return the multiplicity of a key (0 if it is not stored or outside the universe).
+        """
+        index = self._index(key)
+        return self.__counts[index] if index is not None else 0
+
+    def rank_of( self, key: int ) -> int | None:
+        """
+            Return the rank (1-based) of the first copy of `key`, in O(log U).
+
+            Parameters:
+                key (int): The value whose rank we want to find.
+
+            Returns:
+                int | None: The rank of the key, or None if the key is not stored.
+        """
+        index = self._index(key)
+        if index is None or self.__counts[index] == 0:
+            return None
+        return self._prefix(index - 1) + 1
+
+    def count_range( self, lo: int, hi: int ) -> int:
+        """
+            Return how many keys fall in [lo, hi], with two prefix sums.
+        """
+        if hi < lo:
+            return 0
+        return self._prefix(self._slots_up_to(hi)) - self._prefix(self._slots_below(lo))
+
+    def _slots_below( self, key: int ) -> int:
+        """
+            Return the number of universe slots whose key is less than `key`.
+        """
+        if self.__coordinates is None:
+            return min(max(ceil(key) - self.__low, 0), self.__size)
+        return bisect_left(self.__coordinates, key)
+
+    def _slots_up_to( self, key: int ) -> int:
+        """
+            Return the number of universe slots whose key is not greater than `key`.
+        """
+        if self.__coordinates is None:
+            return min(max(floor(key) - self.__low + 1, 0), self.__size)
+        return bisect_right(self.__coordinates, key)
+
+
+    # In-order generators
+    def _walk( self, index: int, skip: int = 0 ):
+        """
+            Yield the stored keys from slot `index` on, each repeated by its count, skipping `skip` copies of the first.
+
+            The scan visits every slot of the universe after `index`, so it costs O(U) for a full pass.
+        """
+        counts = self.__counts
+        for slot in range(index, self.__size + 1):
+            count = counts[slot] - skip
+            skip = 0
+            if count > 0:
+                yield from repeat(self._key(slot), count)
+
+    def __iter__(self):
+        """
+            Lazily yield the stored keys in order (duplicates repeated).
+        """
+        return self._walk(1)
+
+    def freeze(self) -> "FrozenSnapshot":
+        """
+            Return an immutable NumPy snapshot of the keys, in order, for vectorized select / rank.
+
+            The keys are expanded from the count buffer with np.repeat, without a Python loop.
+
+            Returns:
+                FrozenSnapshot: The snapshot of the current keys.
+        """
+        import numpy as np
+        from DataStructure.FrozenSnapshot import FrozenSnapshot
+
+        counts = np.frombuffer(self.__counts, dtype=np.int64)[1:]
+        if self.__coordinates is None:
+            keys = np.arange(self.__low, self.__low + self.__size, dtype=np.int64)
+        else:
+            keys = np.asarray(self.__coordinates, dtype=np.int64)
+        return FrozenSnapshot(np.repeat(keys, counts))
+
+    def iter_from( self, key: int ):
+        """
+            Lazily yield the stored keys not less than `key`, in order.
+        """
+        return self._walk(self._slots_below(key) + 1)
+
+    def iter_from_rank( self, k: int ):
+        """
+            Lazily yield the stored keys from rank k (1-based) to the end, in order.
+
+            Raises:
+                IndexError: If k is lower than 1.
+        """
+        if k < 1:
+            raise IndexError("Index must be >= 1")
+        if k > self.__length:
+            return iter(())
+        index = self._lift(k)
+        return self._walk(index, k - self._prefix(index - 1) - 1)
+
+    def iter_range( self, lo: int, hi: int ):
+        """
+            Lazily yield the stored keys in [lo, hi], in order.
+        """
+        for key in self.iter_from(lo):
+            if hi < key:
+                return
+            yield key
+
+    def iter_ranks( self, k1: int, k2: int ):
+        """
+            Lazily yield the stored keys ranked k1..k2 (1-based, inclusive), in order.
+        """
+        return islice(self.iter_from_rank(k1), max(0, k2 - k1 + 1))
+
+
+    # Order Statistics Algorithm
+    def _lift( self, i: int ) -> int:
+        """
+            Return the slot holding rank i (valid), descending the partial sums by binary lifting.
+        """
+        tree, size = self.__tree, self.__size
+        position = 0
+        step = self.__step
+        while step:
+            following = position + step
+            if following <= size and tree[following] < i:
+                position = following
+                i -= tree[following]
+            step >>= 1
+        return position + 1
+
+    def OSSelect( self, node, i: int ) -> int | None:
+        """
+            Return the i-th smallest key by binary lifting over the partial sums, in O(log U).
+
+            Parameters:
+                node (None): Unused, the structure has no nodes; kept for the common signature.
+                i (int): Index
+
+            Returns:
+                int | None: The corresponding key or None if out of bounds.
+        """
+        if i < 1 or i > self.__length:
+            return None
+        return self._key(self._lift(i))
+
+    def select( self, i: int ):
+        """
+            Return the key of rank i (OSSelect returns keys already).
+
+            Raises:
+                IndexError: If i is out of bounds.
+        """
+        key = self.OSSelect(None, i)
+        if key is None:
+            raise IndexError("Index out of range")
+        return key
+
+    def OSRank( self, x: int ) -> int | None:
+        """
+            Return the rank (1-based) of the key x (of its first copy with duplicates).
+
+            Parameters:
+                x (int): The key whose rank we want to find.
+
+            Returns:
+                int | None: The rank of the key, or None if it is not stored.
+        """
+        return self.rank_of(x)
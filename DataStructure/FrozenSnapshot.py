@@ -0,0 +1,159 @@
+import numpy as np
+
+from DataStructure.Node.Node import Node
+from DataStructure.OrderStatisticsStructure import OrderStatisticStructure
+
+
+class FrozenSnapshot(OrderStatisticStructure):
+    """
+        FrozenSnapshot is an immutable copy of the keys of an order statistic structure, in order,
+        in one contiguous NumPy array.
+
+        It answers whole arrays of queries at once: select_many(ks) by fancy indexing and
+        rank_many(keys) by np.searchsorted, so the per-query cost is a few machine instructions
+        instead of a Python descent. Backends create it with freeze(); later updates of the live
+        structure are not reflected. Duplicates are repeated in the array, so ranks follow the first copy
+        as in the live structures.
+
+        Attributes:
+            __keys (numpy.ndarray): The keys in ascending order (read-only).
+    """
+
+    def __init__( self, keys ):
+        array = self._as_array(keys)
+        array.setflags(write=False)
+        self.__keys = array
+
+    @classmethod
+    def from_counts( cls, keys: list, counts: list[int] ) -> "FrozenSnapshot":
+        """
+            Build a snapshot from distinct keys in order and their multiplicities.
+
+            Parameters:
+                keys (list): The distinct keys, in ascending order.
+                counts (list[int]): The multiplicity of each key.
+
+            Returns:
+                FrozenSnapshot: The new snapshot.
+        """
+        return cls(np.repeat(cls._as_array(keys), counts))
+
+    @classmethod
+    def from_items( cls, items ) -> "FrozenSnapshot":
+        """
+            Build a snapshot from the in-order iteration of a structure: a node gives its value,
+            repeated by its count in multiset mode; any other item is a key.
+
+            Parameters:
+                items (Iterable[Node | Any]): The nodes or keys, in ascending order.
+
+            Returns:
+                FrozenSnapshot: The new snapshot.
+        """
+        keys, counts = [], []
+        for item in items:
+            if isinstance(item, Node):
+                keys.append(item.getValue())
+                counts.append(item.getCount())
+            else:
+                keys.append(item)
+                counts.append(1)
+        return cls.from_counts(keys, counts)
+
+    @staticmethod
+    def _as_array( values ) -> np.ndarray:
+        """
+            Return the values as a one-dimensional array; keys that NumPy would unpack (e.g. tuples,
+            of any lengths) are kept as Python objects, compared with their own operators.
+        """
+        try:
+            array = np.asarray(values)
+        except ValueError:
+            # Sequences of different lengths have no common shape
+            array = None
+        if array is None or array.ndim != 1:
+            array = np.fromiter(values, dtype=object, count=len(values))
+        return array
+
+
+    def getKeys(self) -> np.ndarray:
+        return self.__keys
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __iter__(self):
+        return iter(self.__keys)
+
+
+    def select_many( self, ks ) -> np.ndarray:
+        """
+            Return the keys with ranks `ks` (1-based), for a whole array of ranks at once.
+
+            Parameters:
+                ks (array-like of int): The requested ranks, in any order.
+
+            Returns:
+                numpy.ndarray: The selected keys, in the order of `ks`.
+
+            Raises:
+                IndexError: If a rank is outside [1, len(snapshot)].
+        """
+        ks = np.asarray(ks, dtype=np.int64)
+        if ks.size and (ks.min() < 1 or ks.max() > len(self.__keys)):
+            raise IndexError("Index out of range")
+        return self.__keys[ks - 1]
+
+    def rank_many( self, keys ) -> np.ndarray:
+        """
+            Return the ranks (1-based) of `keys`, for a whole array of keys at once.
+
+            Parameters:
+                keys (array-like): The keys to rank, in any order.
+
+            Returns:
+                numpy.ndarray: The rank of the first copy of each key, 0 for keys not in the snapshot.
+        """
+        stored = self.__keys
+        queries = self._as_array(keys)
+        positions = np.searchsorted(stored, queries, side="left")
+        if not len(stored):
+            return np.zeros(positions.shape, dtype=np.int64)
+        found = (positions < len(stored)) & (stored[np.minimum(positions, len(stored) - 1)] == queries)
+        return np.where(found, positions + 1, 0)
+
+
+    # Order Statistics Algorithm
+    def OSSelect( self, node, i: int ):
+        """
+            Return the i-th smallest key, or None if out of bounds.
+
+            Parameters:
+                node (None): Unused, the snapshot has no nodes; kept for the common signature.
+                i (int): Index
+        """
+        if i < 1 or i > len(self.__keys):
+            return None
+        # tolist() converts NumPy scalars back to Python keys
+        return self.__keys[i - 1:i].tolist()[0]
+
+    def select( self, i: int ):
+        """
+            Return the i-th smallest key.
+
+            Raises:
+                IndexError: If i is outside [1, len(snapshot)].
+        """
+        if i < 1 or i > len(self.__keys):
+            raise IndexError("Index out of range")
+        return self.OSSelect(None, i)
+
+    def rank_of( self, key ) -> int | None:
+        return self.OSRank(key)
+
+    def OSRank( self, x ) -> int | None:
+        """
+            Return the rank (1-based) of the key x (of its first copy), or None if it is not stored.
+        """
+        rank = int(self.rank_many([x])[0])
+        return rank if rank else None
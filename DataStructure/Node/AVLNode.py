@@ -6,11 +6,10 @@ class AVLNode(TreeNode):
     """
         AVLNode class to represent a TreeNode but has a height and size to build AVL Data Structure
     """
+    __slots__ = ("__height", "__size")
 
     def __init__(self, value: int, left_node: Node = None, right_node: Node = None):
-        super().__init__(value)
-        self.__left_node = left_node
-        self.__right_node = right_node
+        super().__init__(value, left_node, right_node)
         # Height of the subtree rooted in the node
         self.__height = 1
         # Number of nodes of the subtree rooted in the node
@@ -0,0 +1,41 @@
+class BPlusNode:
+    """
+        BPlusNode class to represent a node of a counted B+-tree.
+
+        Unlike the binary nodes it holds many keys in one compact list. A leaf stores the keys
+        themselves and a link to the next leaf; an internal node stores the separator keys, its
+        children and the cumulative child counts: counts[j] is the number of keys in the subtrees
+        of children 0..j, so a rank is located with a single bisect.
+        The lists are returned as they are, so the tree updates them in place with one call per level.
+    """
+    __slots__ = ("__keys", "__children", "__counts", "__next")
+
+    def __init__( self, keys: list = None, children: list = None, counts: list = None ):
+        self.__keys = keys if keys is not None else []
+        self.__children = children
+        self.__counts = counts
+        self.__next = None
+
+    def isLeaf(self) -> bool:
+        return self.__children is None
+
+    def getKeys(self) -> list:
+        return self.__keys
+
+    def getChildren(self) -> list | None:
+        return self.__children
+
+    def getCounts(self) -> list[int] | None:
+        return self.__counts
+
+    def getNext(self) -> "BPlusNode":
+        return self.__next
+
+    def setNext( self, next_node: "BPlusNode" ):
+        self.__next = next_node
+
+    def size(self) -> int:
+        """
+            Return the number of keys stored in the subtree rooted at this node.
+        """
+        return len(self.__keys) if self.__children is None else self.__counts[-1]
@@ -5,6 +5,7 @@ class ListNode(Node):
     """
         ListNode class to represent a Node but has a next node "pointer"
     """
+    __slots__ = ("__next",)
 
     def __init__( self, value: int, next_node: Node = None ):
         super().__init__(value)
@@ -1,25 +1,60 @@
+import copyreg
+from functools import cache
+
 
 class Node:
     """
-        Class to represent a Node that stores an integer value.
+        Class to represent a Node that stores a key value.
+
+        The value can be any totally ordered key (int, float, str, tuple, datetime...); it is stored
+        as is, so int keys keep the native int comparisons.
+
+        Nodes use __slots__ instead of a per-instance __dict__: with 10^6 nodes per structure
+        the dictionaries would dominate memory usage. For the same reason a plain node has a count
+        of 1 and no payload without storing them; the structures that need either use a subclass
+        from `variant`, which adds the slot:
+        the count is the multiplicity of the value when a structure works as a multiset,
+        the payload is the record the key was extracted from, when a structure has a key function.
     """
-    def __init__( self, value: int ):
-        self.__set_value(value)
+    __slots__ = ("__value",)
+
+    def __init__( self, value ):
+        self.__value = value
 
     def __str__(self):
         return "Node Value:" + str(self.__value)
 
-    def __set_value( self, value: int ):
-        if not isinstance(value, int):
-            raise ValueError("Value must be int")
+    def setValue( self, value ):
         self.__value = value
 
-    def setValue( self, value: int ):
-        self.__set_value(value)
-
     def getValue(self):
         return self.__value
 
+    def getPayload(self):
+        return None
+
+    def getCount(self) -> int:
+        return 1
+
+    @classmethod
+    def variant( cls, counted: bool = False, keyed: bool = False ) -> type:
+        """
+            Return the subclass of this node class with a count slot and/or a payload slot.
+
+            Parameters:
+                counted (bool): Whether nodes need setCount (multiset mode).
+                keyed (bool): Whether nodes need setPayload (key function).
+
+            Returns:
+                type: The node class to instantiate (this class when neither is needed).
+        """
+        node_class = cls
+        if counted:
+            node_class = _counted(node_class)
+        if keyed:
+            node_class = _keyed(node_class)
+        return node_class
+
     # Enables intuitive comparison between Node instances using <, >, and == operators
     def __lt__( self, other ):
         if other is None:
@@ -59,4 +94,62 @@ class Node:
 
         if isinstance(other, Node):
             return self.__value == other.__value
-        return NotImplemented
\ No newline at end of file
+        return NotImplemented
+
+
+class _NodeVariant(type):
+    """
+        Metaclass of the classes built by `variant`. They are not module attributes, so pickle
+        stores them as the call that builds them again (see _reduce_variant).
+    """
+
+
+def _reduce_variant( node_class: _NodeVariant ):
+    return node_class._variant_builder, (node_class.__base__,)
+
+
+copyreg.pickle(_NodeVariant, _reduce_variant)
+
+
+@cache
+def _counted( base: type ) -> type:
+    class CountedNode(base, metaclass=_NodeVariant):
+        __slots__ = ("__count",)
+
+        def __init__( self, *args, **kwargs ):
+            super().__init__(*args, **kwargs)
+            self.__count = 1
+
+        def getCount(self) -> int:
+            return self.__count
+
+        def setCount( self, count: int ):
+            self.__count = count
+
+    # copy and pickle mangle the slot names with __name__: list them before the rename
+    CountedNode.__slotnames__ = copyreg._slotnames(base) + ["_CountedNode__count"]
+    CountedNode.__name__ = CountedNode.__qualname__ = "Counted" + base.__name__
+    CountedNode._variant_builder = _counted
+    return CountedNode
+
+
+@cache
+def _keyed( base: type ) -> type:
+    class KeyedNode(base, metaclass=_NodeVariant):
+        __slots__ = ("__payload",)
+
+        def __init__( self, *args, **kwargs ):
+            super().__init__(*args, **kwargs)
+            self.__payload = None
+
+        def getPayload(self):
+            return self.__payload
+
+        def setPayload( self, payload ):
+            self.__payload = payload
+
+    # copy and pickle mangle the slot names with __name__: list them before the rename
+    KeyedNode.__slotnames__ = copyreg._slotnames(base) + ["_KeyedNode__payload"]
+    KeyedNode.__name__ = KeyedNode.__qualname__ = "Keyed" + base.__name__
+    KeyedNode._variant_builder = _keyed
+    return KeyedNode
@@ -0,0 +1,34 @@
+from DataStructure.Node.Node import Node
+
+
+class SkipListNode(Node):
+    """
+        SkipListNode class to represent a Node with one forward "pointer" per level to build a Skip List.
+
+        Each forward pointer also stores its span: the number of level-0 steps it skips,
+        which is what makes rank and select logarithmic.
+    """
+    __slots__ = ("__forward", "__span")
+
+    def __init__( self, value: int, level: int ):
+        super().__init__(value)
+        self.__forward = [None] * level
+        self.__span = [0] * level
+
+    def getLevel(self) -> int:
+        return len(self.__forward)
+
+    def getForward( self, level: int ) -> "SkipListNode":
+        return self.__forward[level]
+
+    def setForward( self, level: int, node: "SkipListNode" ):
+        self.__forward[level] = node
+
+    def getSpan( self, level: int ) -> int:
+        return self.__span[level]
+
+    def setSpan( self, level: int, span: int ):
+        self.__span[level] = span
+
+    def getNext(self) -> "SkipListNode":
+        return self.__forward[0]
@@ -0,0 +1,23 @@
+from DataStructure.Node.ListNode import ListNode
+
+
+class StampedListNode(ListNode):
+    """
+        StampedListNode class to represent a ListNode that also carries a rank stamp,
+        i.e. its rank in its list, kept exact by the list's inserts, and the list it belongs to.
+    """
+    __slots__ = ("__stamp", "__owner")
+
+    def __init__( self, value: int, next_node: ListNode = None, stamp: int = 0, owner = None ):
+        super().__init__(value, next_node)
+        self.__stamp = stamp
+        self.__owner = owner
+
+    def getStamp(self) -> int:
+        return self.__stamp
+
+    def setStamp( self, stamp: int ):
+        self.__stamp = stamp
+
+    def getOwner(self):
+        return self.__owner
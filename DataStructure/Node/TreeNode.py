@@ -5,6 +5,7 @@ class TreeNode(Node):
     """
         TreeNode class to represent a Node but has a left node and right node "pointers" to build Tree Data Structure
     """
+    __slots__ = ("__left_node", "__right_node", "__parent")
 
     def __init__( self, value: int , left_node: Node = None, right_node: Node = None ):
         super().__init__(value)
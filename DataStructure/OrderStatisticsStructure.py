@@ -1,13 +1,75 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from DataStructure.Node.Node import Node
 
+if TYPE_CHECKING:
+    from DataStructure.FrozenSnapshot import FrozenSnapshot
+
 
 class OrderStatisticStructure(ABC):
+    """
+        Common contract of the order statistic structures.
+
+        Keys can be any totally ordered type: every stored key must be comparable with the others
+        through <, <= and ==. Structures accepting a `key` function store `key(item)` as the node
+        value and the item itself as the node payload; lookups by key (delete, OSRank_many...)
+        take keys, not items. Ranks are 1-based.
+
+        Besides the node-level OSSelect / OSRank, every structure speaks keys through insert(key),
+        delete(key), select(i) and rank_of(key), so callers (e.g. ConcurrentStructure) never need to
+        know whether a backend returns nodes, handles or keys.
+    """
+
+    def insert( self, key ):
+        """
+            Insert a key (an item, for structures with a key function).
+
+            Raises:
+                NotImplementedError: If the structure is read-only.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support insert")
+
+    def delete( self, key ) -> bool:
+        """
+            Delete one occurrence of a key.
+
+            Returns:
+                bool: True if an occurrence was removed, False if the key is not stored.
+
+            Raises:
+                NotImplementedError: If the structure has no delete.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support delete")
+
+    @abstractmethod
+    def select( self, i: int ):
+        """
+            Return the key of rank i.
+
+            Raises:
+                IndexError: If i is outside [1, number of keys].
+        """
+        pass
+
+    @abstractmethod
+    def rank_of( self, key ) -> int | None:
+        """
+            Return the rank of a key (of its first copy), or None if it is not stored.
+        """
+        pass
+
+    def refresh(self) -> None:
+        """
+            Fill now the caches the queries would otherwise fill lazily, so that the queries that follow,
+            until the next update, only read the structure. No-op for the structures without such caches.
+        """
+        pass
+
     @abstractmethod
     def OSSelect( self, node: Node, i: int ) -> Node:
         """
-            Returns the i-th element in order
+            Returns the i-th element in key order
         """
         pass
 
@@ -16,4 +78,19 @@ class OrderStatisticStructure(ABC):
         """
             Returns the rank (position) of element x
         """
-        pass
\ No newline at end of file
+        pass
+
+    def freeze(self) -> "FrozenSnapshot":
+        """
+            Return an immutable NumPy snapshot of the keys, in order, for vectorized select / rank.
+
+            The snapshot is built from the in-order iteration of the structure (see
+            FrozenSnapshot.from_items). NumPy is only imported here, so the live structures
+            do not depend on it.
+
+            Returns:
+                FrozenSnapshot: The snapshot of the current keys.
+        """
+        from DataStructure.FrozenSnapshot import FrozenSnapshot
+
+        return FrozenSnapshot.from_items(self)
@@ -1,7 +1,13 @@
+import sys
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from math import isqrt
 from typing import Any
 
 from DataStructure.Node.Node import Node
 from DataStructure.Node.ListNode import ListNode
+from DataStructure.Node.StampedListNode import StampedListNode
+from DataStructure.OrderedListCursor import OrderedListCursor
 from DataStructure.OrderStatisticsStructure import OrderStatisticStructure
 
 
@@ -11,49 +17,200 @@ class OrderedList(OrderStatisticStructure):
         maintaining the elements in ascending order by value.
 
         Each element of the OrderedList is itself an instance of OrderedList.
+
+        Attributes:
+            __head (ListNode): The first node of the list.
+            __version (int): Incremented by every insert, so cursors can detect stale positions.
+            __length (int): Number of values in the list (node counts included).
+            __index_stride (int | str | None): Sampling stride of the express lane index,
+                "sqrt" to follow the square root of the length, None when the index is disabled.
+            __lane_nodes (list[ListNode]): Sampled nodes of the express lane, in list order.
+            __lane_ranks (list[int]): Rank of each sampled node.
+            __rank_stamps (bool): Whether nodes are StampedListNode carrying their exact rank.
+            __multiset (bool): Whether equal values share one node with a count instead of one node each.
+            __key (Callable | None): Function extracting the key of an inserted item, which is then kept
+                as the node payload. None stores the inserted values themselves as keys.
+            __node_class (type): The ListNode (or StampedListNode) variant instantiated, with a count and / or payload slot only when the mode needs it.
+
+        Ranks always count values: in multiset mode a node with count c covers c consecutive ranks,
+        and its own rank is the first of them.
     """
 
-    def __init__(self):
+    def __init__( self, index_stride: int | str | None = None, rank_stamps: bool = False, multiset: bool = False, key = None ):
+        if index_stride is not None and index_stride != "sqrt" and (not isinstance(index_stride, int) or index_stride < 1):
+            raise ValueError("Index stride must be a positive integer, 'sqrt' or None")
+
         self.__head = None
+        self.__version = 0
+        self.__length = 0
+        self.__index_stride = index_stride
+        self.__lane_nodes = []
+        self.__lane_ranks = []
+        self.__rank_stamps = rank_stamps
+        self.__multiset = multiset
+        self.__key = key
+        self.__node_class = (StampedListNode if rank_stamps else ListNode).variant(counted=multiset, keyed=key is not None)
 
 
     def getHead(self) -> ListNode:
         return self.__head
 
+    def getVersion(self) -> int:
+        return self.__version
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def getIndexStride(self) -> int | None:
+        """
+            Return the current sampling stride of the express lane index (None if disabled).
+        """
+        if self.__index_stride == "sqrt":
+            return max(2, isqrt(self.__length))
+        return self.__index_stride
+
+    def getIndexSize(self) -> int:
+        return len(self.__lane_nodes)
+
+    def getIndexMemoryUsage(self) -> int:
+        """
+            Return the bytes used by the express lane index (the sampled nodes belong to the list).
+        """
+        return (sys.getsizeof(self.__lane_nodes) + sys.getsizeof(self.__lane_ranks)
+                + sum(sys.getsizeof(rank) for rank in self.__lane_ranks))
 
-    def insert( self, value: int ) -> None:
+    def cursor( self, max_fingers: int = 8 ) -> OrderedListCursor:
+        """
+            Return a rank cursor for sequential or near-sequential OSSelect access.
+
+            Parameters:
+                max_fingers (int): Maximum number of cached positions kept by the cursor.
+
+            Returns:
+                OrderedListCursor: A new cursor positioned on the head.
+        """
+        return OrderedListCursor(self, max_fingers)
+
+
+    def insert( self, value ) -> None:
         """
             Insert a new node into the ordered list, maintaining ascending order.
 
             The method creates a new ListNode from the provided Node's value and inserts it
             at the correct position so that the list remains sorted in ascending order.
+            With the express lane index enabled, the walk starts from the last sampled node
+            not greater than the value instead of the head. With rank stamps enabled, the new node
+            is stamped with its position and the nodes after it are restamped (see _update_stamps).
+            In multiset mode an equal value increments the count of its node instead.
 
             Parameters:
-                value (int): The value to insert as ListNode
-
-            Raises:
-                TypeError: If new_node is not an instance of Node.
+                value: The value to insert as ListNode (an item whose key is `key(value)` with a key function)
 
             Returns:
                 None
         """
-
-        if not isinstance(value, int):
-            raise TypeError("Value must be Integer")
-
-        new_list_node = ListNode(value)
+        item = value
+        if self.__key is not None:
+            value = self.__key(item)
+
+        new_list_node = self.__node_class(value, owner=self) if self.__rank_stamps else self.__node_class(value)
+        if self.__key is not None:
+            new_list_node.setPayload(item)
+        self.__version += 1
+        self.__length += 1
+
+        if self.__multiset and self.__head is not None and self.__head.getValue() == value:
+            self.__head.setCount(self.__head.getCount() + 1)
+            self._update_index(-1)
+            self._update_stamps(self.__head.getNext())
+            return
 
         if self.__head is None or new_list_node <= self.__head:
             new_list_node.setNext(self.__head)
             self.__head = new_list_node
+            self._update_index(-1)
+            self._update_stamps(new_list_node.getNext(), new_list_node, 1)
             return
 
+        lane = -1
         current = self.__head
+        position = 1
+        if self.__lane_nodes:
+            lane = bisect_right(self.__lane_nodes, value, key=ListNode.getValue) - 1
+            if lane >= 0:
+                current, position = self.__lane_nodes[lane], self.__lane_ranks[lane]
+
         while current.getNext() is not None and current.getNext() <= new_list_node:
+            position += current.getCount()
             current = current.getNext()
 
+        if self.__multiset and current.getValue() == value:
+            current.setCount(current.getCount() + 1)
+            self._update_index(lane)
+            self._update_stamps(current.getNext())
+            return
+
         new_list_node.setNext(current.getNext())
         current.setNext(new_list_node)
+        self._update_index(lane)
+        self._update_stamps(new_list_node.getNext(), new_list_node, position + current.getCount())
+
+
+    def _update_stamps( self, shifted: StampedListNode | None, node: StampedListNode | None = None,
+                        position: int = 0 ) -> None:
+        """
+            Keep every stamp equal to the rank of its node after an insert: stamp the new node, then
+            move the nodes after the added value one rank further. This walks the rest of the list,
+            O(n) like the walk of insert without the express lane, so that OSRank is O(1).
+
+            Parameters:
+                shifted (StampedListNode | None): The first node after the added value.
+                node (StampedListNode | None): The new node, None when only a count grew.
+                position (int): The rank of the new node.
+        """
+        if not self.__rank_stamps:
+            return
+        if node is not None:
+            node.setStamp(position)
+        while shifted is not None:
+            shifted.setStamp(shifted.getStamp() + 1)
+            shifted = shifted.getNext()
+
+
+    def _update_index( self, lane: int ) -> None:
+        """
+            Update the express lane after a node was inserted right after sample `lane`
+            (or before every sample when lane is -1).
+
+            Samples after the new node move one rank forward; if the gap that received the node
+            grew past twice the stride, a new sample is taken about `stride` ranks after its start.
+
+            Parameters:
+                lane (int): Index of the last sample preceding the new node, -1 if none.
+        """
+        stride = self.getIndexStride()
+        if stride is None:
+            return
+
+        ranks = self.__lane_ranks
+        for k in range(lane + 1, len(ranks)):
+            ranks[k] += 1
+
+        if lane >= 0:
+            start, start_rank = self.__lane_nodes[lane], ranks[lane]
+        else:
+            start, start_rank = self.__head, 1
+        end_rank = ranks[lane + 1] if lane + 1 < len(ranks) else self.__length + 1
+
+        if end_rank - start_rank > 2 * stride:
+            rank = start_rank
+            while rank - start_rank < stride:
+                rank += start.getCount()
+                start = start.getNext()
+            # A single node with a large count can cover the whole gap: then there is nothing to split
+            if rank < end_rank:
+                self.__lane_nodes.insert(lane + 1, start)
+                ranks.insert(lane + 1, rank)
 
 
     def __str__(self):
@@ -70,15 +227,65 @@ class OrderedList(OrderStatisticStructure):
         values = []
         current = self.__head
         while current is not None:
-            values.append(str(current.getValue()))
+            values.extend([str(current.getValue())] * current.getCount())
             current = current.getNext()
         return " -> ".join(values)
 
 
+    def _seek( self, key ) -> tuple[ListNode | None, int]:
+        """
+            Return the first node whose value is not less than `key`, with its rank.
+
+            With the express lane index enabled, the walk starts from the last sampled node
+            whose value is less than the key.
+
+            Parameters:
+                key: The value to look for.
+
+            Returns:
+                tuple[ListNode | None, int]: The node (None past the end) and its rank.
+        """
+        current, position = self.__head, 1
+        if self.__lane_nodes:
+            lane = bisect_left(self.__lane_nodes, key, key=ListNode.getValue) - 1
+            if lane >= 0:
+                current, position = self.__lane_nodes[lane], self.__lane_ranks[lane]
+
+        while current is not None and current.getValue() < key:
+            position += current.getCount()
+            current = current.getNext()
+        return current, position
+
+    def find( self, key ) -> ListNode | None:
+        """
+            Return the first node holding `key`, or None if the key is not stored.
+        """
+        current, _ = self._seek(key)
+        return current if current is not None and current.getValue() == key else None
+
+    def __contains__( self, key ) -> bool:
+        return self.find(key) is not None
+
+    def rank_of( self, key ) -> int | None:
+        """
+            Return the rank (1-based) of the first copy of `key` without a node reference.
+
+            Parameters:
+                key: The value whose rank we want to find.
+
+            Returns:
+                int | None: The rank of the key, or None if the key is not stored.
+        """
+        current, position = self._seek(key)
+        return position if current is not None and current.getValue() == key else None
+
+
     # Order Statistics Algorithm
     def OSSelect( self, node: ListNode, i: int ) -> ListNode:
         """
-            Return the i-th smallest node. List is ordered, so simply iterate through
+            Return the i-th smallest node. List is ordered, so simply iterate through.
+            Starting from the head with the express lane index enabled, the walk begins at the
+            last sampled node whose rank is not greater than i.
 
             Parameters:
                 node (ListNode): The start of OrderedList
@@ -93,31 +300,230 @@ class OrderedList(OrderStatisticStructure):
         current = node
         position = 1
 
+        if node is self.__head and self.__lane_ranks:
+            lane = bisect_right(self.__lane_ranks, i) - 1
+            if lane >= 0:
+                current, position = self.__lane_nodes[lane], self.__lane_ranks[lane]
+
         while current is not None:
-            if position == i:
+            if position <= i < position + current.getCount():
                 return current
+            position += current.getCount()
             current = current.getNext()
-            position += 1
 
         raise IndexError("Index out of range")
 
+    def OSSelect_many( self, ks: list[int], node: ListNode | None = None ) -> list[ListNode]:
+        """
+            Return the nodes with ranks `ks` with a single walk of the list.
+
+            The ranks are sorted once and answered in increasing order while walking,
+            so q queries cost O(n + q log q) instead of q * O(n).
+
+            Parameters:
+                ks (list[int]): The requested ranks, in any order.
+                node (ListNode, optional): The start of OrderedList. Defaults to the head.
+
+            Returns:
+                list[ListNode]: The selected nodes in the order of `ks`.
+
+            Raises:
+                IndexError: If a rank is < 1 or greater than the list length.
+        """
+        if node is None:
+            node = self.__head
+
+        order = sorted(range(len(ks)), key=ks.__getitem__)
+        if order and ks[order[0]] < 1:
+            raise IndexError("Index must be >= 1")
+
+        results = [None] * len(ks)
+        current = node
+        position = 1
+
+        for j in order:
+            while current is not None and position + current.getCount() <= ks[j]:
+                position += current.getCount()
+                current = current.getNext()
+            if current is None:
+                raise IndexError("Index out of range")
+            results[j] = current
+
+        return results
+
+    def select( self, i: int ):
+        """
+            Return the key of rank i (the value of the OSSelect node).
+
+            Raises:
+                IndexError: If i is out of bounds.
+        """
+        return self.OSSelect(self.__head, i).getValue()
+
     def OSRank( self, x: ListNode ) -> int | None:
         """
             Return the rank (1-based index on iteration) of node x.
 
+            Nodes are matched by identity, so each of several equal values gets its own rank.
+            With rank stamps enabled the node is not searched for: insert keeps its stamp equal to
+            its rank, so the rank is read in O(1). A node of another list is recognised by its owner.
+
             Parameters:
                 x (ListNode): The node whose rank we want to find.
 
             Returns:
-                int: The rank of the node, index of Ordered List
+                int: The rank of the node, index of Ordered List (None if x is not in the list)
         """
+        if self.__rank_stamps:
+            if not isinstance(x, StampedListNode) or x.getOwner() is not self:
+                return None
+            return x.getStamp()
+
         current = self.__head
         position = 1
 
         while current is not None:
-            if current == x:
+            if current is x:
                 return position
+            position += current.getCount()
+            current = current.getNext()
+
+        return None
+
+    def OSRank_many( self, items: list ) -> list[int | None]:
+        """
+            Return the ranks of many nodes or keys with a single walk of the list.
+
+            As in OSRank, nodes are matched by identity; keys get the position of their first
+            equal node. The walk stops as soon as every requested item has been seen, so ranking
+            the whole list costs O(n) instead of O(n^2).
+
+            Parameters:
+                items (list[ListNode | int]): Nodes and/or keys, in any order.
+
+            Returns:
+                list[int | None]: The ranks in the order of `items` (None if not in the list).
+        """
+        wanted_nodes = {}
+        wanted_keys = {}
+        for j, item in enumerate(items):
+            if isinstance(item, Node):
+                wanted_nodes.setdefault(id(item), []).append(j)
+            else:
+                wanted_keys.setdefault(item, []).append(j)
+
+        results = [None] * len(items)
+        current = self.__head
+        position = 1
+
+        while (wanted_nodes or wanted_keys) and current is not None:
+            for j in wanted_nodes.pop(id(current), ()):
+                results[j] = position
+            for j in wanted_keys.pop(current.getValue(), ()):
+                results[j] = position
+            position += current.getCount()
+            current = current.getNext()
+
+        return results
+
+    # Range queries
+    def iter_range( self, lo, hi ):
+        """
+            Lazily yield the nodes whose value falls in [lo, hi], in order.
+
+            A multiset node is yielded once, its count tells how many values it holds.
+
+            Parameters:
+                lo: The lower bound (inclusive).
+                hi: The upper bound (inclusive).
+
+            Yields:
+                ListNode: The nodes in the range.
+        """
+        for node in self.iter_from(lo):
+            if hi < node.getValue():
+                return
+            yield node
+
+    def iter_ranks( self, k1: int, k2: int ):
+        """
+            Lazily yield the nodes ranked k1..k2 (1-based, inclusive), in order.
+
+            As with OSSelect, a multiset node is yielded once per rank it covers.
+
+            Parameters:
+                k1 (int): The first rank.
+                k2 (int): The last rank (ranks past the end are ignored).
+
+            Yields:
+                ListNode: The node holding each rank.
+
+            Raises:
+                IndexError: If k1 is lower than 1.
+        """
+        return islice(self.iter_from_rank(k1), max(0, k2 - k1 + 1))
+
+
+    # In-order generators
+    def __iter__(self):
+        """
+            Lazily yield the nodes of the list in order (a multiset node once, with its count).
+        """
+        current = self.__head
+        while current is not None:
+            yield current
+            current = current.getNext()
+
+    def iter_from( self, key ):
+        """
+            Lazily yield the nodes whose value is not less than `key`, in order.
+
+            The first node is found from the express lane when enabled.
+
+            Parameters:
+                key: The lower bound (inclusive).
+
+            Yields:
+                ListNode: The nodes from the first value >= key to the end.
+        """
+        current, _ = self._seek(key)
+        while current is not None:
+            yield current
             current = current.getNext()
-            position += 1
 
-        return None
\ No newline at end of file
+    def iter_from_rank( self, k: int ):
+        """
+            Lazily yield the nodes from rank k (1-based) to the end, in order.
+
+            The walk to rank k starts from the express lane when enabled. As with OSSelect,
+            a multiset node is yielded once per rank it covers.
+
+            Parameters:
+                k (int): The first rank.
+
+            Yields:
+                ListNode: The node holding each rank.
+
+            Raises:
+                IndexError: If k is lower than 1.
+        """
+        if k < 1:
+            raise IndexError("Index must be >= 1")
+
+        current, position = self.__head, 1
+        if self.__lane_ranks:
+            lane = bisect_right(self.__lane_ranks, k) - 1
+            if lane >= 0:
+                current, position = self.__lane_nodes[lane], self.__lane_ranks[lane]
+
+        while current is not None and position + current.getCount() <= k:
+            position += current.getCount()
+            current = current.getNext()
+
+        # Ranks of the first node before k are not yielded
+        skip = k - position
+        while current is not None:
+            for _ in range(current.getCount() - skip):
+                yield current
+            skip = 0
+            current = current.getNext()
@@ -0,0 +1,92 @@
+from DataStructure.Node.ListNode import ListNode
+
+
+class OrderedListCursor:
+    """
+        OrderedListCursor remembers the last (node, position) reached on an OrderedList, so that
+        sequential or near-sequential OSSelect calls cost O(distance) instead of O(k).
+
+        The list is singly linked, so a backward request cannot walk back: it restarts from the
+        nearest cached finger (a previously visited (position, node) pair) preceding it, or from
+        the head. Any insert on the list invalidates the cursor and its fingers, which are then
+        rebuilt from the head on the next select.
+
+        Attributes:
+            __list (OrderedList): The list the cursor moves on.
+            __version (int): The list version the cached positions refer to.
+            __node (ListNode | None): Current node of the cursor.
+            __position (int): Rank of the current node.
+            __fingers (dict[int, ListNode]): Cached positions, oldest first.
+    """
+
+    def __init__( self, ordered_list, max_fingers: int = 8 ):
+        self.__list = ordered_list
+        self.__max_fingers = max_fingers
+        self.reset()
+
+
+    def getNode(self) -> ListNode | None:
+        return self.__node
+
+    def getPosition(self) -> int:
+        return self.__position
+
+    def isValid(self) -> bool:
+        return self.__version == self.__list.getVersion()
+
+
+    def reset(self) -> None:
+        """
+            Move the cursor back to the head and forget every finger.
+        """
+        self.__version = self.__list.getVersion()
+        self.__node = self.__list.getHead()
+        self.__position = 1
+        self.__fingers = {}
+
+
+    def _remember( self, position: int, node: ListNode ) -> None:
+        self.__fingers.pop(position, None)
+        self.__fingers[position] = node
+        if len(self.__fingers) > self.__max_fingers:
+            del self.__fingers[next(iter(self.__fingers))]
+
+
+    def select( self, i: int ) -> ListNode:
+        """
+            Return the i-th smallest node, walking from the closest known position before i.
+
+            Parameters:
+                i (int): Index
+
+            Returns:
+                ListNode: The corresponding node.
+
+            Raises:
+                IndexError: If i is out of bounds.
+        """
+        if i < 1:
+            raise IndexError("Index must be >= 1")
+        if not self.isValid():
+            self.reset()
+
+        if i < self.__position:
+            if self.__node is not None:
+                self._remember(self.__position, self.__node)
+            start = max((p for p in self.__fingers if p <= i), default=None)
+            if start is None:
+                self.__node, self.__position = self.__list.getHead(), 1
+            else:
+                self.__node, self.__position = self.__fingers[start], start
+
+        # Positions are ranks of the first value of a node (nodes of a multiset cover count ranks)
+        current, position = self.__node, self.__position
+        while current is not None and position + current.getCount() <= i:
+            position += current.getCount()
+            current = current.getNext()
+
+        if current is None:
+            raise IndexError("Index out of range")
+
+        self.__node, self.__position = current, position
+        return current
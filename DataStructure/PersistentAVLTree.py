@@ -0,0 +1,362 @@
+from typing import TYPE_CHECKING
+
+from DataStructure.Node.AVLNode import AVLNode
+from DataStructure.Node.Node import Node
+from DataStructure.OrderStatisticsStructure import OrderStatisticStructure
+
+if TYPE_CHECKING:
+    from DataStructure.FrozenSnapshot import FrozenSnapshot
+
+
+class PersistentAVLTree(OrderStatisticStructure):
+    """
+        PersistentAVLTree is a fully persistent size-augmented AVL tree built on AVLNode.
+
+        Nodes are never modified once created: insert and delete copy only the O(log n) nodes on
+        the search path (and the few touched by rotations), link the copies to the untouched
+        subtrees of the previous version and return the new root. Every update records a new
+        version, and every old version stays queryable through its root, so readers can rank
+        "as of version v" while writers go on. Versions share their unchanged subtrees, so memory
+        grows with the number of changes, not with the number of versions.
+
+        Shared nodes belong to many versions at once, so the parent pointers of AVLNode are never
+        set: OSRank and rank_of compute the rank during a descent from the root of the version.
+        Duplicates are ignored, unless the tree is a multiset: then each node keeps the count of
+        its value and sizes are weighted by count.
+
+        Attributes:
+            __versions (list[AVLNode | None]): The root of every version; version 0 is the empty tree.
+            __multiset (bool): Whether equal values share one node with a count.
+            __node_class (type): The AVLNode variant instantiated, with a count slot only in multiset mode.
+    """
+
+    def __init__( self, multiset: bool = False ):
+        self.__versions = [None]
+        self.__multiset = multiset
+        self.__node_class = AVLNode.variant(counted=multiset)
+
+
+    def isMultiset(self) -> bool:
+        return self.__multiset
+
+    def getVersion(self) -> int:
+        """
+            Return the number of the latest version (0 before any update).
+        """
+        return len(self.__versions) - 1
+
+    def getRoot( self, version: int | None = None ) -> AVLNode | None:
+        """
+            Return the root of a version.
+
+            Parameters:
+                version (int, optional): The version number. Defaults to the latest version.
+
+            Returns:
+                AVLNode | None: The root of the version, None for an empty tree.
+
+            Raises:
+                IndexError: If the version does not exist.
+        """
+        if version is None:
+            return self.__versions[-1]
+        if version < 0 or version >= len(self.__versions):
+            raise IndexError(f"Version {version} does not exist")
+        return self.__versions[version]
+
+    def __len__(self) -> int:
+        return self.size(self.__versions[-1])
+
+    @staticmethod
+    def height( node: AVLNode | None ) -> int:
+        return node.getHeight() if node else 0
+
+    @staticmethod
+    def size( node: AVLNode | None ) -> int:
+        return node.getSize() if node else 0
+
+    def __str__(self) -> str:
+        return " -> ".join(str(node.getValue()) for node in self)
+
+
+    # Path copying
+    def _make( self, value, count: int, left: AVLNode | None, right: AVLNode | None ) -> AVLNode:
+        """
+            Create a new node with the given children, its height and size already set.
+
+            The children are passed to the constructor, so no parent pointer of a shared node is touched.
+        """
+        node = self.__node_class(value, left, right)
+        if self.__multiset:
+            node.setCount(count)
+        node.setHeight(1 + max(self.height(left), self.height(right)))
+        node.setSize(count + self.size(left) + self.size(right))
+        return node
+
+    def _join( self, value, count: int, left: AVLNode | None, right: AVLNode | None ) -> AVLNode:
+        """
+            Create the node (value, count) over `left` and `right`, rotating if their heights differ by two.
+
+            Rotations build new nodes too, so the subtrees of older versions are left as they are.
+
+            Returns:
+                AVLNode: The root of the balanced subtree.
+        """
+        left_height, right_height = self.height(left), self.height(right)
+
+        if left_height > right_height + 1:
+            if self.height(left.getLeft()) < self.height(left.getRight()):
+                # Left-right case: the right child of `left` becomes the root
+                pivot = left.getRight()
+                return self._make(pivot.getValue(), pivot.getCount(),
+                                  self._make(left.getValue(), left.getCount(), left.getLeft(), pivot.getLeft()),
+                                  self._make(value, count, pivot.getRight(), right))
+            return self._make(left.getValue(), left.getCount(), left.getLeft(),
+                              self._make(value, count, left.getRight(), right))
+
+        if right_height > left_height + 1:
+            if self.height(right.getRight()) < self.height(right.getLeft()):
+                # Right-left case: the left child of `right` becomes the root
+                pivot = right.getLeft()
+                return self._make(pivot.getValue(), pivot.getCount(),
+                                  self._make(value, count, left, pivot.getLeft()),
+                                  self._make(right.getValue(), right.getCount(), pivot.getRight(), right.getRight()))
+            return self._make(right.getValue(), right.getCount(),
+                              self._make(value, count, left, right.getLeft()), right.getRight())
+
+        return self._make(value, count, left, right)
+
+
+    def insert( self, key, version: int | None = None ) -> AVLNode:
+        """
+            Insert a key into a version and record the result as a new version.
+
+            Parameters:
+                key: The value to insert.
+                version (int, optional): The version to update. Defaults to the latest version.
+
+            Returns:
+                AVLNode: The root of the new version.
+        """
+        root = self._insert(self.getRoot(version), key)
+        self.__versions.append(root)
+        return root
+
+    def _insert( self, node: AVLNode | None, key ) -> AVLNode:
+        """
+            Return the root of a copy of the subtree with `key` inserted, sharing the untouched subtrees.
+
+            Parameters:
+                node (AVLNode | None): The root of the current subtree.
+                key: The value to insert.
+
+            Returns:
+                AVLNode: The new root (the same node when the key is a duplicate outside multiset mode).
+        """
+        if node is None:
+            return self._make(key, 1, None, None)
+
+        value, left, right = node.getValue(), node.getLeft(), node.getRight()
+        if key < value:
+            new_left = self._insert(left, key)
+            return node if new_left is left else self._join(value, node.getCount(), new_left, right)
+        if key > value:
+            new_right = self._insert(right, key)
+            return node if new_right is right else self._join(value, node.getCount(), left, new_right)
+        if self.__multiset:
+            return self._make(value, node.getCount() + 1, left, right)
+        return node
+
+
+    def delete( self, key, version: int | None = None ) -> bool:
+        """
+            Delete a key from a version and record the result as a new version.
+
+            Deleting a missing key records a version sharing the root of the previous one.
+
+            Parameters:
+                key: The value to remove.
+                version (int, optional): The version to update. Defaults to the latest version.
+
+            Returns:
+                bool: True if an occurrence of the key was removed, False if it was not stored.
+        """
+        previous = self.getRoot(version)
+        root = self._delete(previous, key)
+        self.__versions.append(root)
+        return root is not previous
+
+    def _delete( self, node: AVLNode | None, key ) -> AVLNode | None:
+        """
+            Return the root of a copy of the subtree with one occurrence of `key` removed.
+
+            A node with two children is replaced by a copy of its in-order successor. Nothing is
+            copied when the key is not in the subtree.
+
+            Parameters:
+                node (AVLNode | None): The root of the current subtree.
+                key: The value to delete.
+
+            Returns:
+                AVLNode | None: The new root of the subtree.
+        """
+        if node is None:
+            return None
+
+        value, left, right = node.getValue(), node.getLeft(), node.getRight()
+        if key < value:
+            new_left = self._delete(left, key)
+            return node if new_left is left else self._join(value, node.getCount(), new_left, right)
+        if key > value:
+            new_right = self._delete(right, key)
+            return node if new_right is right else self._join(value, node.getCount(), left, new_right)
+        if node.getCount() > 1:
+            return self._make(value, node.getCount() - 1, left, right)
+
+        if left is None or right is None:
+            return left if left is not None else right
+
+        right, successor = self._delete_min(right)
+        return self._join(successor.getValue(), successor.getCount(), left, right)
+
+    def _delete_min( self, node: AVLNode ) -> tuple[AVLNode | None, AVLNode]:
+        """
+            Return a copy of the subtree without its minimum node, and that minimum node.
+        """
+        if node.getLeft() is None:
+            return node.getRight(), node
+
+        left, minimum = self._delete_min(node.getLeft())
+        return self._join(node.getValue(), node.getCount(), left, node.getRight()), minimum
+
+
+    # Lookups
+    def find( self, key, version: int | None = None ) -> AVLNode | None:
+        """
+            Return the node holding `key` in a version, or None if the key is not stored there.
+        """
+        current = self.getRoot(version)
+        while current is not None:
+            value = current.getValue()
+            if key == value:
+                return current
+            current = current.getLeft() if key < value else current.getRight()
+        return None
+
+    def __contains__( self, key ) -> bool:
+        return self.find(key) is not None
+
+    def rank_of( self, key, version: int | None = None ) -> int | None:
+        """
+            Return the rank (1-based) of `key` in a version, accumulated during the descent from its root.
+
+            Parameters:
+                key: The value whose rank we want to find.
+                version (int, optional): The version to query. Defaults to the latest version.
+
+            Returns:
+                int | None: The rank of the key (of its first copy in multiset mode), or None if it is not stored.
+        """
+        rank = 0
+        current = self.getRoot(version)
+        while current is not None:
+            value = current.getValue()
+            if key == value:
+                return rank + self.size(current.getLeft()) + 1
+            if key < value:
+                current = current.getLeft()
+            else:
+                rank += self.size(current.getLeft()) + current.getCount()
+                current = current.getRight()
+        return None
+
+
+    # In-order generators
+    def iter_version( self, version: int | None = None ):
+        """
+            Lazily yield the nodes of a version in order (a multiset node once, with its count).
+        """
+        stack = []
+        node = self.getRoot(version)
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.getLeft()
+            node = stack.pop()
+            yield node
+            node = node.getRight()
+
+    def __iter__(self):
+        return self.iter_version()
+
+    def freeze( self, version: int | None = None ) -> "FrozenSnapshot":
+        """
+            Return an immutable NumPy snapshot of the keys of a version (the latest by default),
+            in order, for vectorized select / rank.
+
+            Parameters:
+                version (int, optional): The version to freeze.
+
+            Returns:
+                FrozenSnapshot: The snapshot of the keys of the version.
+        """
+        from DataStructure.FrozenSnapshot import FrozenSnapshot
+
+        return FrozenSnapshot.from_items(self.iter_version(version))
+
+
+    # Order Statistics Algorithm
+    def OSSelect( self, node: AVLNode | None, i: int ) -> AVLNode | None:
+        """
+            Return the i-th smallest node of the version rooted at `node`, using size.
+
+            Parameters:
+                node (AVLNode | None): The root of a version (see getRoot).
+                i (int): Index
+
+            Returns:
+                AVLNode | None: The corresponding node or None if out of bounds.
+        """
+        while node is not None:
+            left_size = self.size(node.getLeft())
+
+            if left_size < i <= left_size + node.getCount():
+                return node
+            elif i <= left_size:
+                node = node.getLeft()
+            else:
+                i -= left_size + node.getCount()
+                node = node.getRight()
+        return None
+
+    def select( self, i: int, version: int | None = None ):
+        """
+            Return the key of rank i (the value of the OSSelect node).
+
+            Parameters:
+                i (int): Index
+                version (int, optional): The version to read. Defaults to the latest version.
+
+            Raises:
+                IndexError: If i is out of bounds.
+        """
+        node = self.OSSelect(self.getRoot(version), i)
+        if node is None:
+            raise IndexError("Index out of range")
+        return node.getValue()
+
+    def OSRank( self, x, version: int | None = None ) -> int | None:
+        """
+            Return the rank (1-based) of a node or key in a version.
+
+            A node may belong to many versions and has no parent pointer, so the rank of its value
+            is computed by descent from the root of the version.
+
+            Parameters:
+                x (AVLNode | Any): The node or key whose rank we want to find.
+                version (int, optional): The version to query. Defaults to the latest version.
+
+            Returns:
+                int | None: The rank, or None if the value is not stored in the version.
+        """
+        return self.rank_of(x.getValue() if isinstance(x, Node) else x, version)
@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+from threading import Condition, Lock
+
+
+class ReadWriteLock:
+    """
+        ReadWriteLock lets many readers hold the lock together, or one writer alone.
+
+        Writers are preferred: once a writer waits, new readers wait too, so a steady stream of
+        queries cannot starve the ingest thread.
+
+        Attributes:
+            __condition (Condition): Guards the counters below; waiters are woken on every release.
+            __readers (int): Number of readers holding the lock.
+            __writer (bool): Whether a writer holds the lock.
+            __waiting_writers (int): Number of writers waiting for the lock.
+    """
+
+    def __init__(self):
+        self.__condition = Condition(Lock())
+        self.__readers = 0
+        self.__writer = False
+        self.__waiting_writers = 0
+
+    def acquire_read(self) -> None:
+        with self.__condition:
+            while self.__writer or self.__waiting_writers:
+                self.__condition.wait()
+            self.__readers += 1
+
+    def release_read(self) -> None:
+        with self.__condition:
+            self.__readers -= 1
+            if not self.__readers:
+                self.__condition.notify_all()
+
+    def acquire_write(self) -> None:
+        with self.__condition:
+            self.__waiting_writers += 1
+            while self.__writer or self.__readers:
+                self.__condition.wait()
+            self.__waiting_writers -= 1
+            self.__writer = True
+
+    def release_write(self) -> None:
+        with self.__condition:
+            self.__writer = False
+            self.__condition.notify_all()
+
+    @contextmanager
+    def reading(self):
+        """
+            Hold the lock as a reader for the body of a `with` statement.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def writing(self):
+        """
+            Hold the lock as the only writer for the body of a `with` statement.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -0,0 +1,331 @@
+import random
+from itertools import islice
+
+from DataStructure.Node.SkipListNode import SkipListNode
+from DataStructure.OrderStatisticsStructure import OrderStatisticStructure
+
+
+class SkipList(OrderStatisticStructure):
+    """
+        SkipList is an indexable skip list: a sorted linked list with extra forward pointers on
+        randomly chosen nodes, each annotated with the number of nodes it skips (its span).
+
+        Insert, delete, OSSelect and OSRank run in O(log n) expected time. Levels are drawn from
+        a private random generator, so a seed makes the structure reproducible.
+
+        Attributes:
+            __head (SkipListNode): Header sentinel, with a forward pointer on every level.
+            __level (int): Number of levels currently in use.
+            __length (int): Number of stored values.
+            __key (Callable | None): Function extracting the key of an inserted item, which is then kept
+                as the node payload. None stores the inserted values themselves as keys.
+            __node_class (type): The SkipListNode variant instantiated, with a payload slot only when the mode needs it.
+    """
+
+    def __init__( self, seed: int | None = None, p: float = 0.5, max_level: int = 32, key = None ):
+        self.__random = random.Random(seed)
+        self.__p = p
+        self.__max_level = max_level
+        self.__key = key
+        self.__node_class = SkipListNode.variant(keyed=key is not None)
+        # The header value is never compared, so it works for any key type
+        self.__head = SkipListNode(None, max_level)
+        self.__level = 1
+        self.__length = 0
+
+
+    def getHead(self) -> SkipListNode:
+        return self.__head
+
+    def getLevel(self) -> int:
+        return self.__level
+
+    def __len__(self) -> int:
+        return self.__length
+
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < self.__max_level and self.__random.random() < self.__p:
+            level += 1
+        return level
+
+
+    def insert( self, value ) -> SkipListNode:
+        """
+            Insert a value, after any equal values already stored.
+
+            Parameters:
+                value: The value to insert (an item whose key is `key(value)` with a key function).
+
+            Returns:
+                SkipListNode: The new node.
+        """
+        item = value
+        if self.__key is not None:
+            value = self.__key(item)
+
+        update = [self.__head] * self.__max_level
+        rank = [0] * self.__max_level
+
+        x = self.__head
+        for level in reversed(range(self.__level)):
+            rank[level] = rank[level + 1] if level + 1 < self.__level else 0
+            while x.getForward(level) is not None and x.getForward(level).getValue() <= value:
+                rank[level] += x.getSpan(level)
+                x = x.getForward(level)
+            update[level] = x
+
+        new_level = self._random_level()
+        if new_level > self.__level:
+            for level in range(self.__level, new_level):
+                self.__head.setSpan(level, self.__length)
+            self.__level = new_level
+
+        new_node = self.__node_class(value, new_level)
+        if self.__key is not None:
+            new_node.setPayload(item)
+        for level in range(new_level):
+            previous = update[level]
+            new_node.setForward(level, previous.getForward(level))
+            previous.setForward(level, new_node)
+            new_node.setSpan(level, previous.getSpan(level) - (rank[0] - rank[level]))
+            previous.setSpan(level, rank[0] - rank[level] + 1)
+
+        for level in range(new_level, self.__level):
+            update[level].setSpan(level, update[level].getSpan(level) + 1)
+
+        self.__length += 1
+        return new_node
+
+
+    def delete( self, value: int ) -> bool:
+        """
+            Delete the first node holding `value`.
+
+            Parameters:
+                value: The key to remove.
+
+            Returns:
+                bool: True if a node was removed.
+        """
+        update = [self.__head] * self.__level
+
+        x = self.__head
+        for level in reversed(range(self.__level)):
+            while x.getForward(level) is not None and x.getForward(level).getValue() < value:
+                x = x.getForward(level)
+            update[level] = x
+
+        target = x.getForward(0)
+        if target is None or target.getValue() != value:
+            return False
+
+        for level in range(self.__level):
+            previous = update[level]
+            if previous.getForward(level) is target:
+                previous.setSpan(level, previous.getSpan(level) + target.getSpan(level) - 1)
+                previous.setForward(level, target.getForward(level))
+            else:
+                previous.setSpan(level, previous.getSpan(level) - 1)
+
+        while self.__level > 1 and self.__head.getForward(self.__level - 1) is None:
+            self.__level -= 1
+        self.__length -= 1
+        return True
+
+
+    def _seek( self, key ) -> tuple[SkipListNode | None, int]:
+        """
+            Return the first node whose value is not less than `key`, with its rank.
+
+            The rank is the sum of the spans followed on the way down, as in OSRank.
+        """
+        x = self.__head
+        rank = 0
+        for level in reversed(range(self.__level)):
+            while x.getForward(level) is not None and x.getForward(level).getValue() < key:
+                rank += x.getSpan(level)
+                x = x.getForward(level)
+        return x.getForward(0), rank + 1
+
+    def find( self, key ) -> SkipListNode | None:
+        """
+            Return the first node holding `key`, or None if the key is not stored.
+        """
+        node, _ = self._seek(key)
+        return node if node is not None and node.getValue() == key else None
+
+    def __contains__( self, key ) -> bool:
+        return self.find(key) is not None
+
+    def rank_of( self, key ) -> int | None:
+        """
+            Return the rank (1-based) of the first copy of `key` in O(log n) expected time.
+
+            Parameters:
+                key: The value whose rank we want to find.
+
+            Returns:
+                int | None: The rank of the key, or None if the key is not stored.
+        """
+        node, rank = self._seek(key)
+        return rank if node is not None and node.getValue() == key else None
+
+
+    def __str__(self):
+        values = []
+        current = self.__head.getNext()
+        while current is not None:
+            values.append(str(current.getValue()))
+            current = current.getNext()
+        return " -> ".join(values)
+
+
+    # Order Statistics Algorithm
+    def OSSelect( self, node: SkipListNode, i: int ) -> SkipListNode:
+        """
+            Return the i-th smallest node, following the widest forward pointers that fit in i.
+
+            Parameters:
+                node (SkipListNode): The header of the SkipList (see getHead)
+                i (int): Index
+
+            Returns:
+                SkipListNode: The corresponding node.
+
+            Raises:
+                IndexError: If i is out of bounds.
+        """
+        if i < 1:
+            raise IndexError("Index must be >= 1")
+
+        traversed = 0
+        x = node
+        for level in reversed(range(min(self.__level, node.getLevel()))):
+            while x.getForward(level) is not None and traversed + x.getSpan(level) <= i:
+                traversed += x.getSpan(level)
+                x = x.getForward(level)
+            if traversed == i:
+                return x
+
+        raise IndexError("Index out of range")
+
+    def select( self, i: int ):
+        """
+            Return the key of rank i (the value of the OSSelect node).
+
+            Raises:
+                IndexError: If i is out of bounds.
+        """
+        return self.OSSelect(self.__head, i).getValue()
+
+    def OSRank( self, x: SkipListNode ) -> int | None:
+        """
+            Return the rank (1-based index on iteration) of node x, summing spans along the search path.
+
+            Parameters:
+                x (SkipListNode): The node whose rank we want to find.
+
+            Returns:
+                int | None: The rank of the node, or None if it is not in the list.
+        """
+        value = x.getValue()
+        rank = 0
+        node = self.__head
+        for level in reversed(range(self.__level)):
+            while node.getForward(level) is not None and node.getForward(level).getValue() < value:
+                rank += node.getSpan(level)
+                node = node.getForward(level)
+
+        # Equal values: move along level 0 until the requested node itself
+        node = node.getNext()
+        rank += 1
+        while node is not None and node is not x and node.getValue() == value:
+            node = node.getNext()
+            rank += 1
+
+        return rank if node is x else None
+
+
+    # Range queries
+    def iter_range( self, lo, hi ):
+        """
+            Lazily yield the nodes whose value falls in [lo, hi], in order.
+
+            Parameters:
+                lo: The lower bound (inclusive).
+                hi: The upper bound (inclusive).
+
+            Yields:
+                SkipListNode: The nodes in the range.
+        """
+        for node in self.iter_from(lo):
+            if hi < node.getValue():
+                return
+            yield node
+
+    def iter_ranks( self, k1: int, k2: int ):
+        """
+            Lazily yield the nodes ranked k1..k2 (1-based, inclusive), in order.
+
+            Parameters:
+                k1 (int): The first rank.
+                k2 (int): The last rank (ranks past the end are ignored).
+
+            Yields:
+                SkipListNode: The node holding each rank.
+
+            Raises:
+                IndexError: If k1 is lower than 1.
+        """
+        return islice(self.iter_from_rank(k1), max(0, k2 - k1 + 1))
+
+
+    # In-order generators
+    def __iter__(self):
+        """
+            Lazily yield the nodes of the list in order, along level 0.
+        """
+        node = self.__head.getNext()
+        while node is not None:
+            yield node
+            node = node.getNext()
+
+    def iter_from( self, key ):
+        """
+            Lazily yield the nodes whose value is not less than `key`, in order.
+
+            Parameters:
+                key: The lower bound (inclusive).
+
+            Yields:
+                SkipListNode: The nodes from the first value >= key to the end.
+        """
+        node, _ = self._seek(key)
+        while node is not None:
+            yield node
+            node = node.getNext()
+
+    def iter_from_rank( self, k: int ):
+        """
+            Lazily yield the nodes from rank k (1-based) to the end, in order.
+
+            Parameters:
+                k (int): The first rank.
+
+            Yields:
+                SkipListNode: The node holding each rank.
+
+            Raises:
+                IndexError: If k is lower than 1.
+        """
+        if k < 1:
+            raise IndexError("Index must be >= 1")
+        if k > self.__length:
+            return
+
+        node = self.OSSelect(self.__head, k)
+        while node is not None:
+            yield node
+            node = node.getNext()
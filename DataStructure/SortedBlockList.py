@@ -0,0 +1,325 @@
+from bisect import bisect_left, bisect_right, insort_right
+from itertools import islice
+
+from DataStructure.OrderStatisticsStructure import OrderStatisticStructure
+
+
+class SortedBlockList(OrderStatisticStructure):
+    """
+        SortedBlockList keeps the keys in a list of sorted Python lists (blocks) of bounded size,
+        a square root decomposition of one big sorted array.
+
+        The last key of every block is kept in a separate list, so the block of a key is found by
+        bisect, and the position inside the block by another bisect. A prefix count index (number of
+        keys in blocks 0..j) locates the block of a rank by bisect as well. Blocks longer than twice
+        the load are split, blocks shorter than half the load are merged with a neighbour, so every
+        insert or delete moves O(load) references, in C.
+
+        The prefix index is rebuilt lazily from the first block changed since the last rank query,
+        so runs of updates do not pay for it; refresh() rebuilds it eagerly. Duplicates are stored as
+        separate keys.
+        OSSelect returns keys (there are no nodes) and OSRank takes a key.
+
+        Attributes:
+            __load (int): Target block size; blocks hold between load / 2 and 2 * load keys.
+            __blocks (list[list]): The sorted blocks, in order.
+            __maxes (list): Last (largest) key of each block.
+            __index (list[int]): Prefix counts of the blocks, valid for the blocks before __dirty.
+            __dirty (int): First block whose prefix count is stale.
+            __length (int): Number of stored keys.
+    """
+
+    def __init__( self, load: int = 512 ):
+        if load < 4:
+            raise ValueError("Load must be at least 4")
+        self.__load = load
+        self.__blocks = []
+        self.__maxes = []
+        self.__index = []
+        self.__dirty = 0
+        self.__length = 0
+
+    @classmethod
+    def from_sorted( cls, values, load: int = 512 ) -> "SortedBlockList":
+        """
+            Build the list from keys already in ascending order in O(n), in blocks of `load` keys.
+
+            Parameters:
+                values (Iterable): The keys to store, in ascending order.
+                load (int): Target block size.
+
+            Returns:
+                SortedBlockList: The new list.
+        """
+        blocks = cls(load)
+        keys = list(values)
+        blocks.__blocks = [keys[i:i + load] for i in range(0, len(keys), load)]
+        blocks.__maxes = [block[-1] for block in blocks.__blocks]
+        blocks.__length = len(keys)
+        return blocks
+
+
+    def getLoad(self) -> int:
+        return self.__load
+
+    def getBlockCount(self) -> int:
+        return len(self.__blocks)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __str__(self) -> str:
+        return " -> ".join(str(key) for key in self)
+
+
+    def _prefix(self) -> list[int]:
+        """
+            Return the prefix count index, rebuilding it from the first stale block.
+        """
+        index, blocks = self.__index, self.__blocks
+        dirty = self.__dirty
+        if dirty < len(blocks) or len(index) != len(blocks):
+            del index[dirty:]
+            total = index[-1] if index else 0
+            for block in blocks[dirty:]:
+                total += len(block)
+                index.append(total)
+            self.__dirty = len(blocks)
+        return index
+
+    def refresh(self) -> None:
+        """
+            Rebuild the stale part of the prefix index now, so the next queries only read it.
+        """
+        self._prefix()
+
+    def _touch( self, j: int ) -> None:
+        if j < self.__dirty:
+            self.__dirty = j
+
+
+    def insert( self, key ) -> None:
+        """
+            Insert a key, after any equal keys already stored.
+
+            Parameters:
+                key: The value to insert.
+        """
+        blocks, maxes = self.__blocks, self.__maxes
+        self.__length += 1
+
+        if not blocks:
+            blocks.append([key])
+            maxes.append(key)
+            self._touch(0)
+            return
+
+        j = bisect_right(maxes, key)
+        if j == len(blocks):
+            j -= 1
+            blocks[j].append(key)
+            maxes[j] = key
+        else:
+            insort_right(blocks[j], key)
+        self._touch(j)
+
+        if len(blocks[j]) > 2 * self.__load:
+            self._split(j)
+
+    def _split( self, j: int ) -> None:
+        block = self.__blocks[j]
+        half = len(block) // 2
+        self.__blocks.insert(j + 1, block[half:])
+        del block[half:]
+        self.__maxes.insert(j, block[-1])
+
+    def delete( self, key ) -> bool:
+        """
+            Delete one occurrence of a key, merging its block with a neighbour if it gets too small.
+
+            Parameters:
+                key: The value to remove.
+
+            Returns:
+                bool: True if the key was found and removed.
+        """
+        blocks, maxes = self.__blocks, self.__maxes
+        j = bisect_left(maxes, key)
+        if j == len(blocks):
+            return False
+        block = blocks[j]
+        i = bisect_left(block, key)
+        if block[i] != key:
+            return False
+
+        del block[i]
+        self.__length -= 1
+        self._touch(j)
+
+        if not block:
+            del blocks[j], maxes[j]
+        else:
+            maxes[j] = block[-1]
+            if len(block) < self.__load // 2 and len(blocks) > 1:
+                self._merge(j - 1 if j > 0 else j)
+        return True
+
+    def _merge( self, j: int ) -> None:
+        """
+            Merge block j + 1 into block j, splitting the result again if it is too long.
+        """
+        blocks, maxes = self.__blocks, self.__maxes
+        blocks[j].extend(blocks[j + 1])
+        maxes[j] = maxes[j + 1]
+        del blocks[j + 1], maxes[j + 1]
+        self._touch(j)
+        if len(blocks[j]) > 2 * self.__load:
+            self._split(j)
+
+
+    def _seek( self, key ) -> tuple[int, int]:
+        """
+            Locate the first key not less than `key`.
+
+            Returns:
+                tuple[int, int]: Its block and its index in the block (len(blocks), 0 past the end).
+        """
+        j = bisect_left(self.__maxes, key)
+        if j == len(self.__blocks):
+            return j, 0
+        return j, bisect_left(self.__blocks[j], key)
+
+    def find( self, key ):
+        """
+            Return the stored key equal to `key`, or None if the key is not stored.
+        """
+        j, i = self._seek(key)
+        if j == len(self.__blocks) or self.__blocks[j][i] != key:
+            return None
+        return self.__blocks[j][i]
+
+    def __contains__( self, key ) -> bool:
+        return self.find(key) is not None
+
+    def rank_of( self, key ) -> int | None:
+        """
+            Return the rank (1-based) of the first copy of `key`.
+
+            Parameters:
+                key: The value whose rank we want to find.
+
+            Returns:
+                int | None: The rank of the key, or None if the key is not stored.
+        """
+        j, i = self._seek(key)
+        if j == len(self.__blocks) or self.__blocks[j][i] != key:
+            return None
+        return (self._prefix()[j - 1] if j else 0) + i + 1
+
+    def count_range( self, lo, hi ) -> int:
+        """
+            Return how many keys fall in [lo, hi].
+        """
+        if hi < lo:
+            return 0
+        prefix = self._prefix()
+        j, i = self._seek(lo)
+        below_lo = (prefix[j - 1] if j else 0) + i
+        j = bisect_right(self.__maxes, hi)
+        below_hi = prefix[j - 1] if j else 0
+        if j < len(self.__blocks):
+            below_hi += bisect_right(self.__blocks[j], hi)
+        return below_hi - below_lo
+
+
+    # In-order generators
+    def _walk( self, j: int, i: int ):
+        blocks = self.__blocks
+        while j < len(blocks):
+            yield from islice(blocks[j], i, None)
+            j, i = j + 1, 0
+
+    def __iter__(self):
+        """
+            Lazily yield the keys in order, block after block.
+        """
+        return self._walk(0, 0)
+
+    def iter_from( self, key ):
+        """
+            Lazily yield the keys not less than `key`, in order.
+        """
+        return self._walk(*self._seek(key))
+
+    def iter_from_rank( self, k: int ):
+        """
+            Lazily yield the keys from rank k (1-based) to the end, in order.
+
+            Raises:
+                IndexError: If k is lower than 1.
+        """
+        if k < 1:
+            raise IndexError("Index must be >= 1")
+        if k > self.__length:
+            return iter(())
+        prefix = self._prefix()
+        j = bisect_left(prefix, k)
+        return self._walk(j, k - (prefix[j - 1] if j else 0) - 1)
+
+    def iter_range( self, lo, hi ):
+        """
+            Lazily yield the keys in [lo, hi], in order.
+        """
+        for key in self.iter_from(lo):
+            if hi < key:
+                return
+            yield key
+
+    def iter_ranks( self, k1: int, k2: int ):
+        """
+            Lazily yield the keys ranked k1..k2 (1-based, inclusive), in order.
+        """
+        return islice(self.iter_from_rank(k1), max(0, k2 - k1 + 1))
+
+
+    # Order Statistics Algorithm
+    def OSSelect( self, node, i: int ):
+        """
+            Return the i-th smallest key: bisect the prefix counts for the block, then index it.
+
+            Parameters:
+                node (None): Unused, the structure has no nodes; kept for the common signature.
+                i (int): Index
+
+            Returns:
+                The corresponding key or None if out of bounds.
+        """
+        if i < 1 or i > self.__length:
+            return None
+        prefix = self._prefix()
+        j = bisect_left(prefix, i)
+        return self.__blocks[j][i - (prefix[j - 1] if j else 0) - 1]
+
+    def select( self, i: int ):
+        """
+            Return the key of rank i (OSSelect returns keys already).
+
+            Raises:
+                IndexError: If i is out of bounds.
+        """
+        key = self.OSSelect(None, i)
+        if key is None:
+            raise IndexError("Index out of range")
+        return key
+
+    def OSRank( self, x ) -> int | None:
+        """
+            Return the rank (1-based) of the key x (of its first copy with duplicates).
+
+            Parameters:
+                x: The key whose rank we want to find.
+
+            Returns:
+                int | None: The rank of the key, or None if it is not stored.
+        """
+        return self.rank_of(x)
@@ -9,12 +9,14 @@ class PlotManager:
     """
     root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     assets_path = os.path.join(root_path, "Assets")
+    # One color per data structure series
+    colors = ["#66c2a5", "#fc8d62", "#8da0cb", "#e78ac3", "#a6d854", "#ffd92f", "#e5c494"]
 
     def __init__(self):
         pass
 
     @staticmethod
-    def saveMemoryUsagePlot(memory_usage):
+    def saveMemoryUsagePlot(memory_usage, elements=None):
         """
             Create and save a bar plot of memory usage for different data structures.
 
@@ -24,6 +26,8 @@ class PlotManager:
             Parameters:
                 memory_usage (dict): A dictionary where keys are data structure names
                                      and values are memory usage in bytes.
+                elements (int, optional): Number of stored elements; when given, each bar
+                                     also reports the bytes used per node.
 
             Returns:
                 None
@@ -31,15 +35,18 @@ class PlotManager:
         labels = list(memory_usage.keys())
         values = [memory_usage[label] / 1024 for label in labels]
         plt.figure(figsize=(10, 6))
-        bars = plt.bar(labels, values, color=["#66c2a5", "#fc8d62", "#8da0cb"])
+        bars = plt.bar(labels, values, color=PlotManager.colors)
         plt.title("Memory Usage of Data Structures (KB)")
         plt.ylabel("Memory (KB)")
         plt.grid(axis='y', linestyle='--', alpha=0.7)
 
-        for bar in bars:
+        for bar, label in zip(bars, labels):
             height = bar.get_height()
+            text = f"{height:.0f} KB"
+            if elements:
+                text += f"\n({memory_usage[label] / elements:.0f} B/node)"
             plt.text(
-                bar.get_x() + bar.get_width() / 2, height + 50, f"{height:.0f} KB",
+                bar.get_x() + bar.get_width() / 2, height + 50, text,
                 ha='center', va='bottom', fontsize=10
             )
 
@@ -64,7 +71,7 @@ class PlotManager:
         values = list(times.values())
 
         plt.figure(figsize=(8, 5))
-        bars = plt.bar(labels, values, color=["#66c2a5", "#fc8d62", "#8da0cb"])
+        bars = plt.bar(labels, values, color=PlotManager.colors)
         plt.title(f"OSSelect Time for {tries} Tries")
         plt.ylabel("Time (seconds)")
         plt.grid(axis='y', linestyle='--', alpha=0.7)
@@ -86,7 +93,7 @@ class PlotManager:
         values = list(times.values())
 
         plt.figure(figsize=(8, 5))
-        bars = plt.bar(labels, values, color=["#66c2a5", "#fc8d62", "#8da0cb"])
+        bars = plt.bar(labels, values, color=PlotManager.colors)
         plt.title(f"OSRank Time for {tries} Tries")
         plt.ylabel("Time (seconds)")
         plt.grid(axis='y', linestyle='--', alpha=0.7)
@@ -136,4 +143,72 @@ class PlotManager:
 
         # Save plot to file
         path = os.path.join(PlotManager.assets_path, f"{operation_name}_Time_vs_n.jpeg")
-        plt.savefig(path, format="jpeg")
\ No newline at end of file
+        plt.savefig(path, format="jpeg")
+
+    @staticmethod
+    def saveThroughputPlot(throughput, elements):
+        """
+            Create and save a grouped bar plot of operations per second, one group per operation and
+            one bar per data structure, on a logarithmic scale so textbook and production structures
+            fit on the same axis. Saves the plot image as 'Throughput.jpeg' in the 'Assets' folder.
+
+            Parameters:
+                throughput (dict): Data structure name -> {operation name: operations per second}.
+                elements (int): Number of stored elements during the measurements.
+
+            Returns:
+                None
+        """
+        structures = list(throughput.keys())
+        operations = list(next(iter(throughput.values())).keys())
+        width = 0.8 / len(structures)
+
+        plt.figure(figsize=(12, 6))
+        for s, structure in enumerate(structures):
+            positions = [o + (s - (len(structures) - 1) / 2) * width for o in range(len(operations))]
+            values = [throughput[structure][operation] for operation in operations]
+            plt.bar(positions, values, width, label=structure,
+                    color=PlotManager.colors[s % len(PlotManager.colors)])
+
+        plt.xticks(range(len(operations)), operations)
+        plt.yscale("log")
+        plt.title(f"Throughput with {elements} Elements")
+        plt.ylabel("Operations per second (log scale)")
+        plt.grid(axis='y', linestyle='--', alpha=0.7)
+        plt.legend()
+        plt.tight_layout()
+
+        path = os.path.join(PlotManager.assets_path, "Throughput.jpeg")
+        plt.savefig(path, format="jpeg")
+
+    @staticmethod
+    def saveIndexStrideTradeOffPlot(results_by_stride):
+        """
+            Create and save a scatter plot of index memory against OSSelect time for the
+            OrderedList express lane strides. Saves the plot image as 'OrderedList_Index_TradeOff.jpeg'
+            in the 'Assets' folder.
+
+            Parameters:
+                results_by_stride (dict): A dictionary mapping stride labels to a dictionary with
+                                          "select" (seconds) and "memory" (bytes).
+
+            Returns:
+                None
+        """
+        labels = list(results_by_stride.keys())
+        memory = [results_by_stride[label]["memory"] / 1024 for label in labels]
+        times = [results_by_stride[label]["select"] for label in labels]
+
+        plt.figure(figsize=(8, 5))
+        plt.scatter(memory, times, color=PlotManager.colors[2])
+        for label, x, y in zip(labels, memory, times):
+            plt.annotate(f"stride {label}", (x, y), textcoords="offset points", xytext=(5, 5))
+
+        plt.title("OrderedList Express Lane: Memory vs OSSelect Time")
+        plt.xlabel("Index memory (KB)")
+        plt.ylabel("Time (seconds)")
+        plt.grid(True, linestyle='--', alpha=0.7)
+        plt.tight_layout()
+
+        path = os.path.join(PlotManager.assets_path, "OrderedList_Index_TradeOff.jpeg")
+        plt.savefig(path, format="jpeg")
@@ -0,0 +1,46 @@
+import math
+from collections import deque
+
+
+class LatencyStats:
+    """
+        LatencyStats keeps the latest request latencies and reports their percentiles.
+
+        Only the last `capacity` samples are kept, so a long running server reports the recent
+        behaviour in bounded memory.
+
+        Attributes:
+            __samples (deque[float]): Latencies in seconds, oldest first.
+    """
+
+    def __init__( self, capacity: int = 1_000_000 ):
+        self.__samples = deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        return len(self.__samples)
+
+    def record( self, seconds: float ) -> None:
+        self.__samples.append(seconds)
+
+    def reset(self) -> None:
+        self.__samples.clear()
+
+    def percentile( self, p: float ) -> float:
+        """
+            Return the p-th percentile (nearest rank) of the kept latencies, in seconds.
+
+            Parameters:
+                p (float): The percentile, between 0 and 100.
+
+            Returns:
+                float: The latency, 0 when no sample was recorded.
+        """
+        if not self.__samples:
+            return 0.0
+        ordered = sorted(self.__samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self) -> str:
+        return (f"{len(self.__samples):,} requests, p50 {self.percentile(50) * 1000:.3f} ms, "
+                f"p99 {self.percentile(99) * 1000:.3f} ms")
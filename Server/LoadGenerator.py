@@ -0,0 +1,106 @@
+import asyncio
+import random
+import time
+
+from Server.LatencyStats import LatencyStats
+from Server.Protocol import Protocol
+
+
+class LoadGenerator:
+    """
+        LoadGenerator drives an OrderStatisticServer from the same machine.
+
+        It opens `connections` connections; each one keeps up to `pipeline` requests in flight,
+        drawn from a weighted mix of operations, and measures the round trip of every request
+        from its send to its response.
+
+        Attributes:
+            __mix (dict[str, float]): Weight of each operation ("select", "rank", "insert", "delete").
+            __key_space (int): Keys are drawn from [1, key_space], ranks from [1, key_space / 2].
+            __random (random.Random): Source of the requests, seeded for reproducible runs.
+            __latency (LatencyStats): Round trip latencies of the answered requests.
+            __statuses (dict[int, int]): Number of responses per status.
+    """
+
+    DEFAULT_MIX = {"select": 0.45, "rank": 0.45, "insert": 0.05, "delete": 0.05}
+
+    def __init__( self, key_space: int = 100000, mix: dict[str, float] | None = None, seed: int | None = None ):
+        self.__mix = mix if mix is not None else self.DEFAULT_MIX
+        if not self.__mix or any(name not in Protocol.OPERATIONS for name in self.__mix):
+            raise ValueError(f"The mix can only weight {tuple(Protocol.OPERATIONS)}")
+        self.__key_space = key_space
+        self.__random = random.Random(seed)
+        self.__latency = LatencyStats()
+        self.__statuses = {}
+
+
+    def getLatency(self) -> LatencyStats:
+        return self.__latency
+
+    def getStatuses(self) -> dict[int, int]:
+        return self.__statuses
+
+
+    def _requests( self, count: int ) -> list[tuple[int, int]]:
+        """
+            Draw `count` (operation, argument) requests from the mix.
+        """
+        names = list(self.__mix)
+        operations = self.__random.choices(names, weights=[self.__mix[name] for name in names], k=count)
+        requests = []
+        for name in operations:
+            if name == "select":
+                argument = self.__random.randint(1, max(1, self.__key_space // 2))
+            else:
+                argument = self.__random.randint(1, self.__key_space)
+            requests.append((Protocol.OPERATIONS[name], argument))
+        return requests
+
+    async def run( self, host: str = "127.0.0.1", port: int = 8765, path: str | None = None,
+                   connections: int = 8, requests: int = 10000, pipeline: int = 32 ) -> float:
+        """
+            Send `requests` requests on each connection and wait for all the responses.
+
+            Returns:
+                float: The throughput, in requests per second.
+        """
+        start = time.perf_counter()
+        await asyncio.gather(*(self._connection(host, port, path, requests, pipeline) for _ in range(connections)))
+        return connections * requests / (time.perf_counter() - start)
+
+    async def _connection( self, host: str, port: int, path: str | None, count: int, pipeline: int ) -> None:
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+
+        in_flight = asyncio.Semaphore(pipeline)
+        sent = {}
+
+        async def send():
+            for request_id, (operation, argument) in enumerate(self._requests(count)):
+                await in_flight.acquire()
+                sent[request_id] = time.perf_counter()
+                writer.write(Protocol.encode_request(operation, request_id, argument))
+                await writer.drain()
+
+        async def receive():
+            buffer = b""
+            answered = 0
+            while answered < count:
+                data = await reader.read(65536)
+                if not data:
+                    raise ConnectionError("The server closed the connection")
+                frames, buffer = Protocol.split(buffer + data, Protocol.RESPONSE)
+                now = time.perf_counter()
+                for request_id, status, _ in frames:
+                    self.__latency.record(now - sent.pop(request_id))
+                    self.__statuses[status] = self.__statuses.get(status, 0) + 1
+                    in_flight.release()
+                answered += len(frames)
+
+        try:
+            await asyncio.gather(send(), receive())
+        finally:
+            writer.close()
+            await writer.wait_closed()
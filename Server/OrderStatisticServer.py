@@ -0,0 +1,191 @@
+import asyncio
+import time
+
+from DataStructure.ConcurrentStructure import ConcurrentStructure
+from DataStructure.OrderStatisticsStructure import OrderStatisticStructure
+from Server.LatencyStats import LatencyStats
+from Server.Protocol import Protocol
+
+
+class OrderStatisticServer:
+    """
+        OrderStatisticServer serves select, rank, insert and delete requests on an order statistic
+        structure over a TCP or Unix socket, with asyncio.
+
+        Requests are not executed as they are decoded: they are queued, and the first request of an
+        event loop tick schedules one flush with call_soon. Every request decoded before the flush
+        runs, from any connection, is answered by it. Consecutive requests of the same kind become
+        one batched operation of the ConcurrentStructure facade (select_many, rank_many,
+        update_many), so arrival order is kept while reads and writes are coalesced. Every write
+        still gets its own status: NOT_FOUND for the delete of a missing key, ERROR for a key the
+        structure rejects (e.g. outside of a FenwickTree universe).
+        Responses are written once per connection per flush.
+
+        The latency of a request is measured from the decoding of its frame to the write of its
+        response; p50 / p99 are reported every `report_interval` seconds.
+
+        Attributes:
+            __index (ConcurrentStructure): The served structure, behind the key-based facade.
+            __pending (list[tuple]): Queued requests (writer, request id, operation, argument, arrival time).
+            __flush_scheduled (bool): Whether a flush is already scheduled for the pending requests.
+            __latency (LatencyStats): Latencies of the answered requests.
+            __requests (int): Number of answered requests since the last report.
+            __batches (int): Number of flushes since the last report.
+    """
+
+    def __init__( self, structure: OrderStatisticStructure ):
+        self.__index = structure if isinstance(structure, ConcurrentStructure) else ConcurrentStructure(structure)
+        self.__pending = []
+        self.__flush_scheduled = False
+        self.__latency = LatencyStats()
+        self.__requests = 0
+        self.__batches = 0
+
+
+    def getIndex(self) -> ConcurrentStructure:
+        return self.__index
+
+    def getLatency(self) -> LatencyStats:
+        return self.__latency
+
+    def getRequestCount(self) -> int:
+        return self.__requests
+
+    def getBatchCount(self) -> int:
+        return self.__batches
+
+
+    async def start( self, host: str = "127.0.0.1", port: int = 8765, path: str | None = None ) -> asyncio.Server:
+        """
+            Start listening, on the Unix socket `path` when given, otherwise on host:port.
+
+            Returns:
+                asyncio.Server: The listening server (port 0 picks a free port, see its sockets).
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self._handle, path=path)
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def serve( self, host: str = "127.0.0.1", port: int = 8765, path: str | None = None,
+                     report_interval: float = 5.0 ) -> None:
+        """
+            Serve until cancelled, printing the latency report every `report_interval` seconds.
+        """
+        server = await self.start(host, port, path)
+        reporter = asyncio.create_task(self._report_every(report_interval))
+        address = path if path is not None else f"{host}:{server.sockets[0].getsockname()[1]}"
+        print(f"Serving {type(self.__index.getStructure()).__name__} on {address}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            reporter.cancel()
+            if len(self.__latency):
+                self.report()
+
+    async def _report_every( self, interval: float ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            if len(self.__latency):
+                self.report()
+
+    def report(self) -> None:
+        """
+            Print the latency percentiles and the mean batch size, then start a new period.
+        """
+        batch = self.__requests / self.__batches if self.__batches else 0
+        print(f"Server: {self.__latency.summary()}, {self.__batches:,} batches of {batch:.1f} requests")
+        self.__latency.reset()
+        self.__requests = 0
+        self.__batches = 0
+
+
+    async def _handle( self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter ) -> None:
+        """
+            Decode the requests of one connection and queue them for the next flush.
+        """
+        buffer = b""
+        try:
+            while data := await reader.read(65536):
+                frames, buffer = Protocol.split(buffer + data, Protocol.REQUEST)
+                arrival = time.perf_counter()
+                for operation, request_id, argument in frames:
+                    self.__pending.append((writer, request_id, operation, argument, arrival))
+                if frames and not self.__flush_scheduled:
+                    self.__flush_scheduled = True
+                    asyncio.get_running_loop().call_soon(self._flush)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _kind( operation: int ) -> str:
+        if operation == Protocol.SELECT:
+            return "select"
+        if operation == Protocol.RANK:
+            return "rank"
+        if operation in (Protocol.INSERT, Protocol.DELETE):
+            return "write"
+        return "error"
+
+    def _flush(self) -> None:
+        """
+            Answer every queued request, running each run of requests of the same kind as one batch.
+        """
+        batch, self.__pending = self.__pending, []
+        self.__flush_scheduled = False
+
+        replies = {}
+        start = 0
+        while start < len(batch):
+            kind = self._kind(batch[start][2])
+            end = start + 1
+            while end < len(batch) and self._kind(batch[end][2]) == kind:
+                end += 1
+            run = batch[start:end]
+            for (writer, request_id, *_), (status, value) in zip(run, self._execute(kind, run)):
+                replies.setdefault(writer, []).append(Protocol.encode_response(request_id, status, value))
+            start = end
+
+        for writer, frames in replies.items():
+            if not writer.is_closing():
+                writer.write(b"".join(frames))
+
+        done = time.perf_counter()
+        for request in batch:
+            self.__latency.record(done - request[4])
+        self.__requests += len(batch)
+        self.__batches += 1
+
+    def _execute( self, kind: str, run: list[tuple] ) -> list[tuple[int, int]]:
+        """
+            Run a batch of requests of one kind on the index.
+
+            Returns:
+                list[tuple[int, int]]: The (status, value) of every request, in order.
+        """
+        index = self.__index
+        arguments = [request[3] for request in run]
+
+        if kind == "select":
+            try:
+                keys = index.select_many(arguments)
+            except IndexError:
+                keys = [index.OSSelect(None, k) for k in arguments]
+            return [(Protocol.OK, key) if key is not None else (Protocol.NOT_FOUND, 0) for key in keys]
+
+        if kind == "rank":
+            return [(Protocol.OK, rank) if rank is not None else (Protocol.NOT_FOUND, 0)
+                    for rank in index.rank_many(arguments)]
+
+        if kind == "write":
+            # A queued update of the "snapshot" mode has no result yet, a rejected one has none at all
+            operations = [("insert" if request[2] == Protocol.INSERT else "delete", request[3]) for request in run]
+            queued = index.getMode() == "snapshot"
+            return [(Protocol.NOT_FOUND, 0) if result is False else
+                    (Protocol.ERROR, 0) if result is None and not queued else (Protocol.OK, 0)
+                    for result in index.update_many(operations)]
+
+        return [(Protocol.ERROR, 0)] * len(run)
@@ -0,0 +1,49 @@
+import struct
+
+
+class Protocol:
+    """
+        Binary wire format of the order statistic server.
+
+        Every message has a fixed size, in network byte order, so a stream is cut into frames
+        without delimiters and many requests can be pipelined on one connection:
+
+        - request (13 bytes): operation (uint8), request id (uint32), argument (int64),
+          the argument being a rank for SELECT and a key for RANK, INSERT and DELETE.
+        - response (13 bytes): request id (uint32), status (uint8), value (int64),
+          the selected key for SELECT, the rank for RANK, 0 otherwise.
+
+        Keys are 64-bit integers on the wire. Responses of one connection may come back in any
+        order; the request id matches them to their requests.
+    """
+
+    SELECT, RANK, INSERT, DELETE = 1, 2, 3, 4
+    OPERATIONS = {"select": SELECT, "rank": RANK, "insert": INSERT, "delete": DELETE}
+
+    OK, NOT_FOUND, ERROR = 0, 1, 2
+
+    REQUEST = struct.Struct("!BIq")
+    RESPONSE = struct.Struct("!IBq")
+
+    @classmethod
+    def encode_request( cls, operation: int, request_id: int, argument: int ) -> bytes:
+        return cls.REQUEST.pack(operation, request_id, argument)
+
+    @classmethod
+    def encode_response( cls, request_id: int, status: int, value: int = 0 ) -> bytes:
+        return cls.RESPONSE.pack(request_id, status, value)
+
+    @classmethod
+    def split( cls, buffer: bytes, frame: struct.Struct ) -> tuple[list[tuple], bytes]:
+        """
+            Decode every complete frame at the start of a buffer.
+
+            Parameters:
+                buffer (bytes): The bytes received so far.
+                frame (struct.Struct): REQUEST or RESPONSE.
+
+            Returns:
+                tuple[list[tuple], bytes]: The decoded frames and the bytes of an incomplete trailing frame.
+        """
+        end = len(buffer) - len(buffer) % frame.size
+        return list(frame.iter_unpack(buffer[:end])), buffer[end:]
@@ -37,28 +37,59 @@ def testOrderedList():
 
     print("✅ All OrderedList tests passed successfully!")
 
+def testOrderedListIndex():
+    values = [random.randint(1, 100) for _ in range(400)]
+    expected = sorted(values)
+
+    for stride in (1, 3, 16, "sqrt"):
+        ol = OrderedList(index_stride=stride)
+        for val in values:
+            ol.insert(val)
+
+        # Test 1: Order and length are the same as without the index
+        assert str(ol) == " -> ".join(map(str, expected)), f"❌ Test 1 Failed with stride {stride}"
+        assert len(ol) == len(expected), f"❌ Test 1 Failed: length with stride {stride}"
+
+        # Test 2: Every select (which jumps through the lane) matches a plain walk
+        head = ol.getHead()
+        for i in range(1, len(expected) + 1):
+            assert ol.OSSelect(head, i).getValue() == expected[i - 1], f"❌ Test 2 Failed on OSSelect({i})"
+
+        # Test 3: The lane stays sparse (a fixed stride leaves at least `stride` nodes between samples)
+        if stride != "sqrt":
+            assert ol.getIndexSize() <= len(expected) // stride, f"❌ Test 3 Failed with stride {stride}"
+
+    assert OrderedList().getIndexStride() is None, "❌ Test 4 Failed: index should be disabled by default"
+    try:
+        OrderedList(index_stride=0)
+        assert False, "❌ Test 5 Failed: stride 0 should be rejected"
+    except ValueError:
+        pass
+
+    print("✅ All OrderedList index tests passed successfully!")
+
 def testBinarySearchTree():
     # Test 1: Create tree and insert single node
     bst = BinarySearchTree()
     root = None
-    bst.insert(root, 10 )
+    bst.insert(10)
     assert bst.inorder(bst.getRoot()) == ["10"], f"❌ Test 1 Failed: {bst.inorder(bst.getRoot())}"
 
     # Test 2: Insert nodes to form BST
     bst = BinarySearchTree()
     root = None
-    root = bst.insert(root, 10 )
-    root = bst.insert(root, 5 )
-    root = bst.insert(root, 15 )
-    root = bst.insert(root, 3 )
-    root = bst.insert(root, 7 )
-    root = bst.insert(root, 12 )
-    root = bst.insert(root, 18 )
+    root = bst.insert(10)
+    root = bst.insert(5)
+    root = bst.insert(15)
+    root = bst.insert(3)
+    root = bst.insert(7)
+    root = bst.insert(12)
+    root = bst.insert(18)
     expected_inorder = ["3", "5", "7", "10", "12", "15", "18"]
     assert bst.inorder( bst.getRoot() ) == expected_inorder, f"❌ Test 2 Failed: {bst.inorder(bst.getRoot())}"
 
     # Test 3: Insert duplicate
-    root = bst.insert(root, 10 )
+    root = bst.insert(10)
     expected_inorder_with_duplicate = ["3", "5", "7", "10", "10", "12", "15", "18"]
     assert bst.inorder(bst.getRoot()) == expected_inorder_with_duplicate, f"❌ Test 3 Failed: {bst.inorder(bst.getRoot())}"
 
@@ -69,6 +100,119 @@ def testBinarySearchTree():
 
     print("✅ All BinarySearchTree tests passed successfully!")
 
+def testBinarySearchTreeSizeCache():
+    values = random.sample(range(1, 201), 200)
+    cached = BinarySearchTree(size_cache=True)
+    plain = BinarySearchTree(size_cache=False)
+    for val in values:
+        cached.insert(val)
+        plain.insert(val)
+
+    # Test 1: Cached and uncached select agree
+    for i in range(1, len(values) + 1):
+        assert cached.OSSelect(cached.getRoot(), i).getValue() == i, f"❌ Test 1 Failed on OSSelect({i})"
+        assert plain.OSSelect(plain.getRoot(), i).getValue() == i, f"❌ Test 1 Failed on OSSelect({i})"
+
+    # Test 2: Repeated queries are served from the cache, the uncached tree never counts hits
+    misses = cached.getCacheMisses()
+    cached.OSSelect(cached.getRoot(), 100)
+    assert cached.getCacheMisses() == misses, "❌ Test 2 Failed: repeated select should not miss"
+    assert cached.getCacheHits() > 0, "❌ Test 2 Failed: no cache hits recorded"
+    assert plain.getCacheHits() == 0 and plain.getCacheMisses() == 0, "❌ Test 2 Failed: disabled cache counted"
+
+    # Test 3: Insert only invalidates its path, sizes stay correct
+    cached.resetCacheStats()
+    cached.insert(0)
+    for i in range(1, len(values) + 2):
+        assert cached.OSSelect(cached.getRoot(), i).getValue() == i - 1, f"❌ Test 3 Failed on OSSelect({i})"
+    assert cached.getCacheHits() > 0, "❌ Test 3 Failed: insert should not drop the whole cache"
+
+    print("✅ All BinarySearchTree size cache tests passed successfully!")
+
+def testSortedInputWithoutRecursion():
+    # A BST fed sorted keys degenerates to a path deeper than the default recursion limit
+    n = 5000
+    bst = BinarySearchTree()
+    for val in range(1, n + 1):
+        bst.insert(val)
+
+    assert bst.inorder(bst.getRoot()) == [str(v) for v in range(1, n + 1)], "❌ Test 1 Failed: inorder"
+    assert bst.OSSelect(bst.getRoot(), n).getValue() == n, "❌ Test 2 Failed: OSSelect on the deepest node"
+    assert bst.OSRank(bst.OSSelect(bst.getRoot(), n)) == n, "❌ Test 3 Failed: OSRank on the deepest node"
+
+    avl = AVLTree()
+    for val in range(1, n + 1):
+        avl.insert(val)
+
+    assert [node.getValue() for node in avl.tree_to_list_inorder(avl.getRoot())] == list(range(1, n + 1)), \
+        "❌ Test 4 Failed: AVL inorder"
+    assert avl.getRoot().getParent() is None, "❌ Test 5 Failed: AVL root must not have a parent"
+    for i in (1, n // 2, n):
+        assert avl.OSSelect(avl.getRoot(), i).getValue() == i, f"❌ Test 6 Failed on OSSelect({i})"
+
+    print("✅ All sorted input tests passed successfully!")
+
+def testBulkLoad():
+    values = [random.randint(1, 300) for _ in range(500)]
+    distinct = sorted(set(values))
+
+    # Test 1: AVL bulk load keeps the AVL property, sizes and parent links
+    avl = AVLTree.from_iterable(values)
+
+    def check(node, parent):
+        if node is None:
+            return 0, 0
+        assert node.getParent() is parent, f"❌ Test 1 Failed: wrong parent on {node.getValue()}"
+        left_height, left_size = check(node.getLeft(), node)
+        right_height, right_size = check(node.getRight(), node)
+        assert abs(left_height - right_height) <= 1, "❌ Test 1 Failed: tree is unbalanced"
+        assert node.getHeight() == 1 + max(left_height, right_height), "❌ Test 1 Failed: wrong height"
+        assert node.getSize() == 1 + left_size + right_size, "❌ Test 1 Failed: wrong size"
+        return node.getHeight(), node.getSize()
+
+    check(avl.getRoot(), None)
+
+    # Test 2: OSSelect / OSRank work right away, and the tree stays usable for updates
+    for i, value in enumerate(distinct):
+        node = avl.OSSelect(avl.getRoot(), i + 1)
+        assert node.getValue() == value and avl.OSRank(node) == i + 1, f"❌ Test 2 Failed on {value}"
+    avl.insert(1000)
+    avl.delete(distinct[0])
+    assert avl.OSSelect(avl.getRoot(), len(distinct)).getValue() == 1000, "❌ Test 2 Failed after update"
+
+    # Test 3: BST bulk load keeps duplicates
+    bst = BinarySearchTree.from_iterable(values)
+    assert bst.inorder(bst.getRoot()) == [str(v) for v in sorted(values)], "❌ Test 3 Failed: inorder"
+    for i, value in enumerate(sorted(values)):
+        assert bst.OSSelect(bst.getRoot(), i + 1).getValue() == value, f"❌ Test 3 Failed on OSSelect({i + 1})"
+
+    # Test 4: Empty input
+    assert AVLTree.from_sorted([]).getRoot() is None, "❌ Test 4 Failed: AVL should be empty"
+    assert BinarySearchTree.from_sorted([]).getRoot() is None, "❌ Test 4 Failed: BST should be empty"
+
+    # Test 5: Heavy duplicates stay balanced, without recursion, and lookups find the first copy
+    def height(node):
+        depth, level = 0, [node] if node else []
+        while level:
+            depth += 1
+            level = [child for n in level for child in (n.getLeft(), n.getRight()) if child]
+        return depth
+
+    same = BinarySearchTree.from_iterable([5] * 3000)
+    assert height(same.getRoot()) <= 12, "❌ Test 5 Failed: a run of equal keys should be balanced"
+    assert same.rank_of(5) == 1 and same.OSRank(same.find(5)) == 1, "❌ Test 5 Failed: first copy of a run"
+    assert same.count_range(5, 5) == 3000 and same.rank_of(4) is None, "❌ Test 5 Failed: count of a run"
+
+    runs = BinarySearchTree.from_iterable([2] * 1000 + [1] * 1000 + [3] * 1000)
+    assert height(runs.getRoot()) <= 12, "❌ Test 5 Failed: runs of equal keys should be balanced"
+    for key, rank in ((1, 1), (2, 1001), (3, 2001)):
+        assert runs.rank_of(key) == rank and runs.OSRank(runs.find(key)) == rank, f"❌ Test 5 Failed: rank of {key}"
+    runs.insert(2)
+    assert runs.count_range(2, 2) == 1001 and runs.rank_of(3) == 2002, "❌ Test 5 Failed: insert into a balanced run"
+    assert [node.getValue() for node in runs.iter_from(2)][:2] == [2, 2], "❌ Test 5 Failed: iter_from a run"
+
+    print("✅ All bulk load tests passed successfully!")
+
 def testAVLTree():
     avl = AVLTree()
     root = None
@@ -94,4 +238,8 @@ def testAVLTree():
 
 testOrderedList()
 testBinarySearchTree()
-testAVLTree()
\ No newline at end of file
+testBinarySearchTreeSizeCache()
+testSortedInputWithoutRecursion()
+testAVLTree()
+testBulkLoad()
+testOrderedListIndex()
\ No newline at end of file
@@ -1,3 +1,7 @@
+import copy
+import pickle
+import sys
+
 from DataStructure.Node.AVLNode import AVLNode
 from DataStructure.Node.ListNode import ListNode
 from DataStructure.Node.Node import Node
@@ -98,8 +102,52 @@ def testAVLNode():
     print("✅ AVLNode tests passed!")
 
 
+def testCompactNodes():
+    # Nodes are slotted: no per-instance __dict__ and no redundant child fields on AVLNode
+    for node in (Node(1), ListNode(1), TreeNode(1), AVLNode(1)):
+        assert not hasattr(node, "__dict__"), f"❌ {type(node).__name__} should not have a __dict__"
+
+    # Count and payload slots only exist on the variants of the modes that need them
+    counted = ListNode.variant(counted=True, keyed=True)(1)
+    assert ListNode(1).getCount() == 1 and not hasattr(ListNode(1), "setCount"), "❌ A plain node has count 1 and no slot"
+    assert sys.getsizeof(ListNode(1)) + 16 == sys.getsizeof(counted), "❌ Plain nodes should not pay for count and payload"
+    counted.setCount(3)
+    assert counted.getCount() == 3 and isinstance(counted, ListNode), "❌ Error on counted variant"
+    assert ListNode.variant(counted=True) is ListNode.variant(counted=True), "❌ Variants should be cached"
+
+    # Variants are built at runtime, yet copy and pickle keep their class and their slots
+    counted.setPayload("record")
+    for clone in (copy.deepcopy(counted), pickle.loads(pickle.dumps(counted))):
+        assert type(clone) is type(counted), f"❌ A copy should keep the {type(counted).__name__} class"
+        assert (clone.getValue(), clone.getCount(), clone.getPayload()) == (1, 3, "record"), "❌ A copy lost a slot"
+
+    left, right = AVLNode(1), AVLNode(3)
+    avl = AVLNode(2, left, right)
+    assert avl.getLeft() is left and avl.getRight() is right, "❌ AVLNode children not passed to TreeNode"
+
+    print("✅ Compact node tests passed!")
+
+
+def testGenericNode():
+    # Any totally ordered key is accepted, with an optional payload
+    f1, f2 = Node(1.5), Node(2.25)
+    assert f1 < f2 and f2 >= f1, "❌ Float comparison failed"
+    t1, t2 = Node((2024, 1, "b")), Node((2024, 1, "c"))
+    assert t1 < t2 and not (t1 == t2), "❌ Tuple comparison failed"
+
+    n = Node.variant(keyed=True)("key")
+    assert n.getPayload() is None, "❌ Payload should default to None"
+    n.setPayload({"id": 7})
+    assert n.getPayload() == {"id": 7}, "❌ setPayload did not update the payload"
+    assert Node("key").getPayload() is None, "❌ A plain node has no payload"
+
+    print("✅ Generic Node tests passed!")
+
+
 # Run the tests
 testNode()
 testListNode()
 testTreeNode()
 testAVLNode()
+testCompactNodes()
+testGenericNode()
\ No newline at end of file
@@ -1,7 +1,22 @@
+import copy
+import pickle
+import random
+import sys
+import threading
+from bisect import bisect_left
+from itertools import islice
+
 from DataStructure.AVLTree import AVLTree
+from DataStructure.ArrayAVLTree import ArrayAVLTree
+from DataStructure.BPlusTree import BPlusTree
 from DataStructure.BinarySearchTree import BinarySearchTree
+from DataStructure.ConcurrentStructure import ConcurrentStructure
+from DataStructure.FenwickTree import FenwickTree
 from DataStructure.Node.Node import Node
 from DataStructure.OrderedList import OrderedList
+from DataStructure.PersistentAVLTree import PersistentAVLTree
+from DataStructure.SkipList import SkipList
+from DataStructure.SortedBlockList import SortedBlockList
 
 
 def OrderedListTestOSSelectOSSRank():
@@ -40,7 +55,7 @@ def BSTTestOSSelectOSSRank():
     root = None
     bst = BinarySearchTree()
     for v in values:
-        root= bst.insert(root, v)
+        root = bst.insert(v)
 
     print("BST:")
     print(bst)
@@ -57,18 +72,8 @@ def BSTTestOSSelectOSSRank():
         assert node.getValue() == inorder_expected[i - 1], f"❌ Error on OSSelect({i})"
 
     print("\nOSRank Test:")
-    def findNodeByValueHelper(tree_node, value):
-        if not tree_node:
-            return None
-        if value == tree_node.getValue():
-            return tree_node
-        elif value < tree_node.getValue():
-            return findNodeByValueHelper(tree_node.getLeft(), value)
-        else:
-            return findNodeByValueHelper(tree_node.getRight(), value)
-
     for idx, value in enumerate(inorder_expected):
-        node = findNodeByValueHelper(startRoot, value)
+        node = bst.find(value)
         rank = bst.OSRank(node)
         print(f"OSRank({value}):", rank)
         print(f"Index + 1 ({value}):", idx + 1 )
@@ -99,19 +104,9 @@ def AVLTreeTestOSSelectOSSRank():
         print("On Expected({i}) -> ", inorder_expected[i - 1])
         assert node.getValue() == inorder_expected[i - 1], f"❌ Error on OSSelect({i})"
 
-    def findNodeByValueHelper(avl_node, value):
-        if not avl_node:
-            return None
-        if value == avl_node.getValue():
-            return avl_node
-        elif value < avl_node.getValue():
-            return findNodeByValueHelper(avl_node.getLeft(), value)
-        else:
-            return findNodeByValueHelper(avl_node.getRight(), value)
-
     print("\nOSRank Test:")
     for idx, value in enumerate(inorder_expected):
-        node = findNodeByValueHelper(root, value)
+        node = avl.find(value)
         rank = avl.OSRank(node)
         print(f"OSRank({value}) -> {rank}")
         assert rank == idx + 1, f"❌ Error on OSRank({value})"
@@ -119,6 +114,932 @@ def AVLTreeTestOSSelectOSSRank():
     print("\n ✅ All AVL Tree Tests of OSSelect and OSRank Passed")
 
 
+def AVLTreeTestDeleteOSSelectOSSRank():
+    random.seed(7)
+    avl = AVLTree()
+    keys = set()
+
+    def checkInvariants(node, parent=None):
+        if node is None:
+            return 0, 0
+        assert node.getParent() is parent, f"❌ Wrong parent on {node.getValue()}"
+        left_height, left_size = checkInvariants(node.getLeft(), node)
+        right_height, right_size = checkInvariants(node.getRight(), node)
+        assert abs(left_height - right_height) <= 1, f"❌ Unbalanced on {node.getValue()}"
+        assert node.getHeight() == 1 + max(left_height, right_height), f"❌ Wrong height on {node.getValue()}"
+        assert node.getSize() == 1 + left_size + right_size, f"❌ Wrong size on {node.getValue()}"
+        return node.getHeight(), node.getSize()
+
+    for step in range(2000):
+        key = random.randint(1, 300)
+        if random.random() < 0.55:
+            avl.insert(key)
+            keys.add(key)
+        else:
+            assert avl.delete(key) == (key in keys), f"❌ Error on the result of delete({key})"
+            keys.discard(key)
+
+        if step % 50 == 0:
+            checkInvariants(avl.getRoot())
+            expected = sorted(keys)
+            for i, value in enumerate(expected):
+                node = avl.OSSelect(avl.getRoot(), i + 1)
+                assert node.getValue() == value, f"❌ Error on OSSelect({i + 1}) after delete"
+                assert avl.OSRank(node) == i + 1, f"❌ Error on OSRank({value}) after delete"
+
+    # Delete everything left, then the tree must be empty
+    for key in list(keys):
+        avl.delete(key)
+    assert avl.getRoot() is None, "❌ Tree should be empty after deleting every key"
+
+    print("\n ✅ All AVL Tree Tests of delete with OSSelect and OSRank Passed")
+
+
+def ArrayAVLTreeTestOSSelectOSSRank():
+    values = [20, 10, 30, 5, 15, 25, 35, 1, 4, 6, 9, 2, 11, 12, 22, 45, 33, 56]
+    tree = ArrayAVLTree()
+    handles = {v: tree.insert(v) for v in values}
+
+    print("Array AVL Tree:")
+    print(tree)
+
+    inorder_expected = sorted(values)
+    for i in range(1, len(values) + 1):
+        handle = tree.OSSelect(tree.getRoot(), i)
+        assert tree.getValue(handle) == inorder_expected[i - 1], f"❌ Error on OSSelect({i})"
+    assert tree.OSSelect(tree.getRoot(), len(values) + 1) is None, "❌ Error on OSSelect out of bounds"
+
+    for idx, value in enumerate(inorder_expected):
+        assert tree.OSRank(handles[value]) == idx + 1, f"❌ Error on OSRank({value})"
+
+    # Random insert/delete sequence checked against the node based AVLTree
+    random.seed(11)
+    tree = ArrayAVLTree()
+    avl = AVLTree()
+    for step in range(3000):
+        key = random.randint(1, 400)
+        if random.random() < 0.55:
+            tree.insert(key)
+            avl.insert(key)
+        else:
+            tree.delete(key)
+            avl.delete(key)
+
+        if step % 100 == 0:
+            assert len(tree) == AVLTree.size(avl.getRoot()), "❌ Error on size after insert/delete"
+            for i in range(1, len(tree) + 1):
+                handle = tree.OSSelect(tree.getRoot(), i)
+                assert tree.getValue(handle) == avl.OSSelect(avl.getRoot(), i).getValue(), \
+                    f"❌ Error on OSSelect({i}) after insert/delete"
+                assert tree.OSRank(handle) == i, f"❌ Error on OSRank({i}) after insert/delete"
+            assert abs(tree.getHeight(tree.getRoot()) - AVLTree.height(avl.getRoot())) <= 1, "❌ Tree is unbalanced"
+
+    print("\n ✅ All Array AVL Tree Tests of OSSelect and OSRank Passed")
+
+
+def TestOSSelectMany():
+    values = random.sample(range(1, 501), 300)
+    expected = sorted(values)
+    ks = [random.randint(1, len(values)) for _ in range(200)] + [1, len(values)]
+
+    ordered_list = OrderedList()
+    bst = BinarySearchTree()
+    avl = AVLTree()
+    for v in values:
+        ordered_list.insert(v)
+        bst.insert(v)
+        avl.insert(v)
+
+    for name, structure in (("OrderedList", ordered_list), ("BST", bst), ("AVL", avl)):
+        nodes = structure.OSSelect_many(ks)
+        assert [n.getValue() for n in nodes] == [expected[k - 1] for k in ks], f"❌ Error on {name} OSSelect_many"
+
+    # Out of bounds ranks: None for the trees, IndexError for the list (as OSSelect)
+    assert bst.OSSelect_many([0, len(values) + 1]) == [None, None], "❌ Error on BST OSSelect_many bounds"
+    assert avl.OSSelect_many([len(values) + 1])[0] is None, "❌ Error on AVL OSSelect_many bounds"
+    try:
+        ordered_list.OSSelect_many([1, len(values) + 1])
+        assert False, "❌ OrderedList OSSelect_many should raise IndexError"
+    except IndexError:
+        pass
+    assert ordered_list.OSSelect_many([]) == [], "❌ Error on empty OSSelect_many"
+
+    print("\n ✅ All OSSelect_many Tests Passed")
+
+
+def TestOSRankMany():
+    values = random.sample(range(1, 501), 300)
+    expected = {v: i + 1 for i, v in enumerate(sorted(values))}
+
+    ordered_list = OrderedList()
+    bst = BinarySearchTree()
+    avl = AVLTree()
+    for v in values:
+        ordered_list.insert(v)
+        bst.insert(v)
+        avl.insert(v)
+
+    # Full set of nodes, in a shuffled order
+    for name, structure, nodes in (
+            ("OrderedList", ordered_list, ordered_list.OSSelect_many(list(range(1, len(values) + 1)))),
+            ("BST", bst, bst.OSSelect_many(list(range(1, len(values) + 1)))),
+            ("AVL", avl, avl.tree_to_list_inorder(avl.getRoot()))):
+        random.shuffle(nodes)
+        ranks = structure.OSRank_many(nodes)
+        assert ranks == [expected[n.getValue()] for n in nodes], f"❌ Error on {name} OSRank_many of nodes"
+        assert ranks == [structure.OSRank(n) for n in nodes], f"❌ Error on {name} OSRank_many vs OSRank"
+
+        # Keys, including a missing one
+        keys = random.sample(values, 50) + [1000]
+        assert structure.OSRank_many(keys) == [expected.get(k) for k in keys], f"❌ Error on {name} OSRank_many of keys"
+
+    print("\n ✅ All OSRank_many Tests Passed")
+
+
+def SkipListTestOSSelectOSSRank():
+    values = [20, 10, 30, 5, 15, 25, 35, 1, 4, 6, 9, 2, 11, 12, 22, 45, 33, 56]
+    skip_list = SkipList(seed=3)
+    for v in values:
+        skip_list.insert(v)
+
+    print("Skip List:")
+    print(skip_list)
+
+    inorder_expected = sorted(values)
+    selected_nodes = []
+    for i in range(1, len(values) + 1):
+        node = skip_list.OSSelect(skip_list.getHead(), i)
+        assert node.getValue() == inorder_expected[i - 1], f"❌ Error on OSSelect({i})"
+        selected_nodes.append(node)
+
+    for idx, node in enumerate(selected_nodes):
+        assert skip_list.OSRank(node) == idx + 1, f"❌ Error on OSRank({node.getValue()})"
+
+    # Random insert/delete sequence with duplicates, checked against a sorted Python list
+    random.seed(5)
+    skip_list = SkipList(seed=5)
+    expected = []
+    for step in range(3000):
+        key = random.randint(1, 200)
+        if random.random() < 0.6:
+            skip_list.insert(key)
+            expected.append(key)
+            expected.sort()
+        else:
+            assert skip_list.delete(key) == (key in expected), f"❌ Error on delete({key})"
+            if key in expected:
+                expected.remove(key)
+
+        if step % 100 == 0:
+            assert len(skip_list) == len(expected), "❌ Error on length after insert/delete"
+            assert str(skip_list) == " -> ".join(map(str, expected)), "❌ Error on order after insert/delete"
+            for i in range(1, len(expected) + 1):
+                node = skip_list.OSSelect(skip_list.getHead(), i)
+                assert node.getValue() == expected[i - 1], f"❌ Error on OSSelect({i}) after insert/delete"
+                assert skip_list.OSRank(node) == i, f"❌ Error on OSRank({i}) after insert/delete"
+
+    # Same seed, same shape
+    first, second = SkipList(seed=9), SkipList(seed=9)
+    for v in values:
+        first.insert(v)
+        second.insert(v)
+    assert first.getLevel() == second.getLevel(), "❌ Seeded skip lists should have the same levels"
+
+    print("\n ✅ All Skip List Tests of OSSelect and OSRank Passed")
+
+
+def OrderedListCursorTest():
+    values = random.sample(range(1, 201), 100)
+    expected = sorted(values)
+    ordered_list = OrderedList()
+    for v in values:
+        ordered_list.insert(v)
+
+    cursor = ordered_list.cursor()
+
+    # Sequential, forward jumps and backward jumps
+    for i in [1, 2, 3, 8, 9, 50, 51, 10, 52, 100, 99, 1, 75]:
+        node = cursor.select(i)
+        assert node.getValue() == expected[i - 1], f"❌ Error on cursor select({i})"
+        assert cursor.getPosition() == i, f"❌ Cursor position should be {i}"
+
+    # Insert invalidates the cursor, the next select is still correct
+    ordered_list.insert(0)
+    expected = [0] + expected
+    assert not cursor.isValid(), "❌ Cursor should be invalid after insert"
+    assert cursor.select(75).getValue() == expected[74], "❌ Error on cursor select after insert"
+    assert cursor.isValid(), "❌ Cursor should be valid again after select"
+
+    try:
+        cursor.select(len(expected) + 1)
+        assert False, "❌ Cursor select out of range should raise IndexError"
+    except IndexError:
+        pass
+
+    print("\n ✅ All Ordered List Cursor Tests Passed")
+
+
+def OrderedListRankStampsTest():
+    values = [random.randint(1, 50) for _ in range(300)]
+
+    plain = OrderedList()
+    stamped = OrderedList(rank_stamps=True)
+    for v in values:
+        plain.insert(v)
+        stamped.insert(v)
+
+    # Duplicates: every node has its own rank (identity, not value equality)
+    for ordered_list in (plain, stamped):
+        nodes = ordered_list.OSSelect_many(list(range(1, len(values) + 1)))
+        for i, node in enumerate(nodes):
+            assert ordered_list.OSRank(node) == i + 1, f"❌ Error on OSRank of duplicate at {i + 1}"
+        assert ordered_list.OSRank_many(nodes) == list(range(1, len(values) + 1)), "❌ Error on OSRank_many"
+
+    # An insert restamps the nodes after it, so every stamp stays exact
+    stamped.insert(25)
+    expected = sorted(values + [25])
+    nodes = stamped.OSSelect_many(list(range(1, len(expected) + 1)))
+    for i, node in enumerate(reversed(nodes)):
+        assert stamped.OSRank(node) == len(expected) - i, "❌ Error on OSRank after insert with stamps"
+
+    # A node from another list (even with an equal value, even stamped) has no rank here
+    assert stamped.OSRank(plain.getHead()) is None, "❌ Foreign node should not be ranked"
+    assert plain.OSRank(stamped.getHead()) is None, "❌ Foreign node should not be ranked"
+    other = OrderedList(rank_stamps=True)
+    other.insert(stamped.getHead().getValue())
+    assert other.OSRank(stamped.getHead()) is None, "❌ Foreign stamped node should not be ranked"
+    assert stamped.OSRank(other.getHead()) is None, "❌ Foreign stamped node should not be ranked"
+
+    # Inserts interleaved with rank queries, new nodes and grown counts alike
+    for multiset in (False, True):
+        stamped = OrderedList(rank_stamps=True, multiset=multiset)
+        for step in range(600):
+            stamped.insert(random.randint(1, 80))
+            if step % 7 == 0:
+                expected = 1
+                current = stamped.getHead()
+                while current is not None:
+                    assert stamped.OSRank(current) == expected, f"❌ Error on OSRank with stamps at step {step}"
+                    expected += current.getCount()
+                    current = current.getNext()
+
+    print("\n ✅ All Ordered List Rank Stamps Tests Passed")
+
+
+def MultisetTest():
+    values = [random.randint(1, 30) for _ in range(400)]
+    expected = sorted(values)
+    distinct = sorted(set(values))
+
+    root = None
+    bst = BinarySearchTree(multiset=True)
+    avl = AVLTree(multiset=True)
+    ordered_list = OrderedList(multiset=True, index_stride=4)
+    for v in values:
+        root = bst.insert(v)
+        avl.insert(v)
+        ordered_list.insert(v)
+
+    # One node per distinct key, the counts hold the multiplicity
+    assert len(avl.tree_to_list_inorder(avl.getRoot())) == len(distinct), "❌ AVL should keep one node per key"
+    assert len(ordered_list) == len(values), "❌ Ordered List length should count every copy"
+    assert str(ordered_list) == " -> ".join(map(str, expected)), "❌ Error on multiset Ordered List order"
+
+    for tree, start in ((bst, bst.getRoot()), (avl, avl.getRoot()), (ordered_list, ordered_list.getHead())):
+        for i in range(1, len(expected) + 1):
+            node = tree.OSSelect(start, i)
+            assert node.getValue() == expected[i - 1], f"❌ Error on multiset OSSelect({i})"
+            # The rank of a node is the rank of the first copy of its key
+            assert tree.OSRank(node) == expected.index(node.getValue()) + 1, f"❌ Error on multiset OSRank({i})"
+        assert [n.getValue() for n in tree.OSSelect_many(list(range(1, len(expected) + 1)))] == expected, \
+            "❌ Error on multiset OSSelect_many"
+        assert tree.OSRank_many(distinct) == [expected.index(v) + 1 for v in distinct], "❌ Error on multiset OSRank_many"
+
+    cursor = ordered_list.cursor()
+    for i in random.sample(range(1, len(expected) + 1), 50):
+        assert cursor.select(i).getValue() == expected[i - 1], f"❌ Error on multiset cursor select({i})"
+
+    # Deleting a repeated key only decrements its count
+    for v in values[:200]:
+        avl.delete(v)
+        expected.remove(v)
+    assert avl.size(avl.getRoot()) == len(expected), "❌ Error on multiset AVL size after delete"
+    for i in range(1, len(expected) + 1):
+        assert avl.OSSelect(avl.getRoot(), i).getValue() == expected[i - 1], f"❌ Error on OSSelect({i}) after delete"
+
+    print("\n ✅ All Multiset Tests Passed")
+
+def GenericKeyTest():
+    # Records ranked through a key function: the key is stored in the node, the record as payload
+    records = [(random.random() * 100, f"event-{i}") for i in range(300)]
+    by_time = sorted(records)
+
+    root = None
+    bst = BinarySearchTree(key=lambda r: r[0])
+    avl = AVLTree(key=lambda r: r[0])
+    ordered_list = OrderedList(key=lambda r: r[0], index_stride=8)
+    skip_list = SkipList(seed=3, key=lambda r: r[0])
+    for record in records:
+        root = bst.insert(record)
+        avl.insert(record)
+        ordered_list.insert(record)
+        skip_list.insert(record)
+    bulk = AVLTree.from_iterable(records, key=lambda r: r[0])
+
+    for tree, start in ((bst, bst.getRoot()), (avl, avl.getRoot()), (bulk, bulk.getRoot()),
+                        (ordered_list, ordered_list.getHead()), (skip_list, skip_list.getHead())):
+        for i in range(1, len(by_time) + 1):
+            node = tree.OSSelect(start, i)
+            assert node.getValue() == by_time[i - 1][0], f"❌ Error on OSSelect({i}) with a key function"
+            assert node.getPayload() is by_time[i - 1], f"❌ Error on payload of OSSelect({i})"
+            assert tree.OSRank(node) == i, f"❌ Error on OSRank({i}) with a key function"
+
+    # Plain tuple and string keys, without a key function
+    words = AVLTree.from_iterable(["pear", "apple", "fig", "kiwi"])
+    assert [n.getValue() for n in words.tree_to_list_inorder(words.getRoot())] == ["apple", "fig", "kiwi", "pear"], \
+        "❌ Error on string keys"
+    assert words.OSRank_many(["kiwi", "plum"]) == [3, None], "❌ Error on OSRank_many with string keys"
+
+    print("\n ✅ All Generic Key Tests Passed")
+
+def RankOfFindContainsTest():
+    values = [random.randint(1, 200) for _ in range(300)]
+    expected = sorted(values)
+    missing = [v for v in range(0, 202) if v not in values]
+
+    root = None
+    bst = BinarySearchTree()
+    avl = AVLTree()
+    array_avl = ArrayAVLTree()
+    ordered_list = OrderedList(index_stride=8)
+    skip_list = SkipList(seed=5)
+    multiset = AVLTree(multiset=True)
+    for v in values:
+        root = bst.insert(v)
+        avl.insert(v)
+        array_avl.insert(v)
+        ordered_list.insert(v)
+        skip_list.insert(v)
+        multiset.insert(v)
+
+    distinct = sorted(set(values))
+    # Duplicates are kept by BST, OrderedList, SkipList and the multiset: the rank is the first copy's
+    for structure, keys in ((bst, expected), (ordered_list, expected), (skip_list, expected), (multiset, expected),
+                            (avl, distinct), (array_avl, distinct)):
+        for v in set(values):
+            assert structure.rank_of(v) == keys.index(v) + 1, f"❌ Error on rank_of({v})"
+            assert v in structure, f"❌ Error on contains({v})"
+            node = structure.find(v)
+            value = structure.getValue(node) if structure is array_avl else node.getValue()
+            assert value == v, f"❌ Error on find({v})"
+        for v in missing:
+            assert structure.rank_of(v) is None, f"❌ rank_of({v}) should be None"
+            assert v not in structure and structure.find(v) is None, f"❌ {v} should not be found"
+
+    # find returns the node that OSRank ranks like rank_of
+    for v in set(values):
+        assert ordered_list.OSRank(ordered_list.find(v)) == ordered_list.rank_of(v), f"❌ Error on find/OSRank({v})"
+        assert skip_list.OSRank(skip_list.find(v)) == skip_list.rank_of(v), f"❌ Error on find/OSRank({v})"
+        assert bst.OSRank(bst.find(v)) == bst.rank_of(v), f"❌ Error on find/OSRank({v})"
+
+    print("\n ✅ All rank_of / find / contains Tests Passed")
+
+def RangeQueriesTest():
+    values = [random.randint(1, 100) for _ in range(300)]
+    expected = sorted(values)
+
+    root = None
+    bst = BinarySearchTree()
+    avl = AVLTree(multiset=True)
+    ordered_list = OrderedList(index_stride=8, multiset=True)
+    skip_list = SkipList(seed=7)
+    for v in values:
+        root = bst.insert(v)
+        avl.insert(v)
+        ordered_list.insert(v)
+        skip_list.insert(v)
+
+    for lo, hi in ((1, 100), (20, 40), (50, 50), (0, 0), (101, 200), (40, 20), (-5, 3)):
+        in_range = [v for v in expected if lo <= v <= hi]
+        assert avl.count_range(lo, hi) == len(in_range), f"❌ Error on AVL count_range({lo}, {hi})"
+        assert bst.count_range(lo, hi) == len(in_range), f"❌ Error on BST count_range({lo}, {hi})"
+        for structure in (bst, avl, ordered_list, skip_list):
+            # Multiset nodes are yielded once per key, with their count
+            yielded = [v for node in structure.iter_range(lo, hi) for v in [node.getValue()] * node.getCount()]
+            assert yielded == in_range, f"❌ Error on iter_range({lo}, {hi})"
+
+    for k1, k2 in ((1, 300), (1, 1), (17, 123), (250, 400), (301, 310), (5, 4)):
+        in_ranks = expected[k1 - 1:k2]
+        for structure in (bst, avl, ordered_list, skip_list):
+            assert [node.getValue() for node in structure.iter_ranks(k1, k2)] == in_ranks, \
+                f"❌ Error on iter_ranks({k1}, {k2})"
+
+    # The iterators are lazy: taking the first node does not walk the range
+    first = next(avl.iter_range(10, 90))
+    assert first is avl.find(min(v for v in expected if v >= 10)), "❌ Error on lazy iter_range"
+
+    print("\n ✅ All Range Query Tests Passed")
+
+def InOrderGeneratorsTest():
+    values = [random.randint(1, 500) for _ in range(400)]
+    expected = sorted(values)
+    distinct = sorted(set(values))
+
+    root = None
+    bst = BinarySearchTree()
+    avl = AVLTree()
+    array_avl = ArrayAVLTree()
+    ordered_list = OrderedList(index_stride=8)
+    skip_list = SkipList(seed=11)
+    for v in values:
+        root = bst.insert(v)
+        avl.insert(v)
+        array_avl.insert(v)
+        ordered_list.insert(v)
+        skip_list.insert(v)
+
+    cases = ((bst, expected, Node.getValue), (avl, distinct, Node.getValue),
+             (array_avl, distinct, array_avl.getValue), (ordered_list, expected, Node.getValue),
+             (skip_list, expected, Node.getValue))
+    for structure, keys, value_of in cases:
+        assert [value_of(x) for x in structure] == keys, "❌ Error on __iter__"
+        for key in (0, 1, 137, 250, 500, 501):
+            assert [value_of(x) for x in structure.iter_from(key)] == [v for v in keys if v >= key], \
+                f"❌ Error on iter_from({key})"
+        for k in (1, 2, 100, len(keys), len(keys) + 1):
+            assert [value_of(x) for x in structure.iter_from_rank(k)] == keys[k - 1:], f"❌ Error on iter_from_rank({k})"
+
+    # Sorted inserts build a degenerate BST: the generators stream it without recursion
+    n = 5000
+    chain = BinarySearchTree(size_cache=False)
+    for v in range(1, n + 1):
+        chain.insert(v)
+    assert [x.getValue() for x in islice(chain.iter_from_rank(4990), 3)] == [4990, 4991, 4992], "❌ Error on deep iter_from_rank"
+    assert sum(1 for _ in chain) == n, "❌ Error on deep __iter__"
+
+    print("\n ✅ All In-Order Generator Tests Passed")
+
+def BPlusTreeTestOSSelectOSSRank():
+    for fanout in (4, 7, 64):
+        values = [random.randint(1, 400) for _ in range(1500)]
+        expected = sorted(values)
+        tree = BPlusTree(fanout)
+        for v in values:
+            tree.insert(v)
+        bulk = BPlusTree.from_sorted(expected, fanout)
+
+        for structure in (tree, bulk):
+            assert list(structure) == expected, f"❌ Error on B+-tree order with fanout {fanout}"
+            for i in range(1, len(expected) + 1):
+                assert structure.OSSelect(structure.getRoot(), i) == expected[i - 1], f"❌ Error on OSSelect({i})"
+            for v in range(0, 402):
+                rank = expected.index(v) + 1 if v in expected else None
+                assert structure.OSRank(v) == rank, f"❌ Error on OSRank({v})"
+            assert structure.OSSelect(structure.getRoot(), len(expected) + 1) is None, "❌ Out of bounds should be None"
+
+        # Deletes borrow from or merge with siblings: the order statistics stay exact
+        random.shuffle(values)
+        for v in values[:1200]:
+            assert tree.delete(v), f"❌ Error on delete({v})"
+            expected.remove(v)
+        assert not tree.delete(1000), "❌ Missing key should not be deleted"
+        assert len(tree) == len(expected) and list(tree) == expected, "❌ Error on B+-tree after deletes"
+        for i in range(1, len(expected) + 1):
+            assert tree.OSSelect(tree.getRoot(), i) == expected[i - 1], f"❌ Error on OSSelect({i}) after deletes"
+        assert tree.count_range(100, 300) == sum(1 for v in expected if 100 <= v <= 300), "❌ Error on count_range"
+
+    # A large fanout keeps the tree shallow
+    assert BPlusTree.from_sorted(range(100000), 64).height() <= 3, "❌ B+-tree should be shallow"
+
+    print("\n ✅ All B+-Tree Tests of OSSelect and OSRank Passed")
+
+def SortedBlockListTestOSSelectOSSRank():
+    for load in (4, 16):
+        values = [random.randint(1, 400) for _ in range(1500)]
+        expected = sorted(values)
+        blocks = SortedBlockList(load)
+        for v in values:
+            blocks.insert(v)
+        bulk = SortedBlockList.from_sorted(expected, load)
+
+        for structure in (blocks, bulk):
+            assert list(structure) == expected, f"❌ Error on block list order with load {load}"
+            for i in range(1, len(expected) + 1):
+                assert structure.OSSelect(None, i) == expected[i - 1], f"❌ Error on OSSelect({i})"
+            for v in range(0, 402):
+                rank = expected.index(v) + 1 if v in expected else None
+                assert structure.OSRank(v) == rank, f"❌ Error on OSRank({v})"
+
+        # Deletes interleaved with selects: the lazy prefix index follows splits and merges
+        random.shuffle(values)
+        for v in values[:1200]:
+            assert blocks.delete(v), f"❌ Error on delete({v})"
+            expected.remove(v)
+            k = random.randint(1, len(expected) + 1)
+            assert blocks.OSSelect(None, k) == (expected[k - 1] if k <= len(expected) else None), \
+                f"❌ Error on OSSelect({k}) after delete"
+        assert not blocks.delete(1000), "❌ Missing key should not be deleted"
+        assert list(blocks) == expected, "❌ Error on block list after deletes"
+        assert blocks.count_range(100, 300) == sum(1 for v in expected if 100 <= v <= 300), "❌ Error on count_range"
+
+    print("\n ✅ All Sorted Block List Tests of OSSelect and OSRank Passed")
+
+def FenwickTreeTestOSSelectOSSRank():
+    import numpy as np
+
+    values = [random.randint(1, 300) for _ in range(1000)]
+    sparse = [v * 1000003 for v in values]
+    expected = sorted(values)
+
+    tree = FenwickTree(1, 300)
+    for v in values:
+        tree.insert(v)
+    bulk = FenwickTree.from_numpy(np.array(values), 1, 300)
+    compressed = FenwickTree.from_numpy(np.array(sparse), compress=True)
+    assert compressed.getUniverseSize() == len(set(values)), "❌ Compression should keep only the distinct keys"
+
+    for structure, keys in ((tree, expected), (bulk, expected), (compressed, sorted(sparse))):
+        assert list(structure) == keys, "❌ Error on Fenwick tree order"
+        for i in range(1, len(keys) + 1):
+            assert structure.OSSelect(None, i) == keys[i - 1], f"❌ Error on OSSelect({i})"
+        for v in set(keys):
+            assert structure.OSRank(v) == keys.index(v) + 1, f"❌ Error on OSRank({v})"
+        assert structure.OSRank(keys[-1] + 1) is None, "❌ Missing key should have no rank"
+
+    random.shuffle(values)
+    for v in values[:700]:
+        assert tree.delete(v), f"❌ Error on delete({v})"
+        expected.remove(v)
+    assert not tree.delete(0) and not tree.delete(1000), "❌ Keys outside the universe should not be deleted"
+    assert list(tree) == expected, "❌ Error on Fenwick tree after deletes"
+    for i in range(1, len(expected) + 1):
+        assert tree.OSSelect(None, i) == expected[i - 1], f"❌ Error on OSSelect({i}) after deletes"
+    assert tree.count_range(50, 150) == sum(1 for v in expected if 50 <= v <= 150), "❌ Error on count_range"
+
+    try:
+        tree.insert(301)
+        assert False, "❌ A key outside the universe should be rejected"
+    except ValueError:
+        pass
+
+    # Bulk load edge cases: empty input gives an empty tree, float keys are not truncated
+    for empty in (FenwickTree.from_numpy(np.array([], dtype=np.int64)), FenwickTree.from_numpy([]),
+                  FenwickTree.from_numpy([], compress=True), FenwickTree.from_numpy([], 1, 300)):
+        assert len(empty) == 0 and list(empty) == [] and empty.OSRank(1) is None, "❌ Error on empty bulk load"
+    assert FenwickTree.from_numpy([], 1, 300).getUniverseSize() == 300, "❌ An empty bulk load should keep its universe"
+    try:
+        FenwickTree.from_numpy(np.array([1.5, 2.7]))
+        assert False, "❌ Float keys should be rejected"
+    except ValueError:
+        pass
+    for bounds in ((1, 300), (None, 300)):
+        try:
+            FenwickTree.from_numpy(np.array(values), *bounds, compress=True)
+            assert False, "❌ Bounds should be rejected with compress"
+        except ValueError:
+            pass
+
+    # Keys are integers (NumPy ones too); real bounds of a range query are fine
+    for method in (tree.insert, tree.delete, tree.rank_of, compressed.insert):
+        try:
+            method(2.5)
+            assert False, f"❌ A non-integer key should be rejected by {method.__name__}"
+        except ValueError:
+            pass
+    assert tree.rank_of(np.int64(expected[0])) == 1, "❌ A NumPy integer key should be accepted"
+    assert tree.count_range(expected[0] - 0.5, expected[-1] + 0.5) == len(tree), "❌ Error on count_range with real bounds"
+
+    print("\n ✅ All Fenwick Tree Tests of OSSelect and OSRank Passed")
+
+def FrozenSnapshotTest():
+    import numpy as np
+
+    from DataStructure.FrozenSnapshot import FrozenSnapshot
+
+    values = [random.randint(1, 500) for _ in range(400)]
+    expected = sorted(values)
+    distinct = sorted(set(values))
+
+    root = None
+    bst = BinarySearchTree()
+    avl = AVLTree()
+    multiset_avl = AVLTree(multiset=True)
+    array_avl = ArrayAVLTree()
+    ordered_list = OrderedList(index_stride=8)
+    skip_list = SkipList(seed=5)
+    b_plus_tree = BPlusTree(fanout=8)
+    block_list = SortedBlockList(load=16)
+    fenwick = FenwickTree(1, 500)
+    for v in values:
+        root = bst.insert(v)
+        for structure in (avl, multiset_avl, array_avl, ordered_list, skip_list, b_plus_tree, block_list, fenwick):
+            structure.insert(v)
+
+    def key_of(x):
+        return x if not isinstance(x, Node) else x.getValue()
+
+    cases = ((bst, bst.getRoot(), expected), (avl, avl.getRoot(), distinct),
+             (multiset_avl, multiset_avl.getRoot(), expected), (array_avl, array_avl.getRoot(), distinct),
+             (ordered_list, ordered_list.getHead(), expected), (skip_list, skip_list.getHead(), expected),
+             (b_plus_tree, b_plus_tree.getRoot(), expected), (block_list, None, expected), (fenwick, None, expected))
+    for structure, start, keys in cases:
+        snapshot = structure.freeze()
+        name = type(structure).__name__
+        assert isinstance(snapshot.getKeys(), np.ndarray), f"❌ {name} snapshot should be a NumPy array"
+        assert snapshot.getKeys().tolist() == keys, f"❌ Error on {name}.freeze() order"
+
+        ks = np.random.randint(1, len(keys) + 1, size=200)
+        live = [structure.OSSelect(start, int(k)) for k in ks]
+        if structure is array_avl:
+            live = [array_avl.getValue(handle) for handle in live]
+        assert snapshot.select_many(ks).tolist() == [key_of(x) for x in live], f"❌ Error on {name} snapshot select"
+
+        queries = np.arange(0, 502)
+        ranks = [structure.rank_of(int(q)) or 0 for q in queries]
+        assert snapshot.rank_many(queries).tolist() == ranks, f"❌ Error on {name} snapshot rank"
+
+    # The snapshot does not follow later updates
+    snapshot = skip_list.freeze()
+    skip_list.insert(1000)
+    assert len(snapshot) == len(expected) and snapshot.OSRank(1000) is None, "❌ Snapshot should be immutable"
+    try:
+        snapshot.select_many([0])
+        assert False, "❌ Rank 0 should be rejected"
+    except IndexError:
+        pass
+
+    # Tuple keys stay one key per slot
+    pairs = AVLTree()
+    for pair in ((2, "b"), (1, "a"), (3, "c")):
+        pairs.insert(pair)
+    snapshot = pairs.freeze()
+    assert snapshot.select_many([3, 1]).tolist() == [(3, "c"), (1, "a")], "❌ Error on tuple snapshot select"
+    assert snapshot.rank_many([(2, "b"), (0, "z")]).tolist() == [2, 0], "❌ Error on tuple snapshot rank"
+
+    # Tuple keys of different lengths have no common NumPy shape: they stay Python objects too
+    snapshot = FrozenSnapshot([(1,), (1, 2)])
+    assert snapshot.select_many([2, 1]).tolist() == [(1, 2), (1,)], "❌ Error on ragged tuple snapshot select"
+    assert snapshot.rank_many([(1, 2), (0,)]).tolist() == [2, 0], "❌ Error on ragged tuple snapshot rank"
+    records = AVLTree(key=lambda record: record[0])
+    for record in (((2, 1), "b"), ((1,), "a"), ((1, 5, 6), "c")):
+        records.insert(record)
+    snapshot = records.freeze()
+    assert snapshot.getKeys().tolist() == [(1,), (1, 5, 6), (2, 1)] and snapshot.OSRank((1, 5, 6)) == 2, \
+        "❌ Error on the snapshot of ragged tuple keys"
+
+    print("\n ✅ All Frozen Snapshot Tests Passed")
+
+def PersistentAVLTreeTest():
+    def check_balanced(node):
+        if node is None:
+            return 0
+        left, right = check_balanced(node.getLeft()), check_balanced(node.getRight())
+        assert abs(left - right) <= 1, f"❌ Node {node.getValue()} is unbalanced"
+        assert node.getSize() == node.getCount() + PersistentAVLTree.size(node.getLeft()) + PersistentAVLTree.size(node.getRight()), \
+            f"❌ Wrong size at node {node.getValue()}"
+        return 1 + max(left, right)
+
+    for multiset in (False, True):
+        tree = PersistentAVLTree(multiset=multiset)
+        history = [[]]
+        current = []
+        for step in range(600):
+            if current and random.random() < 0.35:
+                v = random.choice(current + [1000])
+                tree.delete(v)
+                if v in current:
+                    current.remove(v)
+            else:
+                v = random.randint(1, 200)
+                tree.insert(v)
+                if multiset or v not in current:
+                    current = sorted(current + [v])
+            history.append(list(current))
+        assert tree.getVersion() == len(history) - 1, "❌ Every update should record a version"
+
+        # Every version is still queryable after all the later updates
+        for version in random.sample(range(len(history)), 60):
+            keys = history[version]
+            root = tree.getRoot(version)
+            check_balanced(root)
+            assert [v for node in tree.iter_version(version) for v in [node.getValue()] * node.getCount()] == keys, \
+                f"❌ Error on the keys of version {version}"
+            for i in range(1, len(keys) + 1):
+                assert tree.OSSelect(root, i).getValue() == keys[i - 1], f"❌ Error on OSSelect({i}) at version {version}"
+            assert tree.OSSelect(root, len(keys) + 1) is None, "❌ Error on OSSelect out of bounds"
+            for v in set(keys):
+                assert tree.OSRank(v, version) == keys.index(v) + 1, f"❌ Error on OSRank({v}) at version {version}"
+            assert tree.rank_of(1000, version) is None, "❌ Missing key should have no rank"
+
+    # An update copies only the search path: the versions share everything else
+    tree = PersistentAVLTree()
+    for v in random.sample(range(100000), 4096):
+        tree.insert(v)
+    before = {id(node) for node in tree.iter_version()}
+    tree.insert(-1)
+    fresh = [node for node in tree.iter_version() if id(node) not in before]
+    assert len(fresh) <= 2 * tree.height(tree.getRoot()) + 2, f"❌ Insert copied {len(fresh)} nodes"
+    assert tree.OSRank(-1) == 1 and len(tree) == 4097, "❌ Error on the new version"
+    assert tree.OSRank(-1, tree.getVersion() - 1) is None, "❌ The old version should not see the new key"
+
+    unchanged = tree.getRoot()
+    assert tree.delete(-2) is False and tree.getRoot() is unchanged, "❌ A missing delete should share the previous root"
+    assert tree.insert(0 if 0 in tree else -1) is unchanged, "❌ A no-op update should share the previous root"
+    assert tree.delete(-1) is True and tree.rank_of(-1) is None, "❌ Error on PersistentAVLTree delete"
+
+    try:
+        tree.getRoot(tree.getVersion() + 1)
+        assert False, "❌ A missing version should be rejected"
+    except IndexError:
+        pass
+
+    print("\n ✅ All Persistent AVL Tree Tests Passed")
+
+def ConcurrentStructureTest():
+    initial = random.sample(range(0, 20000, 2), 2000)
+    added = random.sample(range(1, 20000, 2), 1500)
+    removed = initial[:500]
+
+    factories = (AVLTree.from_iterable, lambda keys: SortedBlockList.from_sorted(sorted(keys), load=32))
+    for mode in ConcurrentStructure.MODES:
+        for factory in factories:
+            facade = ConcurrentStructure(factory(initial), mode=mode, batch_size=64)
+            errors = []
+
+            def read():
+                try:
+                    for _ in range(60):
+                        keys = facade.select_many(list(range(1, 501)))
+                        assert keys == sorted(keys), "❌ A batch of selects should see one sorted state"
+                        key = facade.OSSelect(None, random.randint(1, 1000))
+                        rank = facade.OSRank(key)
+                        assert rank is None or rank >= 1, "❌ Error on concurrent OSRank"
+                except Exception as error:
+                    errors.append(error)
+
+            def write():
+                for key in added:
+                    facade.insert(key)
+                for key in removed:
+                    facade.delete(key)
+
+            readers = [threading.Thread(target=read) for _ in range(4)]
+            writer = threading.Thread(target=write)
+            for thread in readers + [writer]:
+                thread.start()
+            for thread in readers + [writer]:
+                thread.join()
+            assert not errors, f"❌ Concurrent reads failed in {mode} mode: {errors[0]!r}"
+
+            facade.commit()
+            expected = sorted(set(initial) - set(removed) | set(added))
+            assert facade.select_many(list(range(1, len(expected) + 1))) == expected, f"❌ Error on final state in {mode} mode"
+            assert facade.rank_many([expected[10], -1]) == [11, None], f"❌ Error on rank_many in {mode} mode"
+            assert facade.OSSelect(None, len(expected) + 1) is None, "❌ Error on OSSelect out of bounds"
+
+    # Snapshot mode: queued updates are invisible until their batch is committed
+    facade = ConcurrentStructure(AVLTree.from_iterable([1, 2, 3]), mode="snapshot", batch_size=3)
+    facade.insert(10)
+    facade.insert(0)
+    assert facade.OSRank(10) is None and facade.getPendingCount() == 2, "❌ Pending updates should not be visible"
+    facade.delete(2)
+    assert facade.getPendingCount() == 0 and facade.select_many([1, 2, 3, 4]) == [0, 1, 3, 10], \
+        "❌ A full batch should be committed and published"
+
+    # Lock mode goes through the key-level API, whatever the wrapped structure returns
+    bst_facade = ConcurrentStructure(BinarySearchTree())
+    for key in (5, 3, 8):
+        bst_facade.insert(key)
+    assert bst_facade.select_many([1, 2, 3]) == [3, 5, 8], "❌ Error on BinarySearchTree facade"
+    array_facade = ConcurrentStructure(ArrayAVLTree())
+    assert array_facade.update_many([("insert", 7), ("insert", 4), ("delete", 7), ("delete", 7)]) == \
+        [True, True, True, False], "❌ Error on update_many results"
+    assert array_facade.OSSelect(None, 1) == 4 and array_facade.OSRank(7) is None, "❌ Error on ArrayAVLTree facade"
+    avl_facade = ConcurrentStructure(AVLTree.from_iterable([1, 2]))
+    assert avl_facade.delete(2) is True and avl_facade.delete(2) is False, "❌ Error on AVLTree facade delete"
+    fenwick_facade = ConcurrentStructure(FenwickTree(1, 10))
+    assert fenwick_facade.update_many([("insert", 3), ("insert", 11), ("delete", 3), ("delete", 4)]) == \
+        [True, None, True, False], "❌ A rejected update should not stop the batch"
+    assert bst_facade.update_many([("delete", 3)]) == [None], "❌ An unsupported delete should be rejected"
+    try:
+        bst_facade.delete(5)
+        assert False, "❌ Delete should be rejected when the structure has none"
+    except NotImplementedError:
+        pass
+    try:
+        ConcurrentStructure(AVLTree(), mode="optimistic")
+        assert False, "❌ An unknown mode should be rejected"
+    except ValueError:
+        pass
+
+    print("\n ✅ All Concurrent Structure Tests Passed")
+
+def ConcurrentReadersTest():
+    # Lock mode lets readers in together: the writer refreshes the lazily rebuilt state, so they only read it
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        keys = random.sample(range(0, 40000, 2), 2000)
+        for structure in (SortedBlockList.from_sorted(sorted(keys), load=4),
+                          BinarySearchTree.from_iterable(keys, size_cache=True)):
+            facade = ConcurrentStructure(structure)
+            reference = sorted(keys)
+            for _ in range(200):
+                # A write changes the cached state, then 8 readers race to use it
+                added = random.randrange(1, 400, 2)
+                facade.insert(added)
+                reference.insert(bisect_left(reference, added), added)
+                queries = random.sample(reference, 100)
+                expected = [bisect_left(reference, key) + 1 for key in queries]
+                errors = []
+                barrier = threading.Barrier(8)
+
+                def read():
+                    try:
+                        barrier.wait()
+                        ranks = [facade.OSRank(key) for key in queries]
+                        assert ranks == expected, "❌ A concurrent OSRank disagrees with the reference"
+                        assert facade.select_many([1, len(reference)]) == [reference[0], reference[-1]], \
+                            "❌ A concurrent select disagrees with the reference"
+                    except Exception as error:
+                        errors.append(error)
+
+                readers = [threading.Thread(target=read) for _ in range(8)]
+                for thread in readers:
+                    thread.start()
+                for thread in readers:
+                    thread.join()
+                assert not errors, f"❌ Concurrent readers failed on {type(structure).__name__}: {errors[0]!r}"
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    print("\n ✅ All Concurrent Readers Tests Passed")
+
+def KeyLevelAPITest():
+    # Every structure speaks keys through insert, delete, select and rank_of
+    values = random.sample(range(1, 500), 120)
+    expected = sorted(values)
+    structures = (OrderedList(), BinarySearchTree(), AVLTree(), ArrayAVLTree(), SkipList(), BPlusTree(fanout=8),
+                  SortedBlockList(load=8), FenwickTree(0, 500), PersistentAVLTree())
+    for structure in structures:
+        name = type(structure).__name__
+        for v in values:
+            structure.insert(v)
+        structure.refresh()
+        assert [structure.select(i) for i in range(1, len(expected) + 1)] == expected, f"❌ Error on {name}.select"
+        assert structure.rank_of(expected[7]) == 8 and structure.rank_of(1000) is None, f"❌ Error on {name}.rank_of"
+        for i in (0, len(expected) + 1):
+            try:
+                structure.select(i)
+                assert False, f"❌ {name}.select({i}) should be out of range"
+            except IndexError:
+                pass
+
+        try:
+            assert structure.delete(expected[0]) is True and structure.delete(expected[0]) is False, \
+                f"❌ Error on the result of {name}.delete"
+            assert structure.select(1) == expected[1], f"❌ Error on {name}.select after delete"
+        except NotImplementedError:
+            assert isinstance(structure, (OrderedList, BinarySearchTree)) and not isinstance(structure, AVLTree), \
+                f"❌ {name} should support delete"
+
+    snapshot = AVLTree.from_iterable(values).freeze()
+    assert snapshot.select(3) == expected[2] and snapshot.rank_of(expected[2]) == 3, "❌ Error on FrozenSnapshot.select"
+
+    # No lock or other unpicklable state is kept in the structures, before or after their caches fill
+    for structure in (BinarySearchTree.from_iterable(values), BinarySearchTree.from_iterable(values, size_cache=True),
+                      SortedBlockList.from_sorted(expected, load=8)):
+        name = type(structure).__name__
+        for clone in (copy.deepcopy(structure), pickle.loads(pickle.dumps(structure))):
+            assert [clone.select(i) for i in (1, 50, 120)] == [expected[0], expected[49], expected[119]], \
+                f"❌ Error on a copy of {name}"
+        structure.refresh()
+        clone = pickle.loads(pickle.dumps(copy.deepcopy(structure)))
+        clone.insert(0)
+        assert clone.select(1) == 0 and structure.select(1) == expected[0], f"❌ A copy of {name} should be independent"
+
+    print("\n ✅ All Key Level API Tests Passed")
+
 OrderedListTestOSSelectOSSRank()
 BSTTestOSSelectOSSRank()
-AVLTreeTestOSSelectOSSRank()
\ No newline at end of file
+AVLTreeTestOSSelectOSSRank()
+AVLTreeTestDeleteOSSelectOSSRank()
+ArrayAVLTreeTestOSSelectOSSRank()
+TestOSSelectMany()
+TestOSRankMany()
+SkipListTestOSSelectOSSRank()
+OrderedListCursorTest()
+OrderedListRankStampsTest()
+MultisetTest()
+GenericKeyTest()
+RankOfFindContainsTest()
+RangeQueriesTest()
+InOrderGeneratorsTest()
+BPlusTreeTestOSSelectOSSRank()
+SortedBlockListTestOSSelectOSSRank()
+FenwickTreeTestOSSelectOSSRank()
+FrozenSnapshotTest()
+PersistentAVLTreeTest()
+ConcurrentStructureTest()
+ConcurrentReadersTest()
+KeyLevelAPITest()
\ No newline at end of file
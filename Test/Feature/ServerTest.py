@@ -0,0 +1,106 @@
+import asyncio
+
+from DataStructure.AVLTree import AVLTree
+from DataStructure.FenwickTree import FenwickTree
+from DataStructure.SortedBlockList import SortedBlockList
+from Server.LatencyStats import LatencyStats
+from Server.LoadGenerator import LoadGenerator
+from Server.OrderStatisticServer import OrderStatisticServer
+from Server.Protocol import Protocol
+
+
+def ProtocolTest():
+    requests = [(Protocol.SELECT, 1, 5), (Protocol.RANK, 2, -7), (Protocol.INSERT, 4294967295, 2 ** 62)]
+    stream = b"".join(Protocol.encode_request(*request) for request in requests)
+    assert len(stream) == 3 * Protocol.REQUEST.size == 39, "❌ Requests should be 13 bytes"
+
+    frames, rest = Protocol.split(stream[:30], Protocol.REQUEST)
+    assert frames == requests[:2] and rest == stream[26:30], "❌ Error on a partial frame"
+    frames, rest = Protocol.split(rest + stream[30:], Protocol.REQUEST)
+    assert frames == requests[2:] and rest == b"", "❌ Error on the completed frame"
+
+    response = Protocol.encode_response(9, Protocol.NOT_FOUND)
+    assert Protocol.split(response, Protocol.RESPONSE) == ([(9, Protocol.NOT_FOUND, 0)], b""), "❌ Error on response"
+
+    print("\n ✅ All Protocol Tests Passed")
+
+
+def LatencyStatsTest():
+    stats = LatencyStats(capacity=100)
+    assert stats.percentile(50) == 0.0, "❌ No sample should report 0"
+    for ms in range(1, 201):
+        stats.record(ms / 1000)
+    assert len(stats) == 100, "❌ Only the last samples should be kept"
+    assert stats.percentile(50) == 0.150 and stats.percentile(99) == 0.199, "❌ Error on percentiles"
+    assert stats.percentile(100) == 0.200 and stats.percentile(0) == 0.101, "❌ Error on extreme percentiles"
+
+    print("\n ✅ All Latency Stats Tests Passed")
+
+
+def OrderStatisticServerTest():
+    async def scenario():
+        server = OrderStatisticServer(SortedBlockList.from_sorted(range(10, 110, 10), load=4))
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        # Pipelined in one write: the server answers them in one flush, in arrival order
+        requests = [(Protocol.SELECT, 1, 3), (Protocol.RANK, 2, 50), (Protocol.INSERT, 3, 5),
+                    (Protocol.SELECT, 4, 1), (Protocol.RANK, 5, 50), (Protocol.DELETE, 6, 100),
+                    (Protocol.SELECT, 7, 11), (Protocol.RANK, 8, 55), (Protocol.SELECT, 9, 0), (9, 10, 0)]
+        writer.write(b"".join(Protocol.encode_request(*request) for request in requests))
+        await writer.drain()
+
+        responses, buffer = {}, b""
+        while len(responses) < len(requests):
+            frames, buffer = Protocol.split(buffer + await reader.read(4096), Protocol.RESPONSE)
+            responses.update({request_id: (status, value) for request_id, status, value in frames})
+        writer.close()
+
+        assert responses == {1: (Protocol.OK, 30), 2: (Protocol.OK, 5), 3: (Protocol.OK, 0),
+                             4: (Protocol.OK, 5), 5: (Protocol.OK, 6), 6: (Protocol.OK, 0),
+                             7: (Protocol.NOT_FOUND, 0), 8: (Protocol.NOT_FOUND, 0),
+                             9: (Protocol.NOT_FOUND, 0), 10: (Protocol.ERROR, 0)}, f"❌ Wrong responses {responses}"
+        assert server.getBatchCount() == 1, "❌ Requests of one tick should be coalesced in one flush"
+
+        # Load generator on the same machine: many connections, many requests per flush
+        generator = LoadGenerator(key_space=200, seed=3)
+        await generator.run(port=port, connections=4, requests=500, pipeline=16)
+        assert len(generator.getLatency()) == 2000 and sum(generator.getStatuses().values()) == 2000, \
+            "❌ Every request should be answered"
+        assert Protocol.ERROR not in generator.getStatuses(), "❌ The load should not produce errors"
+        assert server.getRequestCount() == 2010 and server.getBatchCount() < 2010 / 4, \
+            "❌ Concurrent requests should be coalesced"
+        assert server.getLatency().percentile(50) <= server.getLatency().percentile(99), "❌ Error on latency report"
+
+        listener.close()
+        await listener.wait_closed()
+
+        # One run of writes, one status per write
+        server = OrderStatisticServer(FenwickTree(1, 100))
+        listener = await server.start(port=0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", listener.sockets[0].getsockname()[1])
+        requests = [(Protocol.INSERT, 1, 5), (Protocol.INSERT, 2, 500), (Protocol.DELETE, 3, 7),
+                    (Protocol.DELETE, 4, 5), (Protocol.INSERT, 5, 9)]
+        writer.write(b"".join(Protocol.encode_request(*request) for request in requests))
+        responses, buffer = {}, b""
+        while len(responses) < len(requests):
+            frames, buffer = Protocol.split(buffer + await reader.read(4096), Protocol.RESPONSE)
+            responses.update({request_id: status for request_id, status, _ in frames})
+        writer.close()
+        assert responses == {1: Protocol.OK, 2: Protocol.ERROR, 3: Protocol.NOT_FOUND, 4: Protocol.OK, 5: Protocol.OK}, \
+            f"❌ Wrong write statuses {responses}"
+        assert list(server.getIndex().getStructure()) == [9], "❌ A rejected write should not stop the others"
+        listener.close()
+        await listener.wait_closed()
+
+    asyncio.run(scenario())
+
+    # Any structure can be served through the facade
+    assert OrderStatisticServer(AVLTree()).getIndex().getStructure().getRoot() is None, "❌ Error on server structure"
+
+    print("\n ✅ All Order Statistic Server Tests Passed")
+
+ProtocolTest()
+LatencyStatsTest()
+OrderStatisticServerTest()
\ No newline at end of file
@@ -0,0 +1,24 @@
+from Server.LoadGenerator import LoadGenerator
+from Server.Protocol import Protocol
+import argparse
+import asyncio
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate load on a running order statistic server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Connect to this Unix socket path instead of TCP")
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=20000, help="Requests sent on each connection")
+    parser.add_argument("--pipeline", type=int, default=32, help="Requests in flight on each connection")
+    parser.add_argument("--key-space", type=int, default=200000, help="Keys are drawn from [1, key-space]")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    generator = LoadGenerator(args.key_space, seed=args.seed)
+    throughput = asyncio.run(generator.run(args.host, args.port, args.unix,
+                                           args.connections, args.requests, args.pipeline))
+    names = {Protocol.OK: "ok", Protocol.NOT_FOUND: "not found", Protocol.ERROR: "error"}
+    statuses = ", ".join(f"{names[status]} {count:,}" for status, count in sorted(generator.getStatuses().items()))
+    print(f"Client: {throughput:,.0f} requests/s, {generator.getLatency().summary()} ({statuses})")
@@ -1,12 +1,22 @@
 from DataStructure.AVLTree import AVLTree
+from DataStructure.BPlusTree import BPlusTree
 from DataStructure.BinarySearchTree import BinarySearchTree
+from DataStructure.ConcurrentStructure import ConcurrentStructure
+from DataStructure.FenwickTree import FenwickTree
+from DataStructure.Node.AVLNode import AVLNode
 from DataStructure.Node.ListNode import ListNode
+from DataStructure.Node.SkipListNode import SkipListNode
 from DataStructure.Node.TreeNode import TreeNode
 from DataStructure.OrderedList import OrderedList
+from DataStructure.PersistentAVLTree import PersistentAVLTree
+from DataStructure.SkipList import SkipList
+from DataStructure.SortedBlockList import SortedBlockList
 from Plot.PlotManager import PlotManager
+import copy
 import random
 import time
 import sys
+import threading
 from pympler import asizeof
 
 
@@ -40,12 +50,161 @@ def get_list_memory_usage(head: ListNode):
 
     return total_size
 
+def get_skip_list_memory_usage(head: SkipListNode):
+    """
+        Calculate the total memory usage of a skip list.
+
+        Like get_list_memory_usage, it walks level 0 instead of letting asizeof recurse
+        through the forward pointers; each node is measured together with its own
+        forward and span arrays.
+
+        Parameters:
+            head (SkipListNode): The header of the skip list.
+
+        Returns:
+            int: The total memory usage in bytes of the header and all nodes.
+    """
+    total_size = 0
+    current = head
+    while current is not None:
+        total_size += asizeof.asizeof(current, limit=1)
+        current = current.getNext()
+
+    return total_size
+
+def run_index_stride_benchmark(values_number: int, strides: list):
+    """
+        Measure the memory / lookup time trade-off of the OrderedList express lane index.
+
+        For every stride an OrderedList is filled with the same random values, then every rank is
+        selected once from the head. The index memory is reported by getIndexMemoryUsage.
+
+        Parameters:
+            values_number (int): Number of values to insert.
+            strides (list): Sampling strides to compare (None disables the index).
+
+        Returns:
+            dict: stride label -> {"insert": seconds, "select": seconds, "memory": bytes}
+    """
+    values = random.sample(range(1, values_number + 1), values_number)
+    queries = random.sample(range(1, values_number + 1), values_number)
+    results = {}
+
+    for stride in strides:
+        ordered_list = OrderedList(index_stride=stride)
+
+        start = time.perf_counter()
+        for value in values:
+            ordered_list.insert(value)
+        insert_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for k in queries:
+            ordered_list.OSSelect(ordered_list.getHead(), k)
+        select_time = time.perf_counter() - start
+
+        memory = ordered_list.getIndexMemoryUsage()
+        label = "none" if stride is None else str(stride)
+        results[label] = {"insert": insert_time, "select": select_time, "memory": memory}
+        print(f"OrderedList index stride {label}: insert {insert_time:.4f}s, "
+              f"OSSelect {select_time:.4f}s, index {memory:,} bytes")
+
+    return results
+
+def run_persistence_benchmark(values_number: int, versions: int):
+    """
+        Compare keeping `versions` queryable versions of an AVL tree by deep copy and by path copying.
+
+        Both trees start from the same values; after every insert the mutable AVLTree is deep-copied,
+        while the PersistentAVLTree records a version sharing the unchanged subtrees.
+
+        Parameters:
+            values_number (int): Number of values in the initial tree.
+            versions (int): Number of updates, each producing a version to keep.
+    """
+    values = random.sample(range(1, 2 * values_number + 1), values_number)
+    updates = random.sample(range(2 * values_number + 1, 4 * values_number + 1), versions)
+
+    avl_tree = AVLTree.from_iterable(values)
+    persistent_tree = PersistentAVLTree()
+    for value in values:
+        persistent_tree.insert(value)
+    first_version = persistent_tree.getVersion()
+
+    start = time.perf_counter()
+    copies = []
+    for value in updates:
+        avl_tree.insert(value)
+        copies.append(copy.deepcopy(avl_tree))
+    copy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for value in updates:
+        persistent_tree.insert(value)
+    persistent_time = time.perf_counter() - start
+
+    copy_memory = asizeof.asizeof(copies)
+    persistent_memory = asizeof.asizeof([persistent_tree.getRoot(v) for v in range(first_version, persistent_tree.getVersion() + 1)])
+    print(f"AVLTree deep copies: {versions} versions in {copy_time:.4f}s, {copy_memory:,} bytes")
+    print(f"PersistentAVLTree: {versions} versions in {persistent_time:.4f}s, {persistent_memory:,} bytes")
+
+def run_concurrency_benchmark(values_number: int, readers: int, duration: float):
+    """
+        Measure the throughput of the ConcurrentStructure modes around an AVLTree: `readers` threads
+        run OSSelect / OSRank queries while one ingest thread inserts new keys, for `duration` seconds.
+
+        Parameters:
+            values_number (int): Number of values in the initial tree.
+            readers (int): Number of query threads.
+            duration (float): Length of each run, in seconds.
+
+        Returns:
+            dict: mode -> {"reads": operations per second, "writes": operations per second}
+    """
+    values = random.sample(range(1, 2 * values_number + 1), values_number)
+    results = {}
+
+    for mode in ConcurrentStructure.MODES:
+        facade = ConcurrentStructure(AVLTree.from_iterable(values), mode=mode, batch_size=1024)
+        stop = threading.Event()
+        reads = [0] * readers
+        writes = [0]
+
+        def read(slot: int):
+            while not stop.is_set():
+                key = facade.OSSelect(None, random.randint(1, values_number))
+                facade.OSRank(key)
+                reads[slot] += 2
+
+        def write():
+            key = 2 * values_number
+            while not stop.is_set():
+                key += 1
+                facade.insert(key)
+                writes[0] += 1
+
+        threads = [threading.Thread(target=read, args=(slot,)) for slot in range(readers)]
+        threads.append(threading.Thread(target=write))
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        results[mode] = {"reads": sum(reads) / duration, "writes": writes[0] / duration}
+        print(f"ConcurrentStructure {mode}: {results[mode]['reads']:,.0f} reads/s, "
+              f"{results[mode]['writes']:,.0f} writes/s with {readers} readers and 1 writer")
+
+    return results
+
 if __name__ == '__main__':
     TRIALS_PER_N = 0
     N_VALUES = [10, 20, 40, 80, 160, 320, 640, 1280, 2560, 5120, 10240, 20480]
 
     osselect_results = {}
     osrank_results = {}
+    build_results = {}
 
     for VALUES_NUMBER in N_VALUES:
         print(f"\n--- Running tests for n = {VALUES_NUMBER} ---")
@@ -54,23 +213,76 @@ if __name__ == '__main__':
         values = random.sample(range(1, VALUES_NUMBER + 1), VALUES_NUMBER)
         ordered_list = OrderedList()
         binary_tree = BinarySearchTree()
-        avl_tree = AVLTree()
+        skip_list = SkipList(seed=VALUES_NUMBER)
+        bplus_tree = BPlusTree(fanout=64)
+        sorted_blocks = SortedBlockList()
+        # The values come from the bounded universe [1, n]
+        fenwick_tree = FenwickTree(1, VALUES_NUMBER)
 
         listNodes = []
         treeNodes = []
         avlNodes = []
 
-        bstNode = None
-        root_avl = None
+        # Build: every structure inserts the same values one key at a time
+        times_build = {}
 
+        start = time.perf_counter()
         for value in values:
             ordered_list.insert(value)
-            bstNode = binary_tree.insert(binary_tree.getRoot(), value)
-            listNodes.append(ListNode(value))
-            treeNodes.append(bstNode)
-            root_avl = avl_tree.insert(value, root_avl)
+        times_build["OrderedList"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for value in values:
+            treeNodes.append(binary_tree.insert(value))
+        times_build["BinarySearchTree"] = time.perf_counter() - start
+
+        avl_tree = AVLTree()
+        start = time.perf_counter()
+        for value in values:
+            avl_tree.insert(value)
+        times_build["AVLTree"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for value in values:
+            skip_list.insert(value)
+        times_build["SkipList"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for value in values:
+            bplus_tree.insert(value)
+        times_build["BPlusTree"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for value in values:
+            sorted_blocks.insert(value)
+        times_build["SortedBlockList"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for value in values:
+            fenwick_tree.insert(value)
+        times_build["FenwickTree"] = time.perf_counter() - start
+
+        for name, elapsed in times_build.items():
+            print(f"{name} Time build of {VALUES_NUMBER} values: {elapsed:.6f} seconds")
+
+        # Bulk load (sort, then balanced build in O(n)): reported apart, it is not a per-key build
+        start = time.perf_counter()
+        AVLTree.from_iterable(values)
+        print(f"AVLTree Time bulk load (from_iterable) of {VALUES_NUMBER} values: {time.perf_counter() - start:.6f} seconds")
+
+        # OSRank matches nodes by identity: rank the list's own nodes
+        current = ordered_list.getHead()
+        while current is not None:
+            listNodes.append(current)
+            current = current.getNext()
+        random.shuffle(listNodes)
 
         avlNodes = avl_tree.tree_to_list_inorder(avl_tree.getRoot())
+        skipNodes = []
+        current = skip_list.getHead().getNext()
+        while current is not None:
+            skipNodes.append(current)
+            current = current.getNext()
 
         # Select only half of total
         TRIALS_PER_N = VALUES_NUMBER
@@ -81,15 +293,39 @@ if __name__ == '__main__':
             memory_usage_ordered_list = get_list_memory_usage(ordered_list.getHead())
             memory_usage_binary_tree = asizeof.asizeof(binary_tree)
             memory_usage_avl_tree = asizeof.asizeof(avl_tree)
+            memory_usage_skip_list = get_skip_list_memory_usage(skip_list.getHead())
+            memory_usage_bplus_tree = asizeof.asizeof(bplus_tree)
+            memory_usage_sorted_blocks = asizeof.asizeof(sorted_blocks)
+            memory_usage_fenwick_tree = asizeof.asizeof(fenwick_tree)
             print(f"Memory used by OrderedList: {memory_usage_ordered_list:,} bytes")
             print(f"Memory used by BinarySearchTree: {memory_usage_binary_tree:,} bytes")
             print(f"Memory used by AVLTree: {memory_usage_avl_tree:,} bytes")
+            print(f"Memory used by SkipList: {memory_usage_skip_list:,} bytes")
+            print(f"Memory used by BPlusTree: {memory_usage_bplus_tree:,} bytes")
+            print(f"Memory used by SortedBlockList: {memory_usage_sorted_blocks:,} bytes")
+            print(f"Memory used by FenwickTree: {memory_usage_fenwick_tree:,} bytes")
+            print(f"Bytes per node: OrderedList {memory_usage_ordered_list / VALUES_NUMBER:.1f}, "
+                  f"BinarySearchTree {memory_usage_binary_tree / VALUES_NUMBER:.1f}, "
+                  f"AVLTree {memory_usage_avl_tree / VALUES_NUMBER:.1f}, "
+                  f"SkipList {memory_usage_skip_list / VALUES_NUMBER:.1f}, "
+                  f"BPlusTree {memory_usage_bplus_tree / VALUES_NUMBER:.1f}, "
+                  f"SortedBlockList {memory_usage_sorted_blocks / VALUES_NUMBER:.1f}, "
+                  f"FenwickTree {memory_usage_fenwick_tree / VALUES_NUMBER:.1f}")
+            # Count and payload slots used to be on every node; they are now only on the variants that need them
+            print("Bytes per node, plain (after) / with count and payload slots (before): " + ", ".join(
+                f"{node_class.__name__} {sys.getsizeof(node_class(0))} / "
+                f"{sys.getsizeof(node_class.variant(counted=True, keyed=True)(0))}"
+                for node_class in (ListNode, TreeNode, AVLNode)))
 
             PlotManager.saveMemoryUsagePlot({
                 "OrderedList": memory_usage_ordered_list,
                 "BinarySearchTree": memory_usage_binary_tree,
-                "AVLTree": memory_usage_avl_tree
-            })
+                "AVLTree": memory_usage_avl_tree,
+                "SkipList": memory_usage_skip_list,
+                "BPlusTree": memory_usage_bplus_tree,
+                "SortedBlockList": memory_usage_sorted_blocks,
+                "FenwickTree": memory_usage_fenwick_tree
+            }, VALUES_NUMBER)
 
         # OSSelect & OSRank
         times_osselect = {}
@@ -122,6 +358,17 @@ if __name__ == '__main__':
         times_osrank["BinarySearchTree"] = time.perf_counter() - start
         print(f"BinarySearchTree Time OSRank of {len(treeNodes)} values: {times_osrank["BinarySearchTree"]:.6f} seconds")
 
+        # BinarySearchTree with the size cache, next to the plain one above (not plotted)
+        cached_binary_tree = BinarySearchTree(size_cache=True)
+        for value in values:
+            cached_binary_tree.insert(value)
+        start = time.perf_counter()
+        for k in select_queries:
+            cached_binary_tree.OSSelect(cached_binary_tree.getRoot(), k)
+        elapsed = time.perf_counter() - start
+        print(f"BinarySearchTree (size cache) Time OSSelect of {len(select_queries)} values: {elapsed:.6f} seconds, "
+              f"{cached_binary_tree.getCacheHits():,} hits, {cached_binary_tree.getCacheMisses():,} misses")
+
         # AVLTree
         start = time.perf_counter()
         for k in select_queries:
@@ -136,11 +383,118 @@ if __name__ == '__main__':
         times_osrank["AVLTree"] = time.perf_counter() - start
         print(f"AVLTree Time OSRank of {len(treeNodes)} values: {times_osrank["AVLTree"]:.6f} seconds")
 
+        # SkipList
+        start = time.perf_counter()
+        for k in select_queries:
+            skip_list.OSSelect(skip_list.getHead(), k)
+        times_osselect["SkipList"] = time.perf_counter() - start
+        print(f"SkipList Time OSSelect of {len(select_queries)} values: {times_osselect["SkipList"]:.6f} seconds")
+
+        start = time.perf_counter()
+        for x in skipNodes:
+            skip_list.OSRank(x)
+        times_osrank["SkipList"] = time.perf_counter() - start
+        print(f"SkipList Time OSRank of {len(skipNodes)} values: {times_osrank["SkipList"]:.6f} seconds")
+
+        # BPlusTree: OSSelect returns keys and OSRank takes keys, no node handles
+        start = time.perf_counter()
+        for k in select_queries:
+            bplus_tree.OSSelect(bplus_tree.getRoot(), k)
+        times_osselect["BPlusTree"] = time.perf_counter() - start
+        print(f"BPlusTree Time OSSelect of {len(select_queries)} values: {times_osselect["BPlusTree"]:.6f} seconds")
+
+        start = time.perf_counter()
+        for value in values:
+            bplus_tree.OSRank(value)
+        times_osrank["BPlusTree"] = time.perf_counter() - start
+        print(f"BPlusTree Time OSRank of {len(values)} values: {times_osrank["BPlusTree"]:.6f} seconds")
+
+        # SortedBlockList: keys in bounded sorted blocks, found by bisect
+        start = time.perf_counter()
+        for k in select_queries:
+            sorted_blocks.OSSelect(None, k)
+        times_osselect["SortedBlockList"] = time.perf_counter() - start
+        print(f"SortedBlockList Time OSSelect of {len(select_queries)} values: {times_osselect["SortedBlockList"]:.6f} seconds")
+
+        start = time.perf_counter()
+        for value in values:
+            sorted_blocks.OSRank(value)
+        times_osrank["SortedBlockList"] = time.perf_counter() - start
+        print(f"SortedBlockList Time OSRank of {len(values)} values: {times_osrank["SortedBlockList"]:.6f} seconds")
+
+        # FenwickTree: counts over the key universe, select by binary lifting
+        start = time.perf_counter()
+        for k in select_queries:
+            fenwick_tree.OSSelect(None, k)
+        times_osselect["FenwickTree"] = time.perf_counter() - start
+        print(f"FenwickTree Time OSSelect of {len(select_queries)} values: {times_osselect["FenwickTree"]:.6f} seconds")
+
+        start = time.perf_counter()
+        for value in values:
+            fenwick_tree.OSRank(value)
+        times_osrank["FenwickTree"] = time.perf_counter() - start
+        print(f"FenwickTree Time OSRank of {len(values)} values: {times_osrank["FenwickTree"]:.6f} seconds")
+
+        # Batched OSSelect: all queries answered in one descent / walk
+        for name, structure in (("OrderedList", ordered_list), ("BinarySearchTree", binary_tree), ("AVLTree", avl_tree)):
+            start = time.perf_counter()
+            structure.OSSelect_many(select_queries)
+            print(f"{name} Time OSSelect_many of {len(select_queries)} values: {time.perf_counter() - start:.6f} seconds")
+
+        # Batched OSRank: all nodes ranked in one sweep / with shared ancestors
+        for name, structure, nodes in (("OrderedList", ordered_list, listNodes),
+                                       ("BinarySearchTree", binary_tree, treeNodes),
+                                       ("AVLTree", avl_tree, avlNodes)):
+            start = time.perf_counter()
+            structure.OSRank_many(nodes)
+            print(f"{name} Time OSRank_many of {len(nodes)} values: {time.perf_counter() - start:.6f} seconds")
+
+        # Value-based OSRank: rank by key, no node handles kept
+        for name, structure in (("OrderedList", ordered_list), ("BinarySearchTree", binary_tree),
+                                ("AVLTree", avl_tree), ("SkipList", skip_list), ("BPlusTree", bplus_tree),
+                                ("SortedBlockList", sorted_blocks), ("FenwickTree", fenwick_tree)):
+            start = time.perf_counter()
+            for value in values:
+                structure.rank_of(value)
+            print(f"{name} Time rank_of of {len(values)} values: {time.perf_counter() - start:.6f} seconds")
+
+        # Frozen NumPy snapshot: the whole query batch in one vectorized call
+        start = time.perf_counter()
+        snapshot = avl_tree.freeze()
+        print(f"AVLTree Time freeze of {len(snapshot)} values: {time.perf_counter() - start:.6f} seconds")
+        start = time.perf_counter()
+        snapshot.select_many(select_queries)
+        print(f"FrozenSnapshot Time select_many of {len(select_queries)} values: {time.perf_counter() - start:.6f} seconds")
+        start = time.perf_counter()
+        snapshot.rank_many(values)
+        print(f"FrozenSnapshot Time rank_many of {len(values)} values: {time.perf_counter() - start:.6f} seconds")
 
         osselect_results[VALUES_NUMBER] = times_osselect
         osrank_results[VALUES_NUMBER] = times_osrank
+        build_results[VALUES_NUMBER] = times_build
 
     PlotManager.saveOSSelectTimePlot(osselect_results[max(N_VALUES)], TRIALS_PER_N)
     PlotManager.saveOSRankTimePlot(osrank_results[max(N_VALUES)], TRIALS_PER_N)
     PlotManager.saveOSOperationComplexityPlot(osselect_results, "OSSelect")
     PlotManager.saveOSOperationComplexityPlot(osrank_results, "OSRank")
+    PlotManager.saveOSOperationComplexityPlot(build_results, "Build")
+
+    # Textbook vs production structures: operations per second at the largest n
+    largest = max(N_VALUES)
+    PlotManager.saveThroughputPlot({
+        name: {
+            "Build": largest / build_results[largest][name],
+            "OSSelect": TRIALS_PER_N / osselect_results[largest][name],
+            "OSRank": largest / osrank_results[largest][name]
+        }
+        for name in osselect_results[largest]
+    }, largest)
+
+    print("\n--- OrderedList express lane index ---")
+    PlotManager.saveIndexStrideTradeOffPlot(run_index_stride_benchmark(10240, [None, 4, 16, 64, 256, "sqrt"]))
+
+    print("\n--- Versioned AVL tree: deep copies vs path copying ---")
+    run_persistence_benchmark(4096, 32)
+
+    print("\n--- Concurrent readers and writer: readers-writer lock vs published snapshots ---")
+    run_concurrency_benchmark(20480, 4, 2.0)
@@ -0,0 +1,49 @@
+from DataStructure.AVLTree import AVLTree
+from DataStructure.BPlusTree import BPlusTree
+from DataStructure.SkipList import SkipList
+from DataStructure.SortedBlockList import SortedBlockList
+from Server.OrderStatisticServer import OrderStatisticServer
+import argparse
+import asyncio
+import random
+
+
+def build_structure(name: str, values: list[int]):
+    """
+        Build the structure to serve, loaded with `values`.
+
+        Parameters:
+            name (str): "avl", "bplus", "blocks" or "skiplist".
+            values (list[int]): The initial keys.
+
+        Returns:
+            OrderStatisticStructure: The loaded structure.
+    """
+    values = sorted(values)
+    if name == "avl":
+        return AVLTree.from_sorted(values)
+    if name == "bplus":
+        return BPlusTree.from_sorted(values)
+    if name == "blocks":
+        return SortedBlockList.from_sorted(values)
+    skip_list = SkipList()
+    for value in values:
+        skip_list.insert(value)
+    return skip_list
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Serve an order statistic structure over a localhost socket.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument("--structure", choices=["avl", "bplus", "blocks", "skiplist"], default="blocks")
+    parser.add_argument("--values", type=int, default=100000, help="Number of random keys loaded at start")
+    parser.add_argument("--report", type=float, default=5.0, help="Seconds between latency reports")
+    args = parser.parse_args()
+
+    initial = random.sample(range(1, 2 * args.values + 1), args.values)
+    server = OrderStatisticServer(build_structure(args.structure, initial))
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix, args.report))
+    except KeyboardInterrupt:
+        pass